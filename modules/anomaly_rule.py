@@ -0,0 +1,211 @@
+import logging
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+anomaly_logger = logging.getLogger("AnomalyRule")
+
+
+class AnomalyRule:
+    """AnomalyRule class
+        컬럼 하나에 대한 이상치 규칙
+        values 에 포함되거나, [min, max] 범위를 벗어나면 규칙에 해당
+
+    Attributes:
+        name (str): 규칙 이름 (리포트용)
+        column (str): 규칙을 적용할 컬럼
+        values (list): sentinel 값 목록
+        min (float): 허용 최소값 (포함)
+        max (float): 허용 최대값 (포함)
+        to (float): replace 규칙에서 대체할 값
+    """
+
+    def __init__(
+        self,
+        column: str,
+        values: List = None,
+        min: float = None,
+        max: float = None,
+        to: float = None,
+        name: str = None,
+    ) -> None:
+        if values is None and min is None and max is None:
+            raise ValueError(f"anomaly rule for '{column}' has no values or range")
+        self.column = column
+        self.values = values
+        self.min = min
+        self.max = max
+        self.to = to
+        self.name = name if name is not None else self._default_name()
+
+    def _default_name(self) -> str:
+        conditions = []
+        if self.values is not None:
+            conditions.append("in " + str(self.values))
+        if self.min is not None:
+            conditions.append("< " + str(self.min))
+        if self.max is not None:
+            conditions.append("> " + str(self.max))
+        return f"{self.column} " + " or ".join(conditions)
+
+    def match(self, array: np.ndarray) -> np.ndarray:
+        """규칙에 해당하는 행의 boolean mask
+
+        Args:
+            array (np.ndarray): 컬럼 값
+
+        Returns:
+            np.ndarray: 규칙에 해당하면 True
+        """
+        mask = np.zeros(len(array), dtype=bool)
+        if self.values is not None:
+            # sentinel 값은 컬럼 dtype 으로 맞춰 비교 (float32 컬럼의 9.9 등)
+            values = np.asarray(self.values)
+            if array.dtype.kind == "f":
+                values = values.astype(array.dtype)
+            mask |= np.isin(array, values)
+        if self.min is not None:
+            mask |= array < self.min
+        if self.max is not None:
+            mask |= array > self.max
+        return mask
+
+
+class AnomalyRuleEngine:
+    """AnomalyRuleEngine class
+        config 의 drop/replace 규칙을 컬럼 구성에 맞춰 한 번 컴파일하고
+        drop 규칙은 하나의 mask 로, replace 규칙은 컬럼별 한 번의 대체로 적용
+
+    Attributes:
+        _drop_rules (List[AnomalyRule]): 해당 행을 삭제하는 규칙
+        _replace_rules (List[AnomalyRule]): 해당 값을 to 로 대체하는 규칙
+        _removed_counts (Dict[str, int]): 규칙별 삭제된 행 수 (누적)
+    """
+
+    def __init__(
+        self, drop_rules: List[AnomalyRule], replace_rules: List[AnomalyRule]
+    ) -> None:
+        for rule in replace_rules:
+            if rule.to is None:
+                raise ValueError(f"replace rule '{rule.name}' has no 'to' value")
+        self._drop_rules = drop_rules
+        self._replace_rules = replace_rules
+        self._compiled_columns = None
+        self._active_drop_rules = []
+        self._active_replace_rules = {}
+        self._removed_counts = {rule.name: 0 for rule in drop_rules}
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "AnomalyRuleEngine":
+        """config 의 anomaly_rule section 으로 엔진 생성
+
+        Args:
+            config (Dict): 전체 config
+
+        Returns:
+            AnomalyRuleEngine: 규칙 엔진
+        """
+        section = config.get("anomaly_rule", {})
+        if not section:
+            anomaly_logger.warning("anomaly_rule section is empty, no rule applied")
+        drop_rules = [AnomalyRule(**rule) for rule in section.get("drop", [])]
+        replace_rules = [AnomalyRule(**rule) for rule in section.get("replace", [])]
+        return cls(drop_rules, replace_rules)
+
+    @property
+    def removed_counts(self) -> Dict[str, int]:
+        return dict(self._removed_counts)
+
+    def reset_counts(self) -> None:
+        self._removed_counts = {rule.name: 0 for rule in self._drop_rules}
+
+    def compile(self, columns: List[str]) -> None:
+        """데이터의 컬럼 구성에 맞춰 적용할 규칙을 선택
+            컬럼 구성이 같으면 다시 컴파일하지 않음
+
+        Args:
+            columns (List[str]): 데이터 컬럼 목록
+
+        Returns:
+            None
+        """
+        columns = tuple(columns)
+        if columns == self._compiled_columns:
+            return
+        column_set = set(columns)
+        self._active_drop_rules = [
+            rule for rule in self._drop_rules if rule.column in column_set
+        ]
+        self._active_replace_rules = {}
+        for rule in self._replace_rules:
+            if rule.column in column_set:
+                self._active_replace_rules.setdefault(rule.column, []).append(rule)
+        skipped = [
+            rule.name
+            for rule in self._drop_rules + self._replace_rules
+            if rule.column not in column_set
+        ]
+        if skipped:
+            anomaly_logger.debug("skipped rules (column not found): " + str(skipped))
+        self._compiled_columns = columns
+
+    def drop_mask(self, data: pd.DataFrame) -> np.ndarray:
+        """drop 규칙을 하나의 mask 로 계산하고 규칙별 삭제 행 수를 누적
+            여러 규칙에 해당하는 행은 먼저 정의된 규칙의 삭제 수로 집계
+
+        Args:
+            data (pd.DataFrame): 검사할 데이터
+
+        Returns:
+            np.ndarray: 삭제할 행이면 True
+        """
+        self.compile(data.columns)
+        mask = np.zeros(len(data), dtype=bool)
+        for rule in self._active_drop_rules:
+            rule_mask = rule.match(data[rule.column].to_numpy())
+            self._removed_counts[rule.name] += int(
+                np.count_nonzero(rule_mask & ~mask)
+            )
+            mask |= rule_mask
+        return mask
+
+    def replace(self, data: pd.DataFrame) -> pd.DataFrame:
+        """replace 규칙을 컬럼별로 한 번씩 적용
+
+        Args:
+            data (pd.DataFrame): 대체할 데이터 (in-place)
+
+        Returns:
+            pd.DataFrame: 대체된 데이터
+        """
+        self.compile(data.columns)
+        for column, rules in self._active_replace_rules.items():
+            array = data[column].to_numpy()
+            replaced = array
+            for rule in rules:
+                replaced = np.where(rule.match(array), rule.to, replaced)
+            data[column] = replaced.astype(array.dtype, copy=False)
+        return data
+
+    def apply(self, data: pd.DataFrame) -> pd.DataFrame:
+        """drop 규칙에 해당하는 행을 한 번에 삭제하고 replace 규칙 적용
+
+        Args:
+            data (pd.DataFrame): 처리할 데이터
+
+        Returns:
+            pd.DataFrame: 처리된 데이터 (index 유지)
+        """
+        mask = self.drop_mask(data)
+        if mask.any():
+            data = data.take(np.flatnonzero(~mask))
+        return self.replace(data)
+
+    def report(self) -> List[Tuple[str, int]]:
+        """규칙별 삭제 행 수 목록
+
+        Returns:
+            List[Tuple[str, int]]: (규칙 이름, 삭제 행 수)
+        """
+        return list(self._removed_counts.items())
@@ -0,0 +1,280 @@
+import gc
+import json
+import logging
+import os
+import platform
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from importlib.metadata import version
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules.config import Config
+from modules.preprocess import Preprocess
+from modules.synthetic import SYNTHETIC_VERSION, write_screening_csv
+from modules.utils.file_handler import chk_and_make_dir
+from modules.utils.functions import string_to_boolean
+from modules.utils.stage_metrics import get_rss_sampler
+
+benchmark_logger = logging.getLogger("Benchmark")
+
+STAGES = ["load_data", "preprocess", "_split_data", "_fit", "evaluate_model", "predict"]
+
+# baseline 과 비교할 측정값
+COMPARED_KEYS = ["wall_s", "rss_delta_mb"]
+
+
+def measure(func: Callable[[], Any], use_tracemalloc: bool = False) -> Tuple[Any, Dict]:
+    """함수를 실행하며 실행 시간, CPU 시간, 단계 중 RSS 증가량, (선택) tracemalloc peak 측정
+
+    Args:
+        func (Callable[[], Any]): 측정할 함수
+        use_tracemalloc (bool): python 메모리 할당 peak 측정 여부 (느려짐)
+
+    Returns:
+        Tuple[Any, Dict]: 함수 반환값, 측정값
+    """
+    gc.collect()
+    if use_tracemalloc:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    rss_token = get_rss_sampler().start()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    result = func()
+    wall_s = time.perf_counter() - wall_start
+    cpu_s = time.process_time() - cpu_start
+    rss_start_mb, rss_delta_mb = get_rss_sampler().stop(rss_token)
+    stats = {
+        "wall_s": wall_s,
+        "cpu_s": cpu_s,
+        "rss_start_mb": rss_start_mb,
+        "rss_delta_mb": rss_delta_mb,
+    }
+    if use_tracemalloc:
+        stats["tracemalloc_peak_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+        tracemalloc.stop()
+    return result, stats
+
+
+def _run_size(args: Tuple) -> Dict:
+    """한 데이터 크기에 대해 단계별 측정 (크기마다 새 프로세스에서 실행해 peak RSS 를 분리)
+
+    Args:
+        args (Tuple): (config_path, csv_path, use_tracemalloc, use_cache)
+
+    Returns:
+        Dict: 단계별 측정값과 데이터 건수
+    """
+    # xgboost 는 측정용 프로세스에서만 불러옴
+    from modules.model import Model
+
+    config_path, csv_path, use_tracemalloc, use_cache = args
+    try:
+        Config.instance(config_path)
+    except TypeError:
+        # fork 로 생성된 경우 부모의 Config 가 이미 초기화되어 있음
+        pass
+    # 이 프로세스에서만 frame cache 사용 여부를 benchmark 설정으로 바꿈
+    Config.instance().config.setdefault("cache", {})["use_cache"] = str(use_cache)
+
+    stages = {}
+    preprocess = Preprocess()
+    _, stages["load_data"] = measure(lambda: preprocess.load_data(csv_path), use_tracemalloc)
+    _, stages["preprocess"] = measure(preprocess.preprocess, use_tracemalloc)
+
+    data = preprocess.preprocessed_data
+    model = Model(data)
+    _, stages["_split_data"] = measure(model._split_data, use_tracemalloc)
+    model._build_model()
+    _, stages["_fit"] = measure(model._fit, use_tracemalloc)
+    eval_metric, stages["evaluate_model"] = measure(model.evaluate_model, use_tracemalloc)
+    _, stages["predict"] = measure(lambda: model.predict(data), use_tracemalloc)
+    return {
+        "preprocessed_rows": len(data),
+        "eval": {key: float(value) for key, value in eval_metric.items()},
+        "stages": stages,
+    }
+
+
+def run_benchmark(
+    sizes: List[int],
+    config_path: str = os.path.join("config", "config.ini"),
+    use_tracemalloc: bool = None,
+) -> Dict:
+    """합성 데이터 크기별로 load_data ~ predict 단계의 시간과 메모리 측정
+
+    Args:
+        sizes (List[int]): 데이터 행 수 목록
+        config_path (str): worker 에서 불러올 config 경로
+        use_tracemalloc (bool): tracemalloc 측정 여부, None 이면 config 의 benchmark.tracemalloc
+
+    Returns:
+        Dict: 실행 환경, 크기별 결과
+    """
+    config = Config.instance().config
+    bench_config = config["benchmark"]
+    if use_tracemalloc is None:
+        use_tracemalloc = string_to_boolean(str(bench_config.get("tracemalloc", "false")))
+    use_cache = string_to_boolean(str(bench_config.get("use_cache", "false")))
+    seed = bench_config.get("seed", 42)
+    data_dir = os.path.join(config["path"]["cache"], "benchmark")
+    chk_and_make_dir(data_dir)
+
+    results = {}
+    for n_rows in sizes:
+        csv_path = os.path.join(
+            data_dir, f"synthetic_v{SYNTHETIC_VERSION}_{n_rows}_{seed}.csv"
+        )
+        benchmark_logger.info(f"generating {n_rows} rows -> {csv_path}")
+        write_screening_csv(csv_path, n_rows, seed)
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = executor.submit(
+                _run_size, (config_path, csv_path, use_tracemalloc, use_cache)
+            ).result()
+        results[str(n_rows)] = result
+        for stage, stats in result["stages"].items():
+            benchmark_logger.info(
+                f"{n_rows} rows {stage:15s} wall {stats['wall_s']:.3f}s "
+                f"cpu {stats['cpu_s']:.3f}s rss +{stats['rss_delta_mb'] or 0:.1f} MB"
+            )
+
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "xgboost": version("xgboost"),
+        },
+        "seed": seed,
+        "synthetic_version": SYNTHETIC_VERSION,
+        "results": results,
+    }
+
+
+def compare_with_baseline(
+    current: Dict,
+    baseline: Dict,
+    threshold: float,
+    min_seconds: float = 0.05,
+    min_mb: float = 5.0,
+) -> List[str]:
+    """baseline 대비 threshold 비율 이상 느려지거나 메모리를 더 쓴 단계 목록
+        실행 시간 차이가 min_seconds, RSS 증가량 차이가 min_mb 보다 작으면 측정 오차로 보고 무시
+
+    Args:
+        current (Dict): run_benchmark 결과
+        baseline (Dict): 저장된 baseline
+        threshold (float): 허용 증가 비율 (0.2 이면 20%)
+        min_seconds (float): 무시할 실행 시간 차이
+        min_mb (float): 무시할 RSS 증가량 차이 (MB)
+
+    Returns:
+        List[str]: 성능 저하 설명, 없으면 빈 목록
+    """
+    regressions = []
+    for size, result in current["results"].items():
+        baseline_result = baseline.get("results", {}).get(size)
+        if baseline_result is None:
+            continue
+        for stage, stats in result["stages"].items():
+            baseline_stats = baseline_result["stages"].get(stage, {})
+            for key in COMPARED_KEYS:
+                value, reference = stats.get(key), baseline_stats.get(key)
+                if value is None or not reference:
+                    continue
+                if value <= reference * (1 + threshold):
+                    continue
+                if key == "wall_s" and value - reference < min_seconds:
+                    continue
+                if key == "rss_delta_mb" and value - reference < min_mb:
+                    continue
+                regressions.append(
+                    f"{size} rows {stage} {key}: {reference:.3f} -> {value:.3f} "
+                    f"(+{value / reference - 1:.0%})"
+                )
+    return regressions
+
+
+def save_json(result: Dict, path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        chk_and_make_dir(directory)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+def load_json(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_and_compare(
+    sizes: List[int] = None,
+    output_path: str = None,
+    baseline_path: str = None,
+    update_baseline: bool = False,
+    threshold: float = None,
+    use_tracemalloc: bool = None,
+    config_path: str = os.path.join("config", "config.ini"),
+) -> int:
+    """benchmark 실행 후 결과 저장, baseline 과 비교
+
+    Args:
+        sizes (List[int]): 데이터 행 수 목록, None 이면 config 의 benchmark.sizes
+        output_path (str): 결과 json 경로, None 이면 <output>/benchmark/<실행 시각>.json
+        baseline_path (str): baseline json 경로, None 이면 config 의 benchmark.baseline_path
+        update_baseline (bool): 결과를 baseline 으로 저장
+        threshold (float): 허용 증가 비율, None 이면 config 의 benchmark.threshold
+        use_tracemalloc (bool): tracemalloc 측정 여부
+        config_path (str): worker 에서 불러올 config 경로
+
+    Returns:
+        int: 종료 코드 (성능 저하가 있으면 1)
+    """
+    config = Config.instance().config
+    bench_config = config["benchmark"]
+    result = run_benchmark(
+        sizes or bench_config["sizes"],
+        config_path=config_path,
+        use_tracemalloc=use_tracemalloc,
+    )
+    output_path = output_path or os.path.join(
+        config["path"]["output"],
+        "benchmark",
+        datetime.now().strftime("%Y%m%d_%H%M%S") + ".json",
+    )
+    save_json(result, output_path)
+    benchmark_logger.info(f"benchmark result: {output_path}")
+
+    baseline_path = baseline_path or bench_config["baseline_path"]
+    if update_baseline:
+        save_json(result, baseline_path)
+        benchmark_logger.info(f"baseline updated: {baseline_path}")
+        return 0
+    if not os.path.exists(baseline_path):
+        benchmark_logger.warning(f"baseline not found: {baseline_path}")
+        return 0
+
+    threshold = threshold if threshold is not None else bench_config["threshold"]
+    regressions = compare_with_baseline(
+        result,
+        load_json(baseline_path),
+        threshold,
+        bench_config.get("min_seconds", 0.05),
+        bench_config.get("min_mb", 5.0),
+    )
+    for regression in regressions:
+        benchmark_logger.error("regression: " + regression)
+    if regressions:
+        return 1
+    benchmark_logger.info(f"no regression over {threshold:.0%} against {baseline_path}")
+    return 0
@@ -0,0 +1,338 @@
+import argparse
+import atexit
+import importlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+from modules.config import Config
+from modules.utils.default_logger_config import DefaultLogger
+from modules.utils.file_handler import chk_and_make_dir
+
+cli_logger = logging.getLogger("cli")
+
+# 명령별로 실행 전에 불러오는 모듈
+# mlflow, sklearn, xgboost 는 각 모듈 안에서 필요한 경로에서만 import
+COMMAND_IMPORTS = {
+    "train": ["modules.training"],
+    "evaluate": ["modules.evaluation"],
+    "score": ["modules.scoring"],
+    "bench": ["modules.benchmark"],
+    "serve": ["modules.model", "modules.serving"],
+    "search": ["modules.hyperparameter_search", "modules.das_mlflow"],
+    "update": ["modules.model", "modules.das_mlflow"],
+}
+
+# 새 프로세스에서 import 시간 측정 (cli 자체의 import 포함)
+_MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from modules.cli import import_command
+import_command(sys.argv[1])
+heavy = [m for m in ("mlflow", "sklearn", "xgboost", "matplotlib") if m in sys.modules]
+print(json.dumps({"seconds": time.perf_counter() - start, "heavy": heavy}))
+"""
+
+
+def import_command(command: str) -> float:
+    """명령에 필요한 모듈 import
+
+    Args:
+        command (str): 명령 이름
+
+    Returns:
+        float: import 에 걸린 시간 (초)
+    """
+    start = time.perf_counter()
+    for module in COMMAND_IMPORTS[command]:
+        importlib.import_module(module)
+    return time.perf_counter() - start
+
+
+def import_budget(command: str) -> float:
+    """config 의 import_budget section 에 있는 명령별 import 시간 목표 (초), 없으면 None"""
+    return Config.instance().config.get("import_budget", {}).get(command)
+
+
+def measure_import_times(commands: List[str] = None, repeat: int = 3) -> Dict[str, Dict]:
+    """명령별 import 시간을 새 python 프로세스에서 측정 (이미 불러온 모듈의 영향 없음)
+
+    Args:
+        commands (List[str]): 측정할 명령, None 이면 전체
+        repeat (int): 측정 횟수 (가장 짧은 시간 사용)
+
+    Returns:
+        Dict[str, Dict]: 명령 -> 시간, 목표, 불러온 무거운 패키지
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [root, env.get("PYTHONPATH")]))
+
+    result = {}
+    for command in commands or list(COMMAND_IMPORTS):
+        samples = []
+        for _ in range(repeat):
+            output = subprocess.run(
+                [sys.executable, "-c", _MEASURE_SCRIPT, command],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=env,
+            )
+            samples.append(json.loads(output.stdout.strip().splitlines()[-1]))
+        seconds = min(sample["seconds"] for sample in samples)
+        result[command] = {
+            "seconds": seconds,
+            "budget": import_budget(command),
+            "heavy": samples[0]["heavy"],
+        }
+    return result
+
+
+def check_import_budget(times: Dict[str, Dict]) -> List[str]:
+    """import 시간 목표를 넘은 명령 목록"""
+    return [
+        f"{command}: {stats['seconds']:.3f}s > {stats['budget']:.3f}s "
+        f"(loaded {', '.join(stats['heavy']) or 'no heavy packages'})"
+        for command, stats in times.items()
+        if stats["budget"] is not None and stats["seconds"] > stats["budget"]
+    ]
+
+
+def _train(args: argparse.Namespace, config: Dict, config_path: str) -> int:
+    from modules.training import run_training
+
+    cli_logger.info(config)
+    state = run_training(config, args.input)
+    cli_logger.info(f"result: {state['result']}")
+    return 0
+
+
+def _evaluate(args: argparse.Namespace, config: Dict, config_path: str) -> int:
+    from modules.evaluation import evaluate_csv
+
+    eval_metric = evaluate_csv(args.input, args.model_dt)
+    cli_logger.info(f"result: {eval_metric}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(eval_metric, f, ensure_ascii=False, indent=2, default=float)
+    return 0
+
+
+def _score(args: argparse.Namespace, config: Dict, config_path: str) -> int:
+    from modules.scoring import score_csv
+
+    score_config = config["score"]
+    chunk_size = args.chunk_size or score_config["chunk_size"]
+    workers = args.workers if args.workers is not None else score_config["workers"]
+    cli_logger.info(f"scoring {args.input} (chunk_size={chunk_size}, workers={workers})")
+    score_csv(
+        args.input,
+        args.output,
+        model_dt=args.model_dt,
+        chunk_size=chunk_size,
+        workers=workers,
+        config_path=config_path,
+        engine=args.engine or score_config.get("engine", "auto"),
+    )
+    return 0
+
+
+def _bench(args: argparse.Namespace, config: Dict, config_path: str) -> int:
+    if args.imports:
+        # 명령별 import 시간만 측정하고 목표를 넘으면 실패
+        times = measure_import_times()
+        for command, stats in times.items():
+            cli_logger.info(
+                f"import {command:8s} {stats['seconds']:.3f}s "
+                f"(budget {stats['budget']}, heavy {stats['heavy']})"
+            )
+        regressions = check_import_budget(times)
+        for regression in regressions:
+            cli_logger.error("import budget exceeded: " + regression)
+        return 1 if regressions else 0
+
+    from modules.benchmark import run_and_compare
+
+    return run_and_compare(
+        args.sizes,
+        output_path=args.output,
+        baseline_path=args.baseline,
+        update_baseline=args.update_baseline,
+        threshold=args.threshold,
+        use_tracemalloc=args.tracemalloc,
+        config_path=config_path,
+    )
+
+
+def _serve(args: argparse.Namespace, config: Dict, config_path: str) -> int:
+    import asyncio
+
+    from modules.model import Model
+    from modules.serving import InferenceServer
+
+    serving_config = dict(config["serving"])
+    if args.host is not None:
+        serving_config["host"] = args.host
+    if args.port is not None:
+        serving_config["port"] = args.port
+
+    # 모델은 한 번만 불러옴
+    model = Model(None)
+    model.load_model(args.model_dt)
+    if model.metadata is None:
+        cli_logger.error("model not found")
+        return 1
+    cli_logger.info(
+        f"loaded model: {model.metadata['model_dt']} (threshold {model.threshold})"
+    )
+
+    server = InferenceServer(model, model.metadata, serving_config)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        cli_logger.info("server stopped")
+    return 0
+
+
+def _search(args: argparse.Namespace, config: Dict, config_path: str) -> int:
+    from modules.das_mlflow import DasMlflow
+    from modules.hyperparameter_search import HyperParameterSearch
+    from modules.model import Model
+    from modules.preprocess import Preprocess
+
+    model = Model(Preprocess().run(args.input))
+    model.split_data()
+
+    search_result = HyperParameterSearch(model, config).run()
+
+    mlflow = DasMlflow(config["mlflow"]["experiment_name"], model)
+    mlflow.log_search(search_result)
+
+    # 결과는 config.ini 의 [hyper_parameter] 형식으로 출력
+    cli_logger.info(
+        "best hyper_parameter: "
+        + json.dumps(search_result["best_params"], ensure_ascii=False)
+    )
+    return 0
+
+
+def _update(args: argparse.Namespace, config: Dict, config_path: str) -> int:
+    from modules.das_mlflow import DasMlflow
+    from modules.model import Model
+    from modules.preprocess import Preprocess
+
+    model = Model(Preprocess().run(args.input))
+    eval_metric = model.update(args.model_dt)
+    model_path = model.save_model()
+    cli_logger.info(f"updated model saved: {model_path}")
+
+    mlflow = DasMlflow(config["mlflow"]["experiment_name"], model)
+    mlflow.run(eval_metric)
+    cli_logger.info(f"result: {eval_metric}")
+    return 0
+
+
+COMMANDS = {
+    "train": _train,
+    "evaluate": _evaluate,
+    "score": _score,
+    "bench": _bench,
+    "serve": _serve,
+    "search": _search,
+    "update": _update,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="proteinuria classification")
+    parser.add_argument(
+        "--config", default=os.path.join("config", "config.ini"), help="config 경로"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    train = subparsers.add_parser("train", help="학습, 평가, 모델 저장, mlflow 기록")
+    train.add_argument("--input", default=None, help="학습 데이터 CSV (기본: <data>/data.csv)")
+
+    evaluate = subparsers.add_parser("evaluate", help="저장된 모델을 라벨이 있는 CSV 로 평가")
+    evaluate.add_argument("input", help="라벨이 있는 검진 데이터 CSV 경로")
+    evaluate.add_argument("--model-dt", default=None, help="모델 실행 시각 (기본: 가장 최근 모델)")
+    evaluate.add_argument("--output", default=None, help="평가 결과 json 경로")
+
+    score = subparsers.add_parser("score", help="CSV 배치 예측")
+    score.add_argument("input", help="예측할 CSV 경로")
+    score.add_argument("output", help="결과를 저장할 CSV 경로")
+    score.add_argument("--model-dt", default=None, help="모델 실행 시각 (기본: 가장 최근 모델)")
+    score.add_argument("--chunk-size", type=int, default=None)
+    score.add_argument("--workers", type=int, default=None)
+    score.add_argument(
+        "--engine",
+        choices=["auto", "numpy", "xgboost"],
+        default=None,
+        help="예측 엔진 (auto: trees.npz 가 있으면 numpy)",
+    )
+
+    bench = subparsers.add_parser("bench", help="단계별 성능 측정, baseline 비교")
+    bench.add_argument("--sizes", type=int, nargs="+", default=None, help="데이터 행 수 목록")
+    bench.add_argument("--output", default=None, help="결과 json 경로")
+    bench.add_argument("--baseline", default=None, help="비교할 baseline json 경로")
+    bench.add_argument("--update-baseline", action="store_true", help="결과를 baseline 으로 저장")
+    bench.add_argument("--threshold", type=float, default=None, help="허용 증가 비율")
+    bench.add_argument("--tracemalloc", action="store_true", default=None)
+    bench.add_argument(
+        "--imports", action="store_true", help="명령별 import 시간만 측정해 목표와 비교"
+    )
+
+    serve = subparsers.add_parser("serve", help="micro-batching 예측 서버")
+    serve.add_argument("--model-dt", default=None, help="모델 실행 시각 (기본: 가장 최근 모델)")
+    serve.add_argument("--host", default=None)
+    serve.add_argument("--port", type=int, default=None)
+
+    search = subparsers.add_parser("search", help="hyper parameter 탐색 (successive halving)")
+    search.add_argument("--input", default=None, help="학습 데이터 CSV (기본: <data>/data.csv)")
+
+    update = subparsers.add_parser("update", help="새 데이터로 기존 모델 이어서 학습")
+    update.add_argument("input", help="새로 들어온 검진 데이터 CSV 경로")
+    update.add_argument(
+        "--model-dt", default=None, help="이어서 학습할 모델 실행 시각 (기본: 가장 최근 모델)"
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    """명령 실행
+        명령에 필요한 모듈만 불러오고 import 시간을 목표와 비교해 기록
+
+    Args:
+        argv (List[str]): 명령행 인자, None 이면 sys.argv
+
+    Returns:
+        int: 종료 코드
+    """
+    args = build_parser().parse_args(argv)
+
+    # config 설정
+    config = Config.instance(args.config).config
+
+    # logger 세팅
+    default_logger = DefaultLogger.from_config(config["log"])
+    default_logger.setDefaultLogger(args.command, config["log"]["path"])
+    atexit.register(default_logger.shutdown)
+
+    # output 디렉토리 세팅
+    for path in config["path"]:
+        chk_and_make_dir(config["path"][path])
+
+    elapsed = import_command(args.command)
+    budget = import_budget(args.command)
+    message = f"{args.command} imports: {elapsed:.3f}s (budget {budget}s)"
+    if budget is not None and elapsed > budget:
+        cli_logger.warning(message)
+    else:
+        cli_logger.info(message)
+
+    return COMMANDS[args.command](args, config, args.config)
@@ -19,7 +19,7 @@ class Config(Singletone):
 
     def __init__(self, config_file_path: str) -> None:
         self.__configparser = configparser.ConfigParser()
-        self.__configparser.read(config_file_path)
+        self.__configparser.read(config_file_path, encoding="utf-8")
         self.__config = dict()
         self._str_to_list()
 
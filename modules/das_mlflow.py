@@ -1,37 +1,322 @@
+import atexit
+import logging
+import math
 import os
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List
 
-import mlflow
-from mlflow.tracking import MlflowClient
-
-from modules.model import Model
+from modules.config import Config
+from modules.utils.decorator import RunningTimeDecorator
+from modules.utils.stage_metrics import get_registry
 
 MLFLOW_URI = os.getenv("DAS_MLFLOW_URI")
 
+if TYPE_CHECKING:
+    from mlflow.tracking import MlflowClient
+
+    from modules.model import Model
+
+mlflow_logger = logging.getLogger("DasMlflow")
+
+# log_batch 한 번에 보낼 수 있는 최대 개수
+MAX_BATCH_PARAMS = 100
+MAX_BATCH_METRICS = 1000
+
+_STOP = object()
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def tracking_uri(fallback_path: str = "mlruns") -> str:
+    """DAS_MLFLOW_URI 가 없으면 로컬 file store 사용"""
+    if MLFLOW_URI:
+        return MLFLOW_URI
+    # mlflow 최신 버전은 file store 사용 시 명시적 허용이 필요
+    os.environ.setdefault("MLFLOW_ALLOW_FILE_STORE", "true")
+    return "file:" + os.path.abspath(fallback_path)
+
+
+class AsyncTracker:
+    """AsyncTracker class
+        mlflow 기록 요청을 queue 에 넣고 background thread 에서 처리
+        연속된 param, metric 요청은 run 별로 모아 log_batch 한 번으로 전송
+        tracking 서버가 느리거나 없어도 학습 흐름은 기다리지 않음
+
+    Attributes:
+        _uri (str): tracking uri
+        _queue (queue.Queue): 기록 요청 (종류, run key, 내용)
+        _run_ids (Dict[str, str]): run key -> mlflow run id
+        _experiment_ids (Dict[str, str]): 실험 이름 -> experiment id
+    """
+
+    def __init__(self, uri: str) -> None:
+        self._uri = uri
+        self._queue = queue.Queue()
+        self._run_ids = {}
+        self._experiment_ids = {}
+        self._client = None
+        self._thread = threading.Thread(
+            target=self._worker, name="DasMlflowTracker", daemon=True
+        )
+        self._thread.start()
+
+    def start_run(
+        self, run_key: str, experiment_name: str, run_name: str = None, parent_key: str = None
+    ) -> None:
+        self._queue.put(("start", run_key, (experiment_name, run_name, parent_key)))
+
+    def log_params(self, run_key: str, params: Dict) -> None:
+        self._queue.put(("params", run_key, dict(params)))
+
+    def log_metrics(self, run_key: str, metrics: Dict, step: int = 0) -> None:
+        self._queue.put(("metrics", run_key, (dict(metrics), step, _now_ms())))
+
+    def log_metric_history(self, run_key: str, key: str, values: List[float]) -> None:
+        """round 별 지표를 step 순서대로 기록"""
+        timestamp = _now_ms()
+        self._queue.put(
+            ("history", run_key, (key, [float(v) for v in values], timestamp))
+        )
+
+    def log_artifacts(self, run_key: str, local_dir: str) -> None:
+        self._queue.put(("artifacts", run_key, local_dir))
+
+    def end_run(self, run_key: str, status: str = "FINISHED") -> None:
+        self._queue.put(("end", run_key, status))
+
+    def flush(self, timeout: float = None) -> bool:
+        """queue 가 빌 때까지 대기
+
+        Args:
+            timeout (float): 최대 대기 시간 (초), None 이면 끝까지 대기
+
+        Returns:
+            bool: 시간 안에 모두 처리했는지 여부
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    mlflow_logger.warning(
+                        f"mlflow flush timed out: {self._queue.unfinished_tasks} requests dropped"
+                    )
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def close(self, timeout: float = None) -> bool:
+        done = self.flush(timeout)
+        self._queue.put((_STOP, None, None))
+        return done
+
+    def _worker(self) -> None:
+        while True:
+            requests = [self._queue.get()]
+            # 이미 쌓인 요청을 한 번에 꺼내 묶어서 처리
+            while True:
+                try:
+                    requests.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(kind is _STOP for kind, _, _ in requests)
+            try:
+                self._process([r for r in requests if r[0] is not _STOP])
+            except Exception as e:
+                mlflow_logger.warning(f"mlflow logging failed: {e}")
+            finally:
+                for _ in requests:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _get_client(self) -> "MlflowClient":
+        if self._client is None:
+            # mlflow 는 import 가 느리므로 background thread 에서 처음 기록할 때 불러옴
+            from mlflow.tracking import MlflowClient
+
+            self._client = MlflowClient(tracking_uri=self._uri)
+        return self._client
+
+    def _experiment_id(self, experiment_name: str) -> str:
+        if experiment_name not in self._experiment_ids:
+            client = self._get_client()
+            experiment = client.get_experiment_by_name(experiment_name)
+            if experiment is None:
+                experiment_id = client.create_experiment(experiment_name)
+            else:
+                experiment_id = experiment.experiment_id
+            self._experiment_ids[experiment_name] = experiment_id
+        return self._experiment_ids[experiment_name]
+
+    @RunningTimeDecorator(logger=mlflow_logger, show_log=False)
+    def _process(self, requests: List) -> None:
+        from mlflow.entities import Metric, Param
+
+        pending = {}
+
+        def send(run_key: str) -> None:
+            params, metrics = pending.pop(run_key, ({}, []))
+            run_id = self._run_ids.get(run_key)
+            if run_id is None:
+                return
+            params = [Param(key, str(value)) for key, value in params.items()]
+            n_batches = max(
+                math.ceil(len(params) / MAX_BATCH_PARAMS),
+                math.ceil(len(metrics) / MAX_BATCH_METRICS),
+            )
+            for i in range(n_batches):
+                self._get_client().log_batch(
+                    run_id,
+                    metrics=metrics[i * MAX_BATCH_METRICS : (i + 1) * MAX_BATCH_METRICS],
+                    params=params[i * MAX_BATCH_PARAMS : (i + 1) * MAX_BATCH_PARAMS],
+                )
+
+        for kind, run_key, payload in requests:
+            try:
+                if kind == "start":
+                    experiment_name, run_name, parent_key = payload
+                    tags = {}
+                    if parent_key in self._run_ids:
+                        tags["mlflow.parentRunId"] = self._run_ids[parent_key]
+                    run = self._get_client().create_run(
+                        self._experiment_id(experiment_name), tags=tags, run_name=run_name
+                    )
+                    self._run_ids[run_key] = run.info.run_id
+                elif kind == "params":
+                    pending.setdefault(run_key, ({}, []))[0].update(payload)
+                elif kind == "metrics":
+                    metrics, step, timestamp = payload
+                    pending.setdefault(run_key, ({}, []))[1].extend(
+                        Metric(key, float(value), timestamp, step)
+                        for key, value in metrics.items()
+                    )
+                elif kind == "history":
+                    key, values, timestamp = payload
+                    pending.setdefault(run_key, ({}, []))[1].extend(
+                        Metric(key, value, timestamp, step)
+                        for step, value in enumerate(values)
+                    )
+                elif kind == "artifacts":
+                    send(run_key)
+                    if run_key in self._run_ids:
+                        self._get_client().log_artifacts(self._run_ids[run_key], payload)
+                elif kind == "end":
+                    send(run_key)
+                    if run_key in self._run_ids:
+                        self._get_client().set_terminated(
+                            self._run_ids.pop(run_key), status=payload
+                        )
+            except Exception as e:
+                # 기록 실패는 학습 흐름에 영향을 주지 않고 경고만 남김
+                mlflow_logger.warning(f"mlflow {kind} failed ({run_key}): {e}")
+
+        for run_key in list(pending):
+            try:
+                send(run_key)
+            except Exception as e:
+                mlflow_logger.warning(f"mlflow log_batch failed ({run_key}): {e}")
+
+
+_tracker = None
+_tracker_lock = threading.Lock()
+
+
+def get_tracker(uri: str, flush_timeout: float = 30.0) -> AsyncTracker:
+    """프로세스 공용 AsyncTracker 반환 (처음 호출 시 생성, 종료 시 flush_timeout 동안 flush)"""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            _tracker = AsyncTracker(uri)
+            atexit.register(_tracker.close, flush_timeout)
+        return _tracker
+
 
 class DasMlflow:
     """DasMlflow class
         모델의 정보와 결과를 각 실험 별로 이름을 지정해 저장
+        기록은 background thread 에서 처리하므로 호출은 tracking 서버를 기다리지 않음
 
     Attributes:
         self._model (type): mlflow를 통해 파라미터, 결과 등을 기록할 모델
+        self._tracker (AsyncTracker): 기록 요청을 처리하는 background tracker
 
     """
 
-    def __init__(self, exp_name: str, model: Model) -> None:
+    def __init__(self, exp_name: str, model: "Model") -> None:
         self._model = model
-        mlflow.set_tracking_uri(MLFLOW_URI)
-
-        client = MlflowClient()
-        current_experiment = mlflow.get_experiment_by_name(exp_name)
-        if current_experiment is None:
-            self._experiment_id = client.create_experiment(exp_name)
-        else:
-            self._experiment_id = dict(current_experiment)["experiment_id"]
-
-    def run(self):
-        with mlflow.start_run(experiment_id=self._experiment_id) as run:
-            mlflow.log_params(self._model.h_param)
+        self._exp_name = exp_name
+        mlflow_config = Config.instance().config.get("mlflow", {})
+        self._tracker = get_tracker(
+            tracking_uri(mlflow_config.get("fallback_path", "mlruns")),
+            mlflow_config.get("flush_timeout", 30.0),
+        )
+        self._n_runs = 0
+
+    def _run_key(self, name: str) -> str:
+        self._n_runs += 1
+        return f"{id(self)}_{self._n_runs}_{name}"
+
+    @RunningTimeDecorator(logger=mlflow_logger)
+    def run(self, eval: Dict = None):
+        """파라미터와 평가 결과 기록
+            eval 이 주어지면 다시 학습하지 않고 해당 결과를 기록
+
+        Args:
+            eval (Dict): 이미 계산된 평가 결과
+
+        Returns:
+            Dict: 평가 결과
+        """
+        run_key = self._run_key("run")
+        self._tracker.start_run(run_key, self._exp_name)
+        self._tracker.log_params(run_key, self._model.h_param)
+        if eval is None:
             eval = self._model.fit_and_evaluate()
-            mlflow.log_metrics(eval)
-        mlflow.end_run()
+        self._tracker.log_metrics(run_key, eval)
+        # 지금까지 측정한 단계별 실행 시간, 메모리
+        self._tracker.log_metrics(run_key, get_registry().mlflow_metrics())
+
+        # early stopping 시 round 별 train/valid 지표
+        for name, metrics in (self._model.evals_result or {}).items():
+            for metric, values in metrics.items():
+                self._tracker.log_metric_history(run_key, f"{name} {metric}", values)
+        # test 데이터의 threshold 별 곡선 (step = threshold 격자 위치)
+        for name, values in (self._model.evaluation_curves or {}).items():
+            self._tracker.log_metric_history(run_key, f"curve {name}", values)
+        if self._model.model_path is not None and os.path.isdir(self._model.model_path):
+            self._tracker.log_artifacts(run_key, self._model.model_path)
+        self._tracker.end_run(run_key)
         return eval
+
+    @RunningTimeDecorator(logger=mlflow_logger)
+    def log_search(self, search_result: Dict) -> None:
+        """hyper parameter 탐색 결과 기록
+            각 trial 은 부모 run 아래의 child run 으로 기록
+
+        Args:
+            search_result (Dict): HyperParameterSearch.run 의 반환값
+        """
+        parent_key = self._run_key("hyper_parameter_search")
+        self._tracker.start_run(parent_key, self._exp_name, "hyper_parameter_search")
+        for trial in search_result["trials"]:
+            run_key = self._run_key(trial["key"])
+            self._tracker.start_run(
+                run_key,
+                self._exp_name,
+                f"trial_rung{trial['rung']}_{trial['key'][:8]}",
+                parent_key,
+            )
+            self._tracker.log_params(run_key, trial["params"])
+            self._tracker.log_metrics(run_key, trial["metrics"])
+            self._tracker.end_run(run_key)
+        self._tracker.log_params(parent_key, search_result["best_params"])
+        self._tracker.log_metrics(parent_key, search_result["best_metrics"])
+        self._tracker.end_run(parent_key)
+
+    def flush(self, timeout: float = None) -> bool:
+        return self._tracker.flush(timeout)
@@ -0,0 +1,59 @@
+from typing import List, Tuple
+
+import numpy as np
+import xgboost as xgb
+
+
+class BoosterEnsemble:
+    """BoosterEnsemble class
+        balanced bagging 으로 학습한 모델들을 하나의 예측기로 묶음
+        각 모델의 양성 확률을 한 번에 모아 평균
+
+    Attributes:
+        boosters (List[xgb.Booster]): bag 별 모델
+        best_iterations (List[int]): bag 별 best iteration (early stopping 하지 않았으면 None)
+    """
+
+    def __init__(
+        self, boosters: List[xgb.Booster], best_iterations: List[int] = None
+    ) -> None:
+        self.boosters = list(boosters)
+        if best_iterations is None:
+            best_iterations = [None] * len(self.boosters)
+        self.best_iterations = list(best_iterations)
+
+    def __len__(self) -> int:
+        return len(self.boosters)
+
+    def _iteration_range(self, bag: int) -> Tuple[int, int]:
+        best_iteration = self.best_iterations[bag]
+        if best_iteration is None:
+            return (0, 0)
+        return (0, best_iteration + 1)
+
+    def set_param(self, params: dict) -> None:
+        for booster in self.boosters:
+            booster.set_param(params)
+
+    def copy(self) -> "BoosterEnsemble":
+        """bag 별 모델을 복사한 ensemble"""
+        return BoosterEnsemble(
+            [booster.copy() for booster in self.boosters], self.best_iterations
+        )
+
+    def inplace_predict(self, data: np.ndarray, **kwargs) -> np.ndarray:
+        """bag 별 양성 확률의 평균 (iteration_range 는 bag 별 best iteration 을 사용)
+
+        Args:
+            data (np.ndarray): 2차원 float32 배열
+
+        Returns:
+            np.ndarray: 평균 양성 확률 (float32)
+        """
+        kwargs.pop("iteration_range", None)
+        proba = np.empty((len(self.boosters), len(data)), dtype=np.float32)
+        for bag, booster in enumerate(self.boosters):
+            proba[bag] = booster.inplace_predict(
+                data, iteration_range=self._iteration_range(bag), **kwargs
+            )
+        return proba.mean(axis=0, dtype=np.float32)
@@ -0,0 +1,40 @@
+import logging
+from typing import Dict
+
+from modules.model import Model
+from modules.preprocess import TARGET_COLUMN, Preprocess
+from modules.utils.decorator import RunningTimeDecorator
+from modules.utils.metrics import RankedScores, binary_metrics
+
+evaluation_logger = logging.getLogger("Evaluation")
+
+
+@RunningTimeDecorator(logger=evaluation_logger)
+def evaluate_csv(input_path: str, model_dt: str = None) -> Dict:
+    """저장된 모델을 다시 학습하지 않고 라벨이 있는 CSV 로 평가
+
+    Args:
+        input_path (str): 라벨이 있는 검진 데이터 CSV 경로
+        model_dt (str): 모델 실행 시각, None 이면 가장 최근 모델
+
+    Returns:
+        Dict: 평가 결과
+    """
+    data = Preprocess().run(input_path)
+    model = Model(None)
+    model.load_model(model_dt)
+    proba, label = model.predict_batch(data)
+    actual = data[TARGET_COLUMN].to_numpy()
+    metrics = binary_metrics(actual, label)
+    auc = RankedScores(actual, proba).auc()
+    return {
+        "Rows": len(actual),
+        "Positive rate": float(actual.mean()),
+        "Threshold": model.threshold,
+        "Accuracy": metrics["accuracy"],
+        "F1 score": metrics["f1"],
+        "Sensitivity": metrics["sensitivity"],
+        "Specificity": metrics["specificity"],
+        "ROC AUC": auc["roc_auc"],
+        "PR AUC": auc["pr_auc"],
+    }
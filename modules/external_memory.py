@@ -0,0 +1,298 @@
+import logging
+import os
+from typing import Dict, Iterator
+
+import numpy as np
+import pandas as pd
+import xgboost as xgb
+
+from modules.preprocess import FEATURE_COLUMNS, TARGET_COLUMN, Preprocess
+from modules.utils.file_handler import chk_and_make_dir
+from modules.utils.functions import string_to_boolean
+from modules.utils.metrics import (
+    confusion_matrix,
+    curves_from_confusion,
+    metrics_from_confusion,
+    select_threshold,
+    threshold_confusion,
+)
+
+external_logger = logging.getLogger("ExternalMemory")
+
+_MASK64 = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def hash_uniform(row_ids: np.ndarray, seed: int) -> np.ndarray:
+    """행 번호를 [0, 1) 균등분포 값으로 변환 (splitmix64)
+        같은 행 번호와 seed 는 항상 같은 값이므로 전체 셔플 없이 행 단위로 분할 가능
+
+    Args:
+        row_ids (np.ndarray): 원본 데이터의 행 번호
+        seed (int): seed
+
+    Returns:
+        np.ndarray: [0, 1) 범위 float64
+    """
+    with np.errstate(over="ignore"):
+        z = row_ids.astype(np.uint64) + np.uint64(seed) * np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        z = (z ^ (z >> np.uint64(31))) & _MASK64
+    return (z >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+class SplitChunks:
+    """SplitChunks class
+        전처리된 chunk 를 행 번호 hash 로 train/valid/test 에 배정
+        valid 는 test 를 제외한 행의 validation_size 비율 (실제 라벨 비율 유지, threshold 선택용)
+        train 의 정상(다수) 클래스는 keep_rate 비율만 hash 로 추출 (Under Sampling)
+
+    Attributes:
+        _preprocess (Preprocess): chunk 전처리에 사용
+        _source_path (str): CSV 경로
+        _chunk_size (int): chunk 당 행 수
+        _test_size (float): test 비율
+        _seed (int): hash seed
+        _keep_rate (float): train 정상 클래스 추출 비율
+        _validation_size (float): test 를 제외한 행 중 valid 비율, 0 이면 valid 없음
+    """
+
+    def __init__(
+        self,
+        preprocess: Preprocess,
+        source_path: str,
+        chunk_size: int,
+        test_size: float,
+        seed: int,
+        keep_rate: float = 1.0,
+        validation_size: float = 0.0,
+    ) -> None:
+        self._preprocess = preprocess
+        self._source_path = source_path
+        self._chunk_size = chunk_size
+        self._test_size = test_size
+        self._seed = seed
+        self._keep_rate = keep_rate
+        self._validation_size = validation_size
+
+    def iter_subset(self, subset: str) -> Iterator[pd.DataFrame]:
+        """train, valid 또는 test 에 배정된 행만 chunk 단위로 반환
+
+        Args:
+            subset (str): train, valid 또는 test
+
+        Returns:
+            Iterator[pd.DataFrame]: 전처리된 chunk
+        """
+        for chunk in self._preprocess.iter_chunks(self._chunk_size, self._source_path):
+            row_ids = chunk.index.to_numpy()
+            uniform = hash_uniform(row_ids, self._seed)
+            is_test = uniform < self._test_size
+            # test 다음 구간을 valid 로 사용 (test 를 제외한 행의 validation_size 비율)
+            valid_end = self._test_size + self._validation_size * (1 - self._test_size)
+            is_valid = ~is_test & (uniform < valid_end)
+            if subset == "test":
+                mask = is_test
+            elif subset == "valid":
+                mask = is_valid
+            else:
+                mask = ~is_test & ~is_valid
+                if self._keep_rate < 1.0:
+                    is_normal = chunk[TARGET_COLUMN].to_numpy() == 0
+                    dropped = hash_uniform(row_ids, self._seed + 1) >= self._keep_rate
+                    mask &= ~(is_normal & dropped)
+            if mask.any():
+                yield chunk.iloc[np.flatnonzero(mask)]
+
+
+class ChunkDataIter(xgb.DataIter):
+    """ChunkDataIter class
+        XGBoost external memory 학습용 data iterator
+        chunk 를 하나씩 넘기므로 전체 데이터를 메모리에 올리지 않음
+
+    Attributes:
+        _chunks (SplitChunks): chunk 공급원
+        _subset (str): train, valid 또는 test
+    """
+
+    def __init__(self, chunks: SplitChunks, subset: str, cache_prefix: str) -> None:
+        self._chunks = chunks
+        self._subset = subset
+        self._iterator = None
+        super().__init__(cache_prefix=cache_prefix)
+
+    def next(self, input_data) -> int:
+        if self._iterator is None:
+            self._iterator = self._chunks.iter_subset(self._subset)
+        chunk = next(self._iterator, None)
+        if chunk is None:
+            return 0
+        input_data(
+            data=chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float32),
+            label=chunk[TARGET_COLUMN].to_numpy(dtype=np.float32),
+        )
+        return 1
+
+    def reset(self) -> None:
+        self._iterator = None
+
+
+def count_labels(source_path: str, chunk_size: int) -> Dict[int, int]:
+    """라벨 컬럼만 읽어 이진화 후 클래스별 행 수 계산 (Under Sampling 비율 추정용)
+
+    Args:
+        source_path (str): CSV 경로
+        chunk_size (int): chunk 당 행 수
+
+    Returns:
+        Dict[int, int]: 라벨 -> 행 수
+    """
+    counts = {0: 0, 1: 0}
+    reader = pd.read_csv(
+        source_path, encoding="utf-8", usecols=[TARGET_COLUMN], chunksize=chunk_size
+    )
+    with reader:
+        for chunk in reader:
+            label = chunk[TARGET_COLUMN].to_numpy()
+            # Preprocess 와 같은 라벨 규칙: 1, 0 -> 정상, 그 외 -> 이상
+            normal = int(np.count_nonzero((label == 1) | (label == 0)))
+            counts[0] += normal
+            counts[1] += len(label) - normal
+    return counts
+
+
+def streaming_evaluate(
+    booster: xgb.Booster, chunks: SplitChunks, subset: str, threshold: float = 0.5
+) -> Dict[str, float]:
+    """chunk 단위로 예측하며 혼동행렬을 누적해 정확도, F1 score, 민감도, 특이도 계산
+
+    Args:
+        booster (xgb.Booster): 학습된 모델
+        chunks (SplitChunks): chunk 공급원
+        subset (str): train, valid 또는 test
+        threshold (float): 양성 판정 기준
+
+    Returns:
+        Dict[str, float]: binary_metrics 와 같은 지표
+    """
+    counts = np.zeros(4, dtype=np.int64)
+    for chunk in chunks.iter_subset(subset):
+        features = chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float32)
+        proba = booster.inplace_predict(features)
+        counts += confusion_matrix(chunk[TARGET_COLUMN].to_numpy(), proba >= threshold)
+    return metrics_from_confusion(*(int(count) for count in counts))
+
+
+def streaming_threshold(
+    booster: xgb.Booster, chunks: SplitChunks, threshold_config: Dict
+) -> float:
+    """valid chunk 의 threshold 격자별 혼동행렬을 누적해 운영 threshold 선택
+        (메모리 내 학습의 Model._select_threshold 와 같은 기준)
+
+    Args:
+        booster (xgb.Booster): 학습된 모델
+        chunks (SplitChunks): valid 를 배정하는 chunk 공급원
+        threshold_config (Dict): config 의 threshold section
+
+    Returns:
+        float: 선택한 threshold
+    """
+    thresholds = np.linspace(0, 1, threshold_config.get("n_thresholds", 201))
+    confusion = None
+    for chunk in chunks.iter_subset("valid"):
+        features = chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float32)
+        proba = booster.inplace_predict(features)
+        counts = threshold_confusion(chunk[TARGET_COLUMN].to_numpy(), proba, thresholds)
+        if confusion is None:
+            confusion = counts
+        else:
+            confusion = {key: confusion[key] + value for key, value in counts.items()}
+
+    method = threshold_config.get("method", "f1")
+    fixed = float(threshold_config.get("value", 0.5))
+    if confusion is None:
+        external_logger.warning(
+            f"no validation data: fixed threshold {fixed} is used instead of {method}"
+        )
+        return fixed
+    return select_threshold(
+        curves_from_confusion(thresholds, confusion),
+        method,
+        threshold_config.get("target_sensitivity", 0.9),
+    )
+
+
+def train_external_memory(
+    params: Dict,
+    num_boost_round: int,
+    config: Dict,
+    source_path: str = None,
+) -> Dict:
+    """CSV 를 chunk 단위로 읽어 XGBoost external memory 로 학습하고 평가
+
+    Args:
+        params (Dict): xgb.train params
+        num_boost_round (int): tree 수
+        config (Dict): 전체 config
+        source_path (str): CSV 경로, None 이면 config 의 data 경로의 data.csv
+
+    Returns:
+        Dict: booster, threshold, eval (Train/Test 정확도, F1 score, test 민감도, 특이도)
+    """
+    em_config = config["external_memory"]
+    if source_path is None:
+        source_path = os.path.join(config["path"]["data"], "data.csv")
+    chunk_size = em_config["chunk_size"]
+    seed = config["random_state"]["random_state"]
+
+    counts = count_labels(source_path, chunk_size)
+    keep_rate = 1.0
+    undersample = string_to_boolean(str(em_config.get("undersample", True)))
+    if undersample and counts[0] > 0:
+        keep_rate = min(counts[1] / counts[0], 1.0)
+    external_logger.info(f"label counts: {counts}, normal keep rate: {keep_rate:.4f}")
+
+    # threshold 를 고를 때만 valid 를 분리 (메모리 내 학습과 같은 규칙)
+    threshold_config = config.get("threshold", {})
+    method = threshold_config.get("method", "f1")
+    validation_size = (
+        threshold_config.get("validation_size", 0.1) if method != "fixed" else 0.0
+    )
+    chunks = SplitChunks(
+        Preprocess(),
+        source_path,
+        chunk_size,
+        em_config["test_size"],
+        seed,
+        keep_rate,
+        validation_size,
+    )
+    cache_dir = os.path.join(config["path"]["cache"], "external_memory")
+    chk_and_make_dir(cache_dir)
+    train_iter = ChunkDataIter(chunks, "train", os.path.join(cache_dir, "train"))
+
+    params = dict(params, tree_method="hist")
+    dtrain = xgb.DMatrix(train_iter)
+    booster = xgb.train(params, dtrain, num_boost_round=num_boost_round)
+
+    if method == "fixed":
+        threshold = float(threshold_config.get("value", 0.5))
+    else:
+        threshold = streaming_threshold(booster, chunks, threshold_config)
+    train_eval = streaming_evaluate(booster, chunks, "train", threshold)
+    test_eval = streaming_evaluate(booster, chunks, "test", threshold)
+    # ROC/PR AUC 와 bootstrap 신뢰구간은 test 확률 전체가 필요하므로 계산하지 않음
+    external_logger.info(
+        f"threshold {threshold} ({method}), "
+        "ROC/PR AUC and bootstrap intervals are not computed in external memory mode"
+    )
+    eval_metric = {
+        "Train Accuracy": train_eval["accuracy"],
+        "Train F1 score": train_eval["f1"],
+        "Accuracy": test_eval["accuracy"],
+        "F1 score": test_eval["f1"],
+        "Threshold": threshold,
+        "Sensitivity": test_eval["sensitivity"],
+        "Specificity": test_eval["specificity"],
+    }
+    return {"booster": booster, "threshold": threshold, "eval": eval_metric}
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import logging
+import math
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+from pathos.multiprocessing import ProcessingPool as Pool
+
+from modules.model import Model, to_label, train_booster, xgb_params
+from modules.utils.file_handler import chk_and_make_dir
+from modules.utils.functions import cpu_budget
+from modules.utils.metrics import RankedScores, binary_metrics
+
+search_logger = logging.getLogger("HyperParameterSearch")
+
+
+def _evaluate_trial(args: Tuple) -> Dict:
+    """trial 하나를 주어진 tree 수로 학습하고 검증 데이터로 평가 (worker 에서 실행)
+
+    Args:
+        args (Tuple): (params, n_estimators, n_jobs, train_x, train_y, valid_x, valid_y)
+
+    Returns:
+        Dict: 검증 지표
+    """
+    params, n_estimators, n_jobs, train_x, train_y, valid_x, valid_y = args
+    booster, _ = train_booster(
+        dict(params, n_estimators=n_estimators), train_x, train_y, n_jobs=n_jobs
+    )
+    proba = booster.inplace_predict(valid_x)
+    metrics = binary_metrics(valid_y, to_label(proba))
+    auc = RankedScores(valid_y, proba).auc()
+    return {
+        "Valid Accuracy": metrics["accuracy"],
+        "Valid F1 score": metrics["f1"],
+        "Valid ROC AUC": auc["roc_auc"],
+        "Valid PR AUC": auc["pr_auc"],
+    }
+
+
+class HyperParameterSearch:
+    """HyperParameterSearch class
+        search_space 범위에서 hyper parameter 를 추출해 process pool 에서 병렬로 평가
+        successive halving: 적은 tree 수로 모든 trial 을 평가한 뒤
+        상위 1/reduction_factor 만 tree 수를 reduction_factor 배 늘려 다시 평가
+        완료된 trial 은 파일에 기록해 중단된 탐색을 이어서 진행
+
+    Attributes:
+        _model (Model): 데이터 분할에 사용할 모델
+        _search_config (dict): hyper_parameter_search section
+        _search_space (dict): search_space section ([최소, 최대] 또는 후보 목록)
+        _trial_path (str): 완료된 trial 기록 파일
+    """
+
+    SCORE = "Valid F1 score"
+
+    def __init__(self, model: Model, config: Dict) -> None:
+        self._model = model
+        self._config = config
+        self._search_config = config["hyper_parameter_search"]
+        self._search_space = config["search_space"]
+        self._random_state = config["random_state"]["random_state"]
+        search_dir = os.path.join(config["path"]["cache"], "search")
+        chk_and_make_dir(search_dir)
+        self._trial_path = os.path.join(search_dir, "trials.jsonl")
+        self._completed = self._load_completed()
+
+    def _load_completed(self) -> Dict[str, Dict]:
+        completed = {}
+        if os.path.exists(self._trial_path):
+            with open(self._trial_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        trial = json.loads(line)
+                        completed[trial["key"]] = trial
+        return completed
+
+    def _append_completed(self, trials: List[Dict]) -> None:
+        with open(self._trial_path, "a", encoding="utf-8") as f:
+            for trial in trials:
+                f.write(json.dumps(trial, ensure_ascii=False) + "\n")
+                self._completed[trial["key"]] = trial
+
+    def _sample_params(self, rng: np.random.Generator) -> Dict:
+        """search_space 에서 parameter 하나씩 추출
+            [정수, 정수] -> 정수 범위, [실수, 실수] -> 실수 범위, 그 외 -> 후보 중 선택
+        """
+        params = {}
+        for key, space in self._search_space.items():
+            if not isinstance(space, list):
+                params[key] = space
+            elif len(space) == 2 and all(isinstance(v, int) for v in space):
+                params[key] = int(rng.integers(space[0], space[1] + 1))
+            elif len(space) == 2 and all(isinstance(v, (int, float)) for v in space):
+                params[key] = float(rng.uniform(space[0], space[1]))
+            else:
+                params[key] = space[int(rng.integers(len(space)))]
+        return params
+
+    def _rungs(self) -> List[int]:
+        """단계별 tree 수 (min_resource 부터 reduction_factor 배씩, max_resource 까지)"""
+        eta = self._search_config["reduction_factor"]
+        resource = self._search_config["min_resource"]
+        max_resource = self._search_config["max_resource"]
+        rungs = []
+        while resource < max_resource:
+            rungs.append(int(resource))
+            resource *= eta
+        rungs.append(int(max_resource))
+        return rungs
+
+    def _trial_key(self, data_key: str, params: Dict, n_estimators: int) -> str:
+        payload = json.dumps(
+            [data_key, params, n_estimators], sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def run(self) -> Dict:
+        """탐색 실행
+
+        Returns:
+            Dict: best_params (hyper_parameter 형식), best_metrics, trials (완료된 모든 trial)
+        """
+        validation_size = self._search_config["validation_size"]
+        train_x, train_y, valid_x, valid_y = self._model.validation_split(validation_size)
+        sha = hashlib.sha256()
+        for array in (train_x, train_y, valid_x, valid_y):
+            sha.update(np.ascontiguousarray(array).tobytes())
+        data_key = sha.hexdigest()
+
+        rng = np.random.default_rng(self._random_state)
+        base_params = xgb_params(self._model.h_param)
+        base_params.pop("n_estimators", None)
+        survivors = [
+            dict(base_params, **self._sample_params(rng))
+            for _ in range(self._search_config["n_trials"])
+        ]
+
+        eta = self._search_config["reduction_factor"]
+        trials = []
+        rungs = self._rungs()
+        for rung, n_estimators in enumerate(rungs):
+            keys = [self._trial_key(data_key, p, n_estimators) for p in survivors]
+            todo = [
+                (p, key) for p, key in zip(survivors, keys) if key not in self._completed
+            ]
+            search_logger.info(
+                f"rung {rung}: {len(survivors)} trials x {n_estimators} trees "
+                f"({len(survivors) - len(todo)} cached)"
+            )
+
+            if todo:
+                n_workers, n_jobs = cpu_budget(
+                    len(todo), self._search_config.get("n_workers")
+                )
+                pool = Pool(n_workers)
+                metrics = pool.map(
+                    _evaluate_trial,
+                    [
+                        (p, n_estimators, n_jobs, train_x, train_y, valid_x, valid_y)
+                        for p, _ in todo
+                    ],
+                )
+                pool.close()
+                pool.join()
+                pool.clear()
+                self._append_completed(
+                    [
+                        {
+                            "key": key,
+                            "rung": rung,
+                            "params": dict(p, n_estimators=n_estimators),
+                            "metrics": m,
+                        }
+                        for (p, key), m in zip(todo, metrics)
+                    ]
+                )
+
+            rung_trials = [self._completed[key] for key in keys]
+            trials.extend(rung_trials)
+            if rung == len(rungs) - 1:
+                break
+
+            # 성능 상위 1/eta 만 다음 단계로 진행 (나머지는 조기 종료)
+            n_keep = max(int(math.ceil(len(survivors) / eta)), 1)
+            order = np.argsort(
+                [-trial["metrics"][self.SCORE] for trial in rung_trials], kind="stable"
+            )
+            survivors = [survivors[i] for i in order[:n_keep]]
+
+        best = max(rung_trials, key=lambda trial: trial["metrics"][self.SCORE])
+        search_logger.info(f"best trial: {best['params']} {best['metrics']}")
+        return {
+            "best_params": best["params"],
+            "best_metrics": best["metrics"],
+            "trials": trials,
+        }
@@ -2,30 +2,188 @@ import logging
 import os
 from datetime import datetime
 from math import sqrt
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
 
 import numpy as np
 import pandas as pd
 import xgboost as xgb
-from sklearn.metrics import accuracy_score, f1_score
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import RobustScaler
+from pathos.multiprocessing import ProcessingPool as Pool
 
 from modules.config import Config
-from modules.utils.decorator import TryDecorator
-from modules.utils.file_handler import chk_and_make_dir
+from modules.ensemble import BoosterEnsemble
+from modules.external_memory import train_external_memory
+from modules.model_store import get_model_pool, load_booster, model_exists, save_booster
+from modules.preprocess import COLUMN_DTYPES, FEATURE_COLUMNS, TARGET_COLUMN
+from modules.tree_export import export_trees
+from modules.tree_predictor import NPZ_FILE
+from modules.utils.decorator import RunningTimeDecorator, TryDecorator
+from modules.utils.file_handler import get_last_path
+from modules.utils.functions import cpu_budget, string_to_boolean
+from modules.utils.metrics import (
+    RankedScores,
+    binary_metrics,
+    select_threshold,
+    threshold_curves,
+)
+from modules.utils.sampling import (
+    balanced_bag_indices,
+    gather_rows,
+    stratified_kfold_indices,
+    stratified_split_indices,
+    undersample_indices,
+)
+
+if TYPE_CHECKING:
+    from sklearn.preprocessing import RobustScaler
 
 model_logger = logging.getLogger("model")
 
+
+def classification_metrics(
+    actual_train: np.ndarray,
+    predict_train: np.ndarray,
+    actual: np.ndarray,
+    predict: np.ndarray,
+) -> Dict:
+    """train/test 의 정확도, F1 score (confusion matrix 를 한 번씩만 계산)"""
+    train = binary_metrics(actual_train, predict_train)
+    test = binary_metrics(actual, predict)
+    return {
+        'Train Accuracy': train["accuracy"],
+        'Train F1 score': train["f1"],
+        'Accuracy': test["accuracy"],
+        'F1 score': test["f1"],
+    }
+
+
+def _fit_fold(args: Tuple) -> Dict:
+    """fold 하나를 학습하고 평가 (worker 에서 실행)
+
+    Args:
+        args (Tuple): (h_param, n_jobs, train_x, train_y, test_x, test_y)
+
+    Returns:
+        Dict: fold 지표
+    """
+    h_param, n_jobs, train_x, train_y, test_x, test_y = args
+    booster, dtrain = train_booster(h_param, train_x, train_y, n_jobs= n_jobs)
+    return classification_metrics(
+        train_y,
+        to_label(booster.predict(dtrain)),
+        test_y,
+        to_label(booster.inplace_predict(test_x)),
+    )
+
+
+def _fit_bag(args: Tuple) -> Tuple[xgb.Booster, int]:
+    """balanced bag 하나를 학습 (worker 에서 실행)
+
+    Args:
+        args (Tuple): (params, num_boost_round, early_stopping_rounds,
+            train_x, train_y, valid_x, valid_y), 검증 데이터가 None 이면 early stopping 하지 않음
+
+    Returns:
+        Tuple[xgb.Booster, int]: 모델, best iteration
+    """
+    params, num_boost_round, early_stopping_rounds = args[:3]
+    train_x, train_y, valid_x, valid_y = args[3:]
+    dtrain = quantile_dmatrix(params, train_x, train_y)
+    if valid_x is None:
+        return xgb.train(params, dtrain, num_boost_round= num_boost_round), None
+
+    booster = xgb.train(
+        params,
+        dtrain,
+        num_boost_round= num_boost_round,
+        evals= [(quantile_dmatrix(params, valid_x, valid_y, ref= dtrain), "valid")],
+        early_stopping_rounds= early_stopping_rounds,
+        verbose_eval= False,
+    )
+    return booster, int(booster.best_iteration)
+
+
+def xgb_params(h_param: Dict) -> Dict:
+    """config 의 hyper_parameter 값 정리 (문자열 값의 따옴표 제거)"""
+    return {
+        key: value.strip("'\"") if isinstance(value, str) else value
+        for key, value in h_param.items()
+    }
+
+
+def booster_params(h_param: Dict, n_jobs: int = None) -> Tuple[Dict, int]:
+    """config 의 hyper_parameter(XGBClassifier 인자 이름)를 xgb.train 인자로 변환
+
+    Args:
+        h_param (Dict): hyper parameter
+        n_jobs (int): 학습 thread 수
+
+    Returns:
+        Tuple[Dict, int]: xgb.train params, num_boost_round
+    """
+    params = xgb_params(h_param)
+    num_boost_round = int(params.pop("n_estimators", 100))
+    for sklearn_key, native_key in (
+        ("reg_alpha", "alpha"),
+        ("reg_lambda", "lambda"),
+        ("n_jobs", "nthread"),
+        ("random_state", "seed"),
+    ):
+        if sklearn_key in params:
+            params[native_key] = params.pop(sklearn_key)
+    params.setdefault("objective", "binary:logistic")
+    params.setdefault("tree_method", "hist")
+    if n_jobs is not None:
+        params["nthread"] = n_jobs
+    return params, num_boost_round
+
+
+def quantile_dmatrix(
+    params: Dict, data: np.ndarray, label: np.ndarray = None, ref: Any = None
+) -> xgb.QuantileDMatrix:
+    """hist 학습용 양자화 DMatrix (ref 가 있으면 ref 의 분위수 경계를 사용)"""
+    return xgb.QuantileDMatrix(
+        data,
+        label,
+        ref= ref,
+        max_bin= params.get("max_bin", 256),
+        nthread= params.get("nthread", -1),
+    )
+
+
+def train_booster(
+    h_param: Dict, train_x: np.ndarray, train_y: np.ndarray, n_jobs: int = None
+) -> Tuple[xgb.Booster, xgb.QuantileDMatrix]:
+    """QuantileDMatrix 를 한 번 만들어 학습하고, 재사용할 수 있도록 함께 반환"""
+    params, num_boost_round = booster_params(h_param, n_jobs)
+    dtrain = quantile_dmatrix(params, train_x, train_y)
+    booster = xgb.train(params, dtrain, num_boost_round= num_boost_round)
+    return booster, dtrain
+
+
+def to_label(proba: np.ndarray, threshold: float = 0.5) -> np.ndarray:
+    return (proba >= threshold).astype(np.uint8)
+
 class Model:
     _input_data: pd.DataFrame
+    _features: np.ndarray
+    _target: np.ndarray
+    _train_idx: np.ndarray
+    _train_pool_idx: np.ndarray
+    _test_idx: np.ndarray
+    _valid_idx: np.ndarray
+    _bag_pos: List[np.ndarray]
     _train_input: np.ndarray
     _train_target: np.ndarray
     _test_input: np.ndarray
     _test_target: np.ndarray
-    _input_scaler: RobustScaler
-    _target_scaler: RobustScaler 
-    _model: xgb.XGBRegressor
+    _valid_input: np.ndarray
+    _valid_target: np.ndarray
+    _input_scaler: "RobustScaler"
+    _target_scaler: "RobustScaler"
+    _model: Union[xgb.Booster, BoosterEnsemble]
+    _best_iteration: int
+    _evals_result: Dict
+    _dmatrix: Dict[str, xgb.QuantileDMatrix]
     _config: dict
     _model_path: str
     
@@ -33,37 +191,137 @@ class Model:
     def h_param(self):
         return self._h_param
 
+    @property
+    def metadata(self) -> Dict:
+        return getattr(self, "_metadata_loaded", None)
+
+    @property
+    def model_path(self) -> str:
+        return getattr(self, "_model_path", None)
+
+    @property
+    def best_iteration(self) -> int:
+        return getattr(self, "_best_iteration", None)
+
+    @property
+    def evals_result(self) -> Dict:
+        return getattr(self, "_evals_result", None)
+
+    @property
+    def threshold(self) -> float:
+        return getattr(self, "_threshold", 0.5)
+
+    @property
+    def evaluation_curves(self) -> Dict[str, np.ndarray]:
+        return getattr(self, "_evaluation_curves", None)
+
     def __init__(self, preprocessed_data, h_param: Dict = None) -> None:
         self._config = Config.instance().config
         self._model_logger = logging.getLogger("Model")
         self._preprocessed_data = preprocessed_data
+        # config 의 hyper parameter 를 쓰는 모델은 복원할 때 현재 설정으로 갱신
+        self._h_param_from_config = h_param is None
         if h_param is None:
             self._h_param = self._config["hyper_parameter"]
         else:
             self._h_param = h_param
         self._random_state = self._config['random_state']
+        self._early_stopping = self._config.get("early_stopping", {})
+        self._ensemble = self._config.get("ensemble", {})
+        self._threshold_config = self._config.get("threshold", {})
 
+    def __getstate__(self) -> Dict:
+        # 입력 데이터와 파생 행렬은 저장하지 않음 (분할 index 와 train/test 배열은 저장)
+        state = self.__dict__.copy()
+        # DMatrix 는 pickle 할 수 없으므로 필요할 때 다시 생성
+        # config 는 복원 시점의 설정을 사용 (저장 경로 등이 바뀐 경우)
+        for key in (
+            "_preprocessed_data",
+            "_features",
+            "_target",
+            "_dmatrix",
+            "_config",
+            "_predictors",
+        ):
+            state.pop(key, None)
+        return state
 
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._preprocessed_data = None
+        self._config = Config.instance().config
+        self._threshold_config = self._config.get("threshold", {})
+        # 분할 단계 cache 에서 복원한 모델이 이전 hyper parameter 로 학습하지 않도록 함
+        # (hyper_parameter 가 바뀌면 fit 단계부터 다시 실행)
+        if self.__dict__.get("_h_param_from_config", True):
+            self._h_param = self._config["hyper_parameter"]
+
+    def _build_matrix(self) -> None:
+        """전처리 데이터를 연속된 float32 feature 행렬과 라벨 배열로 한 번만 변환"""
+        self._feature_names = [
+            column for column in self._preprocessed_data.columns if column != TARGET_COLUMN
+        ]
+        self._features = np.empty(
+            (len(self._preprocessed_data), len(self._feature_names)), dtype= np.float32
+        )
+        for i, column in enumerate(self._feature_names):
+            self._features[:, i] = self._preprocessed_data[column].to_numpy()
+        self._target = self._preprocessed_data[TARGET_COLUMN].to_numpy()
+        self._feature_dtypes = {
+            column: str(self._preprocessed_data[column].dtype)
+            for column in self._feature_names
+        }
+
+    @RunningTimeDecorator(logger= model_logger)
     @TryDecorator(logger= model_logger)
     def _split_data(self) -> None:
         if self._preprocessed_data is None or self._preprocessed_data.empty:
             raise Exception("preprocessed data is Empty")
-        
-        train_set, test_set = train_test_split(
-            self._preprocessed_data, test_size= 0.2, random_state= 42, shuffle= True, stratify= self._preprocessed_data['요단백']
-        )
 
-        #Under Sampling
-        abnormal = train_set.loc[train_set['요단백'] == 1]
-        normal = train_set.loc[train_set['요단백'] == 0][:len(abnormal)]
-        train_set = pd.concat([normal, abnormal]).sample(frac=1, random_state=self._random_state['random_state'])
+        self._build_matrix()
+        random_state = self._random_state['random_state']
 
-        self._train_input = train_set.drop(columns = ['요단백']).values
-        self._train_target = train_set["요단백"].values
-        self._test_input = test_set.drop(columns = ['요단백']).values
-        self._test_target = test_set["요단백"].values
+        # 층화 분할, Under Sampling, 셔플 모두 index 연산으로 처리
+        self._train_pool_idx, self._test_idx = stratified_split_indices(
+            self._target, test_size= 0.2, random_state= random_state
+        )
+        train_pool_idx = self._train_pool_idx
+        self._valid_idx = None
+        if self._use_early_stopping() or self._use_threshold_selection():
+            # early stopping, threshold 선택용 검증 데이터는 Under Sampling 전 train 에서 분리
+            # (실제 라벨 비율 유지, test 데이터는 평가에만 사용)
+            if self._use_early_stopping():
+                validation_size = self._early_stopping["validation_size"]
+            else:
+                validation_size = self._threshold_config.get("validation_size", 0.1)
+            train_pool_idx, self._valid_idx = self._validation_indices(validation_size)
 
+        self._bag_pos = None
+        if self._use_ensemble():
+            # bag 마다 이상 데이터 전체와 서로 다른 정상 데이터를 짝지음
+            bags = balanced_bag_indices(
+                self._target,
+                train_pool_idx,
+                self._ensemble["n_bags"],
+                random_state= random_state,
+            )
+            # bag 들이 사용한 행을 한 번만 모으고, bag 은 그 안의 위치로 보관
+            self._train_idx = np.unique(np.concatenate(bags))
+            self._bag_pos = [np.searchsorted(self._train_idx, bag) for bag in bags]
+        else:
+            self._train_idx = undersample_indices(
+                self._target, train_pool_idx, random_state= random_state
+            )
 
+        # feature 는 마지막에 한 번만 모음
+        self._train_input = gather_rows(self._features, self._train_idx)
+        self._train_target = gather_rows(self._target, self._train_idx)
+        self._test_input = gather_rows(self._features, self._test_idx)
+        self._test_target = gather_rows(self._target, self._test_idx)
+        self._valid_input = self._valid_target = None
+        if self._valid_idx is not None:
+            self._valid_input = gather_rows(self._features, self._valid_idx)
+            self._valid_target = gather_rows(self._target, self._valid_idx)
 
         model_logger.info("Model Data Count-------------------------------------")
         model_logger.info(
@@ -71,69 +329,591 @@ class Model:
         )
         model_logger.info("train dataset      : " + str(len(self._train_input)))
         model_logger.info("test dataset       : " + str(len(self._test_input)))
+        if self._valid_input is not None:
+            model_logger.info("valid dataset      : " + str(len(self._valid_input)))
+        if self._bag_pos is not None:
+            model_logger.info(
+                f"bags               : {len(self._bag_pos)} x {len(self._bag_pos[0])}"
+            )
         model_logger.info("-----------------------------------------------------")
 
+    def _use_early_stopping(self) -> bool:
+        return string_to_boolean(str(self._early_stopping.get("enabled", False)))
+
+    def _use_threshold_selection(self) -> bool:
+        return self._threshold_config.get("method", "f1") != "fixed"
+
+    def _use_ensemble(self) -> bool:
+        return string_to_boolean(str(self._ensemble.get("enabled", False)))
+
     def _build_model(self) -> None:
-        self._model = xgb.XGBClassifier(
-        n_estimators = 200,
-        reg_alpha = 0,
-        reg_lambda = 1,
-        booster = 'gbtree',
-        learning_rate = 0.03,
-        gamma = 0.1,
-        subsample = 0.4,
-        colsample_bytree = 1,
-        max_depth = 7
-        )
+        self._params, self._num_boost_round = booster_params(self._h_param)
+        if self._use_early_stopping():
+            # 마지막 지표가 early stopping 기준
+            self._params["eval_metric"] = self._early_stopping["eval_metric"]
+
+    def _get_dmatrix(self, name: str) -> xgb.QuantileDMatrix:
+        """train/test 양자화 DMatrix 를 한 번만 만들고 학습, 평가, 예측에 재사용
+            test, valid 는 train 의 분위수 경계를 사용
+
+        Args:
+            name (str): train, test 또는 valid
+
+        Returns:
+            xgb.QuantileDMatrix: 캐시된 DMatrix
+        """
+        cache = self.__dict__.setdefault("_dmatrix", {})
+        if name not in cache:
+            if name == "train":
+                cache[name] = quantile_dmatrix(
+                    self._params, self._train_input, self._train_target
+                )
+            elif name in ("test", "valid"):
+                cache[name] = quantile_dmatrix(
+                    self._params,
+                    getattr(self, f"_{name}_input"),
+                    getattr(self, f"_{name}_target"),
+                    ref= self._get_dmatrix("train"),
+                )
+            else:
+                raise KeyError(name)
+        return cache[name]
 
+    @RunningTimeDecorator(logger= model_logger)
     def _fit(self) -> None:
-        self._model.fit(self._train_input, self._train_target)
+        self._dmatrix = {}
+        self._best_iteration = None
+        self._evals_result = {}
+        if getattr(self, "_bag_pos", None) is not None:
+            self._fit_ensemble()
+            return
+        if getattr(self, "_valid_input", None) is None or not self._use_early_stopping():
+            self._model = xgb.train(
+                self._params,
+                self._get_dmatrix("train"),
+                num_boost_round= self._num_boost_round,
+            )
+            return
 
-    def evaluate_model(self) -> dict:
-        actual = self._test_target
-        predict = self._model.predict(self._test_input)
-        actual_train = self._train_target.reshape(-1,1)
-        predict_train = self._model.predict(self._train_input)
-
-        eval_metric = {
-            'Train Accuracy': accuracy_score(actual_train, predict_train),
-            'Train F1 score': f1_score(actual_train, predict_train),
-            'Accuracy': accuracy_score(actual, predict),
-            'F1 score': f1_score(actual, predict),
+        # round 마다 train/valid 지표를 기록하고, valid 지표가 개선되지 않으면 중단
+        self._model = xgb.train(
+            self._params,
+            self._get_dmatrix("train"),
+            num_boost_round= self._num_boost_round,
+            evals= [
+                (self._get_dmatrix("train"), "train"),
+                (self._get_dmatrix("valid"), "valid"),
+            ],
+            early_stopping_rounds= self._early_stopping["early_stopping_rounds"],
+            evals_result= self._evals_result,
+            verbose_eval= False,
+        )
+        self._best_iteration = int(self._model.best_iteration)
+        best_scores = {
+            metric: round(values[self._best_iteration], 6)
+            for metric, values in self._evals_result["valid"].items()
         }
+        model_logger.info(
+            f"early stopping: best iteration {self._best_iteration} "
+            f"/ {self._num_boost_round}, valid {best_scores}"
+        )
+
+    def _fit_ensemble(self) -> None:
+        """balanced bag 별 모델을 process pool 에서 동시에 학습해 BoosterEnsemble 로 묶음
+            cpu 코어를 bag 프로세스 수와 XGBoost thread 수로 나눔
+        """
+        n_bags = len(self._bag_pos)
+        n_workers, n_jobs = cpu_budget(n_bags, self._ensemble.get("n_workers"))
+        seed = self._params.get("seed", self._random_state['random_state'])
+        # 검증 데이터가 threshold 선택용으로만 있으면 early stopping 하지 않음
+        valid_input = valid_target = None
+        if self._use_early_stopping():
+            valid_input, valid_target = self._valid_input, self._valid_target
+        tasks = [
+            (
+                dict(self._params, nthread= n_jobs, seed= seed + bag),
+                self._num_boost_round,
+                self._early_stopping.get("early_stopping_rounds"),
+                gather_rows(self._train_input, bag_pos),
+                gather_rows(self._train_target, bag_pos),
+                valid_input,
+                valid_target,
+            )
+            for bag, bag_pos in enumerate(self._bag_pos)
+        ]
+
+        model_logger.info(
+            f"ensemble: {n_bags} bags, {n_workers} processes x {n_jobs} threads"
+        )
+        if n_workers == 1:
+            results = [_fit_bag(task) for task in tasks]
+        else:
+            pool = Pool(n_workers)
+            results = pool.map(_fit_bag, tasks)
+            pool.close()
+            pool.join()
+            pool.clear()
+
+        boosters, best_iterations = zip(*results)
+        self._model = BoosterEnsemble(boosters, best_iterations)
+        if valid_input is not None:
+            model_logger.info(f"ensemble best iterations: {list(best_iterations)}")
+
+    def _predict_proba(self, name: str) -> np.ndarray:
+        """train/test 양성 확률
+            ensemble 은 bag 마다 분위수 경계가 다르므로 DMatrix 대신 배열로 예측
+        """
+        if isinstance(self._model, BoosterEnsemble):
+            return self._model.inplace_predict(getattr(self, f"_{name}_input"))
+        return self._model.predict(
+            self._get_dmatrix(name), iteration_range= self._iteration_range()
+        )
+
+    def _iteration_range(self) -> Tuple[int, int]:
+        """예측에 사용할 tree 범위, early stopping 했으면 best iteration 까지만 사용"""
+        if self.best_iteration is None:
+            return (0, 0)
+        return (0, self.best_iteration + 1)
+
+    def _select_threshold(self) -> float:
+        """config 의 threshold.method 에 따라 운영 threshold 선택
+            실제 라벨 비율을 유지한 검증 데이터에서만 선택 (test 데이터로 고르면 평가가 낙관적)
+            검증 데이터가 없으면 threshold.value 고정값 사용
+        """
+        method = self._threshold_config.get("method", "f1")
+        fixed = float(self._threshold_config.get("value", 0.5))
+        if method == "fixed":
+            return fixed
+        if getattr(self, "_valid_input", None) is None:
+            model_logger.warning(
+                f"no validation data: fixed threshold {fixed} is used instead of {method}"
+            )
+            return fixed
+        actual, proba = self._valid_target, self._predict_proba("valid")
+        curves = threshold_curves(
+            actual, proba, self._threshold_config.get("n_thresholds", 201)
+        )
+        return select_threshold(
+            curves, method, self._threshold_config.get("target_sensitivity", 0.9)
+        )
+
+    @RunningTimeDecorator(logger= model_logger)
+    def evaluate_model(self) -> dict:
+        """test 데이터 평가
+            운영 threshold 는 검증 데이터에서 고르고, test 양성 확률을 한 번 예측해
+            threshold 별 곡선, ROC-AUC, PR-AUC, bootstrap 신뢰구간을 같은 확률에서 계산
+        """
+        self._threshold = self._select_threshold()
+        proba = self._predict_proba("test")
+        proba_train = self._predict_proba("train")
+
+        eval_metric = classification_metrics(
+            self._train_target,
+            to_label(proba_train, self._threshold),
+            self._test_target,
+            to_label(proba, self._threshold),
+        )
+        self._evaluation_curves = threshold_curves(
+            self._test_target, proba, self._threshold_config.get("n_thresholds", 201)
+        )
+        test = binary_metrics(self._test_target, to_label(proba, self._threshold))
+        ranked = RankedScores(self._test_target, proba)
+        auc = ranked.auc()
+        eval_metric.update({
+            "Threshold": self._threshold,
+            "Sensitivity": test["sensitivity"],
+            "Specificity": test["specificity"],
+            "ROC AUC": auc["roc_auc"],
+            "PR AUC": auc["pr_auc"],
+        })
 
+        n_bootstrap = self._threshold_config.get("n_bootstrap", 0)
+        if n_bootstrap > 0:
+            confidence = self._threshold_config.get("confidence", 0.95)
+            intervals = ranked.bootstrap(
+                self._threshold,
+                n_bootstrap,
+                confidence,
+                random_state= self._random_state['random_state'],
+            )
+            names = {
+                "roc_auc": "ROC AUC",
+                "pr_auc": "PR AUC",
+                "threshold_f1": "F1 score",
+                "threshold_sensitivity": "Sensitivity",
+                "threshold_specificity": "Specificity",
+            }
+            for key, (low, high) in intervals.items():
+                eval_metric[f"{names[key]} CI low"] = low
+                eval_metric[f"{names[key]} CI high"] = high
         return eval_metric
 
+    @RunningTimeDecorator(logger= model_logger)
+    def cross_validate(self, n_splits: int = None, preprocessed_data= None) -> Dict:
+        """층화 K-fold 교차 검증
+            fold 마다 학습 데이터만 Under Sampling 하고, fold 들은 process pool 에서 동시에 학습
+            cpu 코어를 fold 프로세스 수와 XGBoost n_jobs 로 나눠 과다 할당을 막음
+
+        Args:
+            n_splits (int): fold 수, None 이면 config 의 cross_validation.n_splits
+            preprocessed_data: 전처리 데이터, pipeline cache 에서 복원한 모델처럼
+                입력 데이터가 없는 경우 feature 행렬을 다시 만들 때 사용
+
+        Returns:
+            Dict: folds (fold 별 지표), aggregate (지표별 평균/표준편차)
+        """
+        cv_config = self._config["cross_validation"]
+        if n_splits is None:
+            n_splits = cv_config["n_splits"]
+        if getattr(self, "_features", None) is None:
+            # cache 에서 복원한 모델은 입력 데이터를 저장하지 않으므로 다시 연결
+            if preprocessed_data is not None:
+                self._preprocessed_data = preprocessed_data
+            if self._preprocessed_data is None:
+                raise Exception("preprocessed data is required for cross validation")
+            self._build_matrix()
+        random_state = self._random_state['random_state']
+
+        tasks = []
+        n_workers, n_jobs = cpu_budget(n_splits, cv_config.get("n_workers"))
+        for fold, (train_idx, test_idx) in enumerate(
+            stratified_kfold_indices(self._target, n_splits, random_state)
+        ):
+            train_idx = undersample_indices(
+                self._target, train_idx, random_state= random_state + fold
+            )
+            tasks.append(
+                (
+                    self._h_param,
+                    n_jobs,
+                    gather_rows(self._features, train_idx),
+                    gather_rows(self._target, train_idx),
+                    gather_rows(self._features, test_idx),
+                    gather_rows(self._target, test_idx),
+                )
+            )
+
+        model_logger.info(
+            f"cross validation: {n_splits} folds, {n_workers} processes x {n_jobs} threads"
+        )
+        if n_workers == 1:
+            folds = [_fit_fold(task) for task in tasks]
+        else:
+            pool = Pool(n_workers)
+            folds = pool.map(_fit_fold, tasks)
+            pool.close()
+            pool.join()
+            pool.clear()
+
+        aggregate = {}
+        for key in folds[0]:
+            values = np.array([fold[key] for fold in folds])
+            aggregate[f"CV {key} mean"] = float(values.mean())
+            aggregate[f"CV {key} std"] = float(values.std())
+        return {"folds": folds, "aggregate": aggregate}
+
+
+    def _to_matrix(self, input_data: Any) -> np.ndarray:
+        """입력을 학습 시와 같은 컬럼 순서의 C-contiguous float32 행렬로 변환"""
+        if isinstance(input_data, pd.DataFrame):
+            feature_names = getattr(self, "_feature_names", None)
+            if feature_names is not None:
+                input_data = input_data[feature_names]
+            return input_data.to_numpy(dtype= np.float32)
+        matrix = np.ascontiguousarray(input_data, dtype= np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        return matrix
 
-    def predict(self, input_data: Any) -> Any:
-        pred = []
-        for each_input in input_data:
-            pred.append(self._model.predict(each_input))
-        return pred
+    # serving 에서 batch 마다 호출되므로 로그 없이 registry 에만 기록
+    @RunningTimeDecorator(logger= model_logger, show_log= False)
+    def predict_batch(
+        self, input_data: Any, batch_size: int = None, n_jobs: int = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """입력 전체를 batch 단위로 예측
+
+        Args:
+            input_data (Any): 2차원 ndarray 또는 DataFrame
+            batch_size (int): 한 번에 예측할 행 수, None 이면 config 의 model.batch_size
+                (config 값도 None 이면 전체를 한 번에 예측)
+            n_jobs (int): 예측에 사용할 thread 수, None 이면 config 의 model.n_jobs
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 양성 확률 (float32), 예측 라벨 (uint8)
+        """
+        matrix = self._to_matrix(input_data)
+        n_rows = len(matrix)
+        if batch_size is None:
+            batch_size = self._config["model"].get("batch_size")
+        if not isinstance(batch_size, int) or batch_size <= 0:
+            batch_size = max(n_rows, 1)
+        if n_jobs is None:
+            n_jobs = self._config["model"].get("n_jobs")
+        predictor = self._predictor(n_jobs)
+
+        # DMatrix 를 만들지 않고 배열에서 바로 예측
+        iteration_range = self._iteration_range()
+        proba = np.empty(n_rows, dtype= np.float32)
+        for start in range(0, n_rows, batch_size):
+            end = min(start + batch_size, n_rows)
+            proba[start:end] = predictor.inplace_predict(
+                matrix[start:end], iteration_range= iteration_range
+            )
+        return proba, to_label(proba, self.threshold)
+
+    def _predictor(self, n_jobs: int) -> Union[xgb.Booster, BoosterEnsemble]:
+        """n_jobs thread 로 예측하는 모델
+            불러온 모델은 ModelPool 에서 다른 호출자와 공유하므로 직접 바꾸지 않고
+            thread 수를 바꾼 복사본을 만들어 두고 재사용
+
+        Args:
+            n_jobs (int): thread 수, 정수가 아니면 모델 설정 그대로 사용
+
+        Returns:
+            Union[xgb.Booster, BoosterEnsemble]: 예측에 사용할 모델
+        """
+        if not isinstance(n_jobs, int):
+            return self._model
+        model, predictors = getattr(self, "_predictors", (None, {}))
+        if model is not self._model:
+            # 학습, 불러오기로 모델이 바뀌면 복사본도 다시 만듦
+            predictors = {}
+            self._predictors = (self._model, predictors)
+        predictor = predictors.get(n_jobs)
+        if predictor is None:
+            predictor = self._model.copy()
+            predictor.set_param({"nthread": n_jobs})
+            predictors[n_jobs] = predictor
+        return predictor
+
+    def predict(self, input_data: Any) -> np.ndarray:
+        return self.predict_batch(input_data)[1]
+
+    def _metadata(self) -> Dict:
+        """모델과 함께 저장할 전처리 메타데이터"""
+        return {
+            "model_dt": self._model_dt,
+            "feature_names": self._feature_names,
+            "feature_dtypes": self._feature_dtypes,
+            "target": TARGET_COLUMN,
+            "h_param": self._h_param,
+            "anomaly_rule": self._config.get("anomaly_rule", {}),
+            "threshold": self.threshold,
+            "best_iteration": self.best_iteration,
+            "parent_model_dt": getattr(self, "_parent_model_dt", None),
+        }
 
     def _load_model(self, model_path: str) -> None:
-        if not os.path.exists(model_path):
+        if not model_exists(model_path):
             model_logger.error("Model does not exsist.")
         else:
-            self._model = xgb.load_model(model_path)
+            pool = get_model_pool(self._config["model"].get("pool_size", 4))
+            self._model, self._metadata_loaded = pool.get(
+                os.path.abspath(model_path), lambda: load_booster(model_path)
+            )
+            self._feature_names = self._metadata_loaded.get("feature_names")
+            self._feature_dtypes = self._metadata_loaded.get("feature_dtypes")
+            self._best_iteration = self._metadata_loaded.get("best_iteration")
+            self._threshold = self._metadata_loaded.get("threshold", 0.5)
+            self._model_path = model_path
 
     def _save_model(self, model_path: str) -> None:
-        chk_and_make_dir(model_path)
-        self._model.save(model_path)
+        save_booster(self._model, model_path, self._metadata())
+        if string_to_boolean(str(self._config["model"].get("export_npz", False))):
+            self.export_numpy(os.path.join(model_path, NPZ_FILE))
+
+    def export_numpy(self, path: str = None) -> str:
+        """xgboost 없이 예측할 수 있도록 tree 를 .npz 로 내보내기
 
-    def save_model(self, model_path: str = None) -> None:
-        current_dt = datetime.now().strftime("%Y%m%d_%H%M%S")
+        Args:
+            path (str): 저장 경로, None 이면 모델 디렉토리의 trees.npz
+
+        Returns:
+            str: 저장한 경로
+        """
+        if path is None:
+            path = os.path.join(self._model_path, NPZ_FILE)
+        return export_trees(
+            self._model,
+            path,
+            self._feature_names,
+            threshold= self._metadata()["threshold"],
+            best_iteration= self.best_iteration,
+        )
+
+    @RunningTimeDecorator(logger= model_logger)
+    def save_model(self, model_path: str = None) -> str:
+        self._model_dt = datetime.now().strftime("%Y%m%d_%H%M%S")
         self._model_path = model_path
         if self._model_path is None:
             self._model_path = os.path.join(
-                self._config["path"]["output"], current_dt, "model"
+                self._config["path"]["output"], self._model_dt, "model"
             )
         self._save_model(self._model_path)
+        return self._model_path
+
+    def load_model(self, model_dt: str = None) -> None:
+        """output/<model_dt>/model 에 저장된 모델 불러오기
+            같은 모델은 프로세스 공용 LRU pool 에서 재사용
 
-    def load_model(self, model_dt: str) -> None:
+        Args:
+            model_dt (str): 모델을 저장한 실행 시각, None 이면 가장 최근 모델
+        """
+        if model_dt is None:
+            # benchmark, profile 등 모델이 없는 디렉토리는 제외
+            model_dt = os.path.basename(os.path.dirname(
+                get_last_path(self._config["path"]["output"], type= "/model", by= "name")
+            ))
+        self._model_dt = model_dt
         model_path = os.path.join(self._config["path"]["output"], model_dt, "model")
         self._load_model(model_path)
 
+    def split_data(self) -> None:
+        self._split_data()
+
+    def _validation_indices(
+        self, validation_size: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Under Sampling 전 train index 를 학습/검증 index 로 분할 (둘 다 Under Sampling 전)"""
+        random_state = self._random_state['random_state']
+        fit_pos, valid_pos = stratified_split_indices(
+            self._target[self._train_pool_idx],
+            test_size= validation_size,
+            random_state= random_state,
+        )
+        return self._train_pool_idx[fit_pos], self._train_pool_idx[valid_pos]
+
+    def validation_split(
+        self, validation_size: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """train 데이터(Under Sampling 전)에서 검증 데이터를 분리
+            학습 데이터만 Under Sampling 하고, 검증 데이터는 실제 라벨 비율을 유지
+
+        Args:
+            validation_size (float): 검증 데이터 비율
+
+        Returns:
+            Tuple: 학습 input, 학습 target, 검증 input, 검증 target
+        """
+        fit_idx, valid_idx = self._validation_indices(validation_size)
+        fit_idx = undersample_indices(
+            self._target, fit_idx, random_state= self._random_state['random_state']
+        )
+        return (
+            gather_rows(self._features, fit_idx),
+            gather_rows(self._target, fit_idx),
+            gather_rows(self._features, valid_idx),
+            gather_rows(self._target, valid_idx),
+        )
+
+    def fit(self) -> None:
+        self._build_model()
+        self._fit()
+
+    @RunningTimeDecorator(logger= model_logger)
+    def fit_external_memory(self, source_path: str = None) -> Dict:
+        """전처리 데이터를 메모리에 올리지 않고 CSV chunk 로 external memory 학습
+            train/test 는 행 번호 hash 로, Under Sampling 은 정상 클래스 추출 비율로 결정
+
+        Args:
+            source_path (str): CSV 경로, None 이면 config 의 data 경로의 data.csv
+
+        Returns:
+            Dict: 평가 결과
+        """
+        self._build_model()
+        result = train_external_memory(
+            self._params, self._num_boost_round, self._config, source_path
+        )
+        self._model = result["booster"]
+        self._threshold = result["threshold"]
+        self._feature_names = list(FEATURE_COLUMNS)
+        self._feature_dtypes = {
+            column: COLUMN_DTYPES[column] for column in FEATURE_COLUMNS
+        }
+        return result["eval"]
+
+    @RunningTimeDecorator(logger= model_logger)
+    def update(self, model_dt: str = None) -> Dict:
+        """새로 들어온 데이터만으로 저장된 모델에 tree 를 이어서 학습 (xgb_model continuation)
+            데이터의 마지막 holdout_size 비율(가장 최근 record)을 rolling holdout 으로 두고
+            기존 모델과 갱신된 모델을 같은 holdout 으로 평가
+            학습 비용은 전체 이력이 아닌 새 데이터 크기에 비례
+
+        Args:
+            model_dt (str): 이어서 학습할 모델의 실행 시각, None 이면 가장 최근 모델
+
+        Returns:
+            Dict: 갱신된 모델의 train/holdout 지표와 기존 모델의 holdout 지표
+        """
+        if self._preprocessed_data is None or self._preprocessed_data.empty:
+            raise Exception("preprocessed data is Empty")
+        update_config = self._config["update"]
+
+        self.load_model(model_dt)
+        if isinstance(self._model, BoosterEnsemble):
+            raise Exception("ensemble model update is not supported")
+        base_model = self._model
+        if self.best_iteration is not None:
+            # early stopping 한 모델은 best iteration 까지의 tree 에 이어서 학습
+            base_model = base_model[: self.best_iteration + 1]
+        base_feature_names = self._feature_names
+        self._parent_model_dt = self._model_dt
+
+        self._build_matrix()
+        if self._feature_names != base_feature_names:
+            raise Exception("feature columns do not match the base model")
+
+        # rolling holdout: 가장 최근 record 를 평가용으로 남김
+        n_rows = len(self._target)
+        n_holdout = int(round(n_rows * update_config["holdout_size"]))
+        self._train_pool_idx = np.arange(n_rows - n_holdout)
+        self._test_idx = np.arange(n_rows - n_holdout, n_rows)
+        self._train_idx = self._train_pool_idx
+        if string_to_boolean(str(update_config.get("undersample", True))):
+            self._train_idx = undersample_indices(
+                self._target,
+                self._train_pool_idx,
+                random_state= self._random_state['random_state'],
+            )
+        self._valid_idx = self._bag_pos = None
+        self._valid_input = self._valid_target = None
+        self._train_input = gather_rows(self._features, self._train_idx)
+        self._train_target = gather_rows(self._target, self._train_idx)
+        self._test_input = gather_rows(self._features, self._test_idx)
+        self._test_target = gather_rows(self._target, self._test_idx)
+
+        self._build_model()
+        self._dmatrix = {}
+        self._best_iteration = None
+        self._evals_result = {}
+        self._model = xgb.train(
+            self._params,
+            self._get_dmatrix("train"),
+            num_boost_round= update_config["num_boost_round"],
+            xgb_model= base_model,
+        )
+        model_logger.info(
+            f"update: {self._parent_model_dt} + {update_config['num_boost_round']} trees, "
+            f"train {len(self._train_input)}, holdout {len(self._test_input)}"
+        )
+
+        # 기존 tree 는 다른 분위수 경계로 학습했으므로 DMatrix 대신 배열로 예측
+        eval_metric = classification_metrics(
+            self._train_target,
+            to_label(self._model.inplace_predict(self._train_input), self.threshold),
+            self._test_target,
+            to_label(self._model.inplace_predict(self._test_input), self.threshold),
+        )
+        # 이전 모델의 threshold 를 그대로 사용
+        base = binary_metrics(
+            self._test_target,
+            to_label(base_model.inplace_predict(self._test_input), self.threshold),
+        )
+        eval_metric["Base Accuracy"] = base["accuracy"]
+        eval_metric["Base F1 score"] = base["f1"]
+        return eval_metric
+
     def fit_and_evaluate(self) -> Dict:
         self._split_data()
         self._build_model()
@@ -144,7 +924,8 @@ class Model:
         self._split_data()
         self._build_model()
         self._fit()
-        self.save_model()
+        # 평가에서 고른 threshold 가 저장되도록 평가 후 저장
         self.evaluate_model()
-        return self.predict(self._test_input)
+        self.save_model()
+        return to_label(self._predict_proba("test"), self.threshold)
 
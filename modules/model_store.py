@@ -0,0 +1,147 @@
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple, Union
+
+import xgboost as xgb
+
+from modules.ensemble import BoosterEnsemble
+from modules.utils.file_handler import chk_and_make_dir
+
+store_logger = logging.getLogger("ModelStore")
+
+MODEL_FILE = "model.ubj"
+METADATA_FILE = "metadata.json"
+BAG_FILE = "model_bag{}.ubj"
+
+
+def model_exists(model_path: str) -> bool:
+    """단일 모델 또는 ensemble 모델이 저장되어 있는지 확인"""
+    return os.path.exists(os.path.join(model_path, MODEL_FILE)) or os.path.exists(
+        os.path.join(model_path, BAG_FILE.format(0))
+    )
+
+
+def save_booster(
+    model: Union[xgb.Booster, BoosterEnsemble], model_path: str, metadata: Dict
+) -> None:
+    """모델을 XGBoost binary(UBJSON) 포맷으로, 전처리 메타데이터를 json 으로 저장
+        ensemble 은 bag 별 파일로 저장하고 메타데이터에 bag 정보를 기록
+
+    Args:
+        model (Union[xgb.Booster, BoosterEnsemble]): 학습된 모델
+        model_path (str): 저장할 디렉토리 경로
+        metadata (Dict): feature 순서, dtype, 전처리 규칙 등
+
+    Returns:
+        None
+    """
+    chk_and_make_dir(model_path)
+    if isinstance(model, BoosterEnsemble):
+        files = []
+        for bag, booster in enumerate(model.boosters):
+            files.append(BAG_FILE.format(bag))
+            booster.save_model(os.path.join(model_path, files[-1]))
+        metadata = dict(
+            metadata,
+            ensemble={"files": files, "best_iterations": model.best_iterations},
+        )
+    else:
+        model.save_model(os.path.join(model_path, MODEL_FILE))
+    with open(os.path.join(model_path, METADATA_FILE), "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2, default=str)
+
+
+def load_booster(model_path: str) -> Tuple[Union[xgb.Booster, BoosterEnsemble], Dict]:
+    """save_booster 로 저장한 모델과 메타데이터 불러오기
+
+    Args:
+        model_path (str): 모델 디렉토리 경로
+
+    Returns:
+        Tuple[Union[xgb.Booster, BoosterEnsemble], Dict]: 모델, 메타데이터
+    """
+    metadata = {}
+    metadata_path = os.path.join(model_path, METADATA_FILE)
+    if os.path.exists(metadata_path):
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            metadata = json.load(f)
+
+    ensemble = metadata.get("ensemble")
+    if ensemble:
+        boosters = []
+        for file in ensemble["files"]:
+            booster = xgb.Booster()
+            booster.load_model(os.path.join(model_path, file))
+            boosters.append(booster)
+        return BoosterEnsemble(boosters, ensemble["best_iterations"]), metadata
+
+    model = xgb.Booster()
+    model.load_model(os.path.join(model_path, MODEL_FILE))
+    return model, metadata
+
+
+class ModelPool:
+    """ModelPool class
+        프로세스 안에서 불러온 모델을 LRU 방식으로 보관
+        같은 모델 버전을 여러 번 역직렬화하지 않도록 함
+
+    Attributes:
+        _max_size (int): 보관할 최대 모델 수
+        _items (OrderedDict): key -> (모델, 메타데이터), 최근 사용 순
+    """
+
+    def __init__(self, max_size: int = 4) -> None:
+        self._max_size = max(int(max_size), 1)
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, loader: Callable[[], Any]) -> Any:
+        """key 에 해당하는 모델 반환, 없으면 loader 로 불러와 보관
+
+        Args:
+            key (str): 모델 key (실행 시각)
+            loader (Callable[[], Any]): 모델을 불러오는 함수
+
+        Returns:
+            Any: loader 의 반환값
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+
+        # 역직렬화는 lock 밖에서 수행
+        item = loader()
+        with self._lock:
+            self._items[key] = item
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_size:
+                evicted, _ = self._items.popitem(last=False)
+                store_logger.info("evicted model from pool: " + evicted)
+        return item
+
+    def invalidate(self, key: str = None) -> None:
+        with self._lock:
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+_model_pool = None
+_model_pool_lock = threading.Lock()
+
+
+def get_model_pool(max_size: int = 4) -> ModelPool:
+    """프로세스 공용 ModelPool 반환 (처음 호출 시 생성)"""
+    global _model_pool
+    with _model_pool_lock:
+        if _model_pool is None:
+            _model_pool = ModelPool(max_size)
+        return _model_pool
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import Callable, Dict, List
+
+from modules.utils.dataframe_pool import shutdown_dataframe_pool
+from modules.utils.file_handler import chk_and_make_dir
+from modules.utils.frame_cache import file_fingerprint
+
+pipeline_logger = logging.getLogger("Pipeline")
+
+
+class Stage:
+    """Stage class
+        파이프라인의 한 단계
+
+    Attributes:
+        name (str): 단계 이름
+        func (Callable[[Dict], Dict]): 현재 state 를 받아 새로 만든 값을 dict 로 반환하는 함수
+        config_sections (List[str]): 결과에 영향을 주는 config section
+    """
+
+    def __init__(
+        self, name: str, func: Callable[[Dict], Dict], config_sections: List[str] = None
+    ) -> None:
+        self.name = name
+        self.func = func
+        self.config_sections = config_sections if config_sections is not None else []
+
+
+class Pipeline:
+    """Pipeline class
+        단계별 결과를 입력 fingerprint 로 저장해 두고
+        다시 실행할 때 변경된(또는 완료되지 않은) 첫 단계부터 실행
+
+        단계 i 의 fingerprint = hash(단계 i-1 의 fingerprint, 단계 이름, 단계 config section)
+        첫 단계의 이전 fingerprint 는 입력 데이터 파일의 fingerprint
+
+    Attributes:
+        _config (dict): 전체 config
+        _cache_dir (str): 단계 결과를 저장할 디렉토리
+        _use_cache (bool): 단계 결과 저장/재사용 여부
+        _stages (List[Stage]): 실행할 단계 목록
+    """
+
+    def __init__(self, config: Dict, cache_dir: str, use_cache: bool = True) -> None:
+        self._config = config
+        self._cache_dir = cache_dir
+        self._use_cache = use_cache
+        self._stages = []
+
+    def add_stage(
+        self, name: str, func: Callable[[Dict], Dict], config_sections: List[str] = None
+    ) -> "Pipeline":
+        self._stages.append(Stage(name, func, config_sections))
+        return self
+
+    def source_fingerprint(self, source_path: str) -> str:
+        """입력 파일의 fingerprint
+            크기/수정 시간이 같으면 이전에 계산한 해시를 재사용
+
+        Args:
+            source_path (str): 입력 파일 경로
+
+        Returns:
+            str: 입력 파일 fingerprint
+        """
+        chk_and_make_dir(self._cache_dir)
+        memo_path = os.path.join(self._cache_dir, "source.json")
+        memo = {}
+        if os.path.exists(memo_path):
+            with open(memo_path, "r", encoding="utf-8") as f:
+                memo = json.load(f)
+        fingerprint = file_fingerprint(source_path, memo.get(source_path))
+        memo[source_path] = fingerprint
+        with open(memo_path, "w", encoding="utf-8") as f:
+            json.dump(memo, f, ensure_ascii=False, indent=2)
+        return fingerprint["sha256"]
+
+    def _stage_fingerprints(self, source_fingerprint: str) -> List[str]:
+        fingerprints = []
+        previous = source_fingerprint
+        for stage in self._stages:
+            sections = {
+                section: self._config.get(section) for section in stage.config_sections
+            }
+            payload = json.dumps(
+                [previous, stage.name, sections],
+                sort_keys=True,
+                ensure_ascii=False,
+                default=str,
+            )
+            previous = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            fingerprints.append(previous)
+        return fingerprints
+
+    def _artifact_path(self, stage: Stage, fingerprint: str) -> str:
+        return os.path.join(self._cache_dir, f"{stage.name}_{fingerprint[:16]}.pkl")
+
+    def _keys_path(self, stage: Stage, fingerprint: str) -> str:
+        return os.path.join(self._cache_dir, f"{stage.name}_{fingerprint[:16]}.json")
+
+    def _is_done(self, stage: Stage, fingerprint: str) -> bool:
+        return os.path.exists(self._artifact_path(stage, fingerprint)) and os.path.exists(
+            self._keys_path(stage, fingerprint)
+        )
+
+    def _save(self, stage: Stage, fingerprint: str, output: Dict) -> None:
+        chk_and_make_dir(self._cache_dir)
+        artifact_path = self._artifact_path(stage, fingerprint)
+        with open(artifact_path + ".tmp", "wb") as f:
+            pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(artifact_path + ".tmp", artifact_path)
+        # keys 파일이 있어야 완료된 단계로 판단 (저장 중 종료 대비)
+        with open(self._keys_path(stage, fingerprint), "w", encoding="utf-8") as f:
+            json.dump(sorted(output.keys()), f, ensure_ascii=False)
+
+    def _restore(self, done: int, fingerprints: List[str]) -> Dict:
+        """완료된 단계 결과로 state 복원
+            같은 key 는 가장 마지막 단계 결과만 불러옴
+
+        Args:
+            done (int): 완료된 단계 수
+            fingerprints (List[str]): 단계별 fingerprint
+
+        Returns:
+            Dict: 복원된 state
+        """
+        state = {}
+        loaded_keys = set()
+        for i in reversed(range(done)):
+            stage = self._stages[i]
+            with open(self._keys_path(stage, fingerprints[i]), "r", encoding="utf-8") as f:
+                keys = set(json.load(f))
+            if keys <= loaded_keys:
+                continue
+            with open(self._artifact_path(stage, fingerprints[i]), "rb") as f:
+                output = pickle.load(f)
+            for key in keys - loaded_keys:
+                state[key] = output[key]
+            loaded_keys |= keys
+        return state
+
+    def run(self, source_fingerprint: str, initial_state: Dict = None) -> Dict:
+        """단계를 순서대로 실행
+            저장된 결과가 있는 단계는 건너뛰고, 첫 번째 미완료 단계부터 실행
+
+        Args:
+            source_fingerprint (str): 입력 데이터 fingerprint
+            initial_state (Dict): 모든 단계에 전달할 초기 값 (예: 입력 경로)
+
+        Returns:
+            Dict: 모든 단계의 결과가 합쳐진 state
+        """
+        fingerprints = self._stage_fingerprints(source_fingerprint)
+
+        done = 0
+        if self._use_cache:
+            while done < len(self._stages) and self._is_done(
+                self._stages[done], fingerprints[done]
+            ):
+                done += 1
+
+        state = dict(initial_state or {})
+        if done > 0:
+            state.update(self._restore(done, fingerprints))
+        for stage in self._stages[:done]:
+            pipeline_logger.info(f"stage {stage.name}: cached, skipped")
+
+        try:
+            for stage, fingerprint in zip(self._stages[done:], fingerprints[done:]):
+                pipeline_logger.info(f"stage {stage.name}: running")
+                output = stage.func(state)
+                state.update(output)
+                if self._use_cache:
+                    self._save(stage, fingerprint, output)
+        finally:
+            # 단계들이 공유한 DataFrame worker pool 과 shared memory 정리
+            shutdown_dataframe_pool()
+        return state
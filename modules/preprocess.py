@@ -1,16 +1,62 @@
 import logging
 import os
 import pickle
-from typing import Any, Tuple
+from typing import Any, Iterator, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+from modules.anomaly_rule import AnomalyRuleEngine
 from modules.config import Config
-from modules.utils.decorator import TryDecorator
+from modules.utils.column_spill import ColumnSpill
+from modules.utils.decorator import RunningTimeDecorator, TryDecorator
+from modules.utils.downcast import downcast_dataframe
+from modules.utils.frame_cache import FrameCache
+from modules.utils.functions import string_to_boolean
 
 preprocess_logger = logging.getLogger("Preprocess")
 
+# 모델에 사용하는 변수 (순서 유지)
+USE_COLUMNS = ['성별코드', '신장(5Cm단위)',
+       '체중(5Kg 단위)', '허리둘레', '시력(우)', '청력(좌)', '청력(우)', '수축기 혈압',
+       '이완기 혈압', '식전혈당(공복혈당)', '총 콜레스테롤', '트리글리세라이드', 'HDL 콜레스테롤', 'LDL 콜레스테롤',
+       '혈색소', '요단백', '혈청크레아티닌', '(혈청지오티)AST', '(혈청지오티)ALT', '감마 지티피', '흡연상태',
+       '음주여부']
+
+# 분류 라벨 컬럼
+TARGET_COLUMN = '요단백'
+
+# 모델 입력 변수
+FEATURE_COLUMNS = [column for column in USE_COLUMNS if column != TARGET_COLUMN]
+
+# CSV 읽기 스키마
+# 결측치가 있을 수 있으므로 정수형 코드도 float로 읽음
+# 정수값만 갖는 컬럼은 float32, 소수값(시력 9.9 등 비교 대상)을 갖는 컬럼은 float64
+COLUMN_DTYPES = {
+    '성별코드': 'float32',
+    '신장(5Cm단위)': 'float32',
+    '체중(5Kg 단위)': 'float32',
+    '허리둘레': 'float64',
+    '시력(우)': 'float64',
+    '청력(좌)': 'float32',
+    '청력(우)': 'float32',
+    '수축기 혈압': 'float32',
+    '이완기 혈압': 'float32',
+    '식전혈당(공복혈당)': 'float32',
+    '총 콜레스테롤': 'float32',
+    '트리글리세라이드': 'float32',
+    'HDL 콜레스테롤': 'float32',
+    'LDL 콜레스테롤': 'float32',
+    '혈색소': 'float64',
+    '요단백': 'float32',
+    '혈청크레아티닌': 'float64',
+    '(혈청지오티)AST': 'float32',
+    '(혈청지오티)ALT': 'float32',
+    '감마 지티피': 'float32',
+    '흡연상태': 'float32',
+    '음주여부': 'float32',
+}
+
 class Preprocess:
     """ Preprocess class
     
@@ -36,65 +82,199 @@ class Preprocess:
     def raw_data(self, value):
         self._raw_data = value
 
+    @property
+    def preprocessed_data(self):
+        return self._preprocessed_data
+
     def __init__(self) -> None:
         self._config = Config.instance().config
+        self._anomaly_rule = AnomalyRuleEngine.from_config(self._config)
 
-    def load_data(self):
-        self._raw_data = pd.read_csv(
-            os.path.join(self._config["path"]['data'], 'data.csv')
-        , encoding= 'utf-8')
-        pass
+    def _read_csv(self, source_path: str) -> pd.DataFrame:
+        return pd.read_csv(
+            source_path,
+            encoding= 'utf-8',
+            usecols= USE_COLUMNS,
+            dtype= COLUMN_DTYPES,
+        )
 
-    def drop_anomalies(self):
-        # 특별한 이상치 처리(전체 dataset에 적용)
+    @RunningTimeDecorator(logger= preprocess_logger)
+    def load_data(self, source_path: str = None):
+        if source_path is None:
+            source_path = os.path.join(self._config["path"]['data'], 'data.csv')
+        cache_config = self._config.get("cache", {})
+        if not string_to_boolean(str(cache_config.get("use_cache", "false"))):
+            self._raw_data = self._read_csv(source_path)
+            return
 
-        if '청력(우)' in self._raw_data.columns:
-            idx = self._raw_data[self._raw_data['청력(우)'] == 3].index
-            self._raw_data.drop(index = idx, inplace= True)
+        cache = FrameCache(
+            self._config["path"]["cache"], cache_config.get("format", "parquet")
+        )
+        try:
+            self._raw_data = cache.load(source_path, USE_COLUMNS, COLUMN_DTYPES)
+        except ImportError as e:
+            preprocess_logger.warning("cache disabled: " + str(e))
+            self._raw_data = self._read_csv(source_path)
+            return
 
-        if '청력(좌)' in self._raw_data.columns:
-            idx = self._raw_data[self._raw_data['청력(좌)'] == 3].index
-            self._raw_data.drop(index = idx, inplace= True)
+        if self._raw_data is None:
+            self._raw_data = self._read_csv(source_path)
+            try:
+                cache.save(self._raw_data, source_path, USE_COLUMNS, COLUMN_DTYPES)
+            except ImportError as e:
+                preprocess_logger.warning("cache disabled: " + str(e))
 
-        if ('시력(우)' in self._raw_data.columns):
-            self._raw_data.loc[(self._raw_data['시력(우)'] == 9.9),'시력(우)'] = 0
-        
-        if '시력(좌)' in self._raw_data.columns:
-            self._raw_data.loc[(self._raw_data['시력(좌)'] == 9.9),'시력(좌)'] = 0
+    def drop_anomalies(self, data: pd.DataFrame) -> pd.DataFrame:
+        # 특별한 이상치 처리(전체 dataset에 적용)
+        # config 의 anomaly_rule 규칙을 하나의 mask 와 한 번의 대체로 적용
+        return self._anomaly_rule.apply(data)
 
-        if '허리둘레' in self._raw_data.columns:
-            idx = self._raw_data[(self._raw_data['허리둘레'] == 999.0) | (self._raw_data['허리둘레'] == 680.0)].index
-            self._raw_data.drop(index = idx, inplace= True)
-            
-        self._raw_data = self._raw_data.reset_index(drop = True)
+    def transform(self, data: pd.DataFrame, columns: List[str] = None) -> pd.DataFrame:
+        """변수 선택, 분류 라벨, 결측치/이상치 처리
+            행 단위 처리만 하므로 전체 데이터와 chunk 에 동일하게 적용 가능
+            index 는 유지 (chunk 의 경우 원본 CSV 의 행 번호)
 
-    def preprocess(self) -> None:
+        Args:
+            data (pd.DataFrame): 처리할 데이터
+            columns (List[str]): 선택할 변수, None 이면 USE_COLUMNS
+                (라벨이 없는 예측용 데이터는 FEATURE_COLUMNS)
+
+        Returns:
+            pd.DataFrame: 처리된 데이터
+        """
+        if columns is None:
+            columns = USE_COLUMNS
 
         # 변수 선택
-        self._raw_data = self._raw_data[['성별코드', '신장(5Cm단위)',
-       '체중(5Kg 단위)', '허리둘레', '시력(우)', '청력(좌)', '청력(우)', '수축기 혈압',
-       '이완기 혈압', '식전혈당(공복혈당)', '총 콜레스테롤', '트리글리세라이드', 'HDL 콜레스테롤', 'LDL 콜레스테롤',
-       '혈색소', '요단백', '혈청크레아티닌', '(혈청지오티)AST', '(혈청지오티)ALT', '감마 지티피', '흡연상태',
-       '음주여부']]
+        if list(data.columns) != columns:
+            data = data[columns].copy()
 
         # 분류 라벨
-        self._raw_data.loc[(self._raw_data['요단백'] == 1),'요단백'] = 0
-        self._raw_data.loc[(self._raw_data['요단백'] != 0),'요단백'] = 1
+        if TARGET_COLUMN in data.columns:
+            data.loc[(data['요단백'] == 1),'요단백'] = 0
+            data.loc[(data['요단백'] != 0),'요단백'] = 1
 
         # 이상치, 결측치 처리
-        self._raw_data.dropna(inplace = True)
-        self.drop_anomalies()
+        data.dropna(inplace = True)
+        return self.drop_anomalies(data)
 
-        self._preprocessed_data = self._raw_data
+    def read_chunks(
+        self, source_path: str, chunk_size: int, columns: List[str] = None
+    ) -> Iterator[pd.DataFrame]:
+        """CSV 를 필요한 컬럼만 선언된 dtype 으로 chunk 단위로 읽기
+
+        Args:
+            source_path (str): CSV 경로
+            chunk_size (int): chunk 당 행 수
+            columns (List[str]): 읽을 컬럼, None 이면 USE_COLUMNS
+
+        Returns:
+            Iterator[pd.DataFrame]: 원본 chunk (index 는 원본 CSV 의 행 번호)
+        """
+        if columns is None:
+            columns = USE_COLUMNS
+        reader = pd.read_csv(
+            source_path,
+            encoding= 'utf-8',
+            usecols= columns,
+            dtype= {column: COLUMN_DTYPES[column] for column in columns},
+            chunksize= chunk_size,
+        )
+        with reader:
+            for chunk in reader:
+                yield chunk
+
+    def iter_chunks(
+        self, chunk_size: int = None, source_path: str = None, columns: List[str] = None
+    ) -> Iterator[pd.DataFrame]:
+        """CSV 를 chunk 단위로 읽어 전처리된 chunk 를 순차적으로 반환
+            메모리 사용량은 전체 데이터가 아닌 chunk 크기에 비례
+
+        Args:
+            chunk_size (int): chunk 당 행 수, None 이면 config 의 preprocess.chunk_size
+            source_path (str): CSV 경로, None 이면 config 의 data 경로의 data.csv
+            columns (List[str]): 선택할 변수, None 이면 USE_COLUMNS
+
+        Returns:
+            Iterator[pd.DataFrame]: 전처리된 chunk (index 는 원본 CSV 의 행 번호)
+        """
+        if chunk_size is None:
+            chunk_size = self._config["preprocess"]["chunk_size"]
+        if source_path is None:
+            source_path = os.path.join(self._config["path"]['data'], 'data.csv')
+        self._raw_count = 0
+        for chunk in self.read_chunks(source_path, chunk_size, columns):
+            self._raw_count += len(chunk)
+            yield self.transform(chunk, columns)
+
+    @RunningTimeDecorator(logger= preprocess_logger)
+    def preprocess(self) -> None:
+        self._raw_count = len(self._raw_data)
+        self._preprocessed_data = self.transform(self._raw_data).reset_index(
+            drop = True
+        )
+        self._downcast()
+        self._raw_data = self._preprocessed_data
+        self._log_count()
+
+    @RunningTimeDecorator(logger= preprocess_logger)
+    def preprocess_streaming(self, source_path: str = None) -> None:
+        """CSV 를 chunk 단위로 읽어 전처리
+            전처리한 chunk 는 cache 디렉토리의 컬럼별 임시 파일에 쓰고 바로 해제하므로
+            읽고 전처리하는 동안 메모리는 chunk 크기에 비례
+            마지막에 결과 데이터 (전체 컬럼 값 범위로 고른 dtype, 메모리 내 처리와 동일) 와
+            chunk 하나 크기의 읽기 buffer 를 사용
+            결과를 메모리에 올리지 않고 처리하려면 iter_chunks 사용
+
+        Args:
+            source_path (str): CSV 경로, None 이면 config 의 data 경로의 data.csv
+
+        Returns:
+            None
+        """
+        with ColumnSpill(self._config["path"]["cache"]) as spill:
+            for chunk in self.iter_chunks(source_path= source_path):
+                spill.append(chunk)
+            self._preprocessed_data = spill.load(self._use_downcast(), preprocess_logger)
+        if self._preprocessed_data is None:
+            raise Exception("data is Empty")
+        self._raw_data = self._preprocessed_data
+        self._log_count()
+
+    def _use_downcast(self) -> bool:
+        return string_to_boolean(
+            str(self._config.get("preprocess", {}).get("downcast", "false"))
+        )
+
+    def _downcast(self) -> None:
+        # 코드/라벨은 작은 정수형, 측정치는 float32 로 변환
+        if self._use_downcast():
+            self._preprocessed_data = downcast_dataframe(
+                self._preprocessed_data, preprocess_logger
+            )
+
+    def _log_count(self) -> None:
         preprocess_logger.info("Model Data Count-------------------------------------")
-        preprocess_logger.info("raw dataset        : " + str(len(self._raw_data)))
+        preprocess_logger.info("raw dataset        : " + str(self._raw_count))
         preprocess_logger.info(
             "preprocessed dataset  : " + str(len(self._preprocessed_data))
         )
+        for rule_name, count in self._anomaly_rule.report():
+            preprocess_logger.info(f"anomaly dropped    : {count} ({rule_name})")
         preprocess_logger.info("-----------------------------------------------------")
-        pass
 
-    def run(self) -> Any:
-        self.load_data()
-        self.preprocess()
-        return self._preprocessed_data
\ No newline at end of file
+    def run(self, source_path: str = None) -> Any:
+        """CSV 를 읽어 전처리
+
+        Args:
+            source_path (str): CSV 경로, None 이면 config 의 data 경로의 data.csv
+
+        Returns:
+            Any: 전처리된 데이터
+        """
+        if self._config.get("preprocess", {}).get("chunk_size", 0) > 0:
+            self.preprocess_streaming(source_path)
+        else:
+            self.load_data(source_path)
+            self.preprocess()
+        return self._preprocessed_data
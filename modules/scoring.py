@@ -0,0 +1,144 @@
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import cpu_count
+
+import pandas as pd
+
+from modules.config import Config
+from modules.preprocess import FEATURE_COLUMNS, Preprocess
+from modules.tree_predictor import NPZ_FILE, NumpyTreePredictor
+from modules.utils.file_handler import get_last_path
+
+scoring_logger = logging.getLogger("Scoring")
+
+# 예측 엔진: numpy 는 trees.npz 만 사용 (xgboost 를 불러오지 않음)
+ENGINES = ("auto", "numpy", "xgboost")
+
+# worker 프로세스마다 한 번만 생성
+_worker_preprocess = None
+_worker_model = None
+_worker_predictor = None
+
+
+def model_dir(model_dt: str = None) -> str:
+    """output/<model_dt>/model 경로 (model_dt 가 None 이면 가장 최근 모델)"""
+    output_path = Config.instance().config["path"]["output"]
+    if model_dt is None:
+        # benchmark, profile 등 모델이 없는 디렉토리는 제외
+        model_dt = os.path.basename(
+            os.path.dirname(get_last_path(output_path, type="/model", by="name"))
+        )
+    return os.path.join(output_path, model_dt, "model")
+
+
+def resolve_engine(engine: str, model_dt: str = None) -> str:
+    """auto 이면 trees.npz 가 있을 때 numpy, 없으면 xgboost"""
+    if engine not in ENGINES:
+        raise ValueError(f"unknown engine: {engine}")
+    if engine == "auto":
+        has_npz = os.path.exists(os.path.join(model_dir(model_dt), NPZ_FILE))
+        return "numpy" if has_npz else "xgboost"
+    return engine
+
+
+def _init_worker(config_path: str, model_dt: str, engine: str = "xgboost") -> None:
+    """worker 초기화: config 와 모델을 프로세스당 한 번만 불러옴"""
+    global _worker_preprocess, _worker_model, _worker_predictor
+    try:
+        Config.instance(config_path)
+    except TypeError:
+        # fork 로 생성된 경우 부모의 Config 가 이미 초기화되어 있음
+        pass
+    _worker_preprocess = Preprocess()
+    if engine == "numpy":
+        _worker_predictor = NumpyTreePredictor.load(
+            os.path.join(model_dir(model_dt), NPZ_FILE)
+        )
+    else:
+        # xgboost, sklearn 은 xgboost 엔진을 사용할 때만 불러옴
+        from modules.model import Model
+
+        _worker_model = Model(None)
+        _worker_model.load_model(model_dt)
+
+
+def _score_chunk(chunk: pd.DataFrame) -> pd.DataFrame:
+    """chunk 전처리 후 예측 (worker 에서 실행)
+
+    Args:
+        chunk (pd.DataFrame): 원본 chunk
+
+    Returns:
+        pd.DataFrame: row_id (원본 데이터 행 번호), probability, label
+    """
+    data = _worker_preprocess.transform(chunk, FEATURE_COLUMNS)
+    if _worker_predictor is not None:
+        proba, label = _worker_predictor.predict_batch(data)
+    else:
+        # 프로세스 수만큼 병렬 처리하므로 XGBoost 는 단일 thread 로 예측
+        proba, label = _worker_model.predict_batch(data, n_jobs=1)
+    return pd.DataFrame({"row_id": data.index, "probability": proba, "label": label})
+
+
+def score_csv(
+    input_path: str,
+    output_path: str,
+    model_dt: str = None,
+    chunk_size: int = 100000,
+    workers: int = None,
+    config_path: str = os.path.join("config", "config.ini"),
+    engine: str = "xgboost",
+) -> int:
+    """CSV 를 chunk 단위로 읽어 process pool 에서 예측하고 입력 순서대로 결과 저장
+        동시에 처리 중인 chunk 수를 제한해 메모리 사용량을 일정하게 유지
+        drop 규칙에 해당하거나 결측치가 있는 행은 결과에서 제외
+
+    Args:
+        input_path (str): 입력 CSV 경로
+        output_path (str): 결과 CSV 경로
+        model_dt (str): 모델 실행 시각, None 이면 가장 최근 모델
+        chunk_size (int): chunk 당 행 수
+        workers (int): worker 프로세스 수, None 이면 cpu 수 - 1
+        config_path (str): worker 에서 불러올 config 경로
+        engine (str): 예측 엔진 (auto, numpy, xgboost)
+
+    Returns:
+        int: 예측한 행 수
+    """
+    if workers is None or workers <= 0:
+        workers = max(cpu_count() - 1, 1)
+    max_in_flight = workers * 2
+    engine = resolve_engine(engine, model_dt)
+    scoring_logger.info(f"scoring engine: {engine}")
+
+    preprocess = Preprocess()
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    n_scored = 0
+    pending = deque()
+
+    def write(result: pd.DataFrame) -> None:
+        result.to_csv(
+            output_path, mode="a", header=not os.path.exists(output_path), index=False
+        )
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(config_path, model_dt, engine)
+    ) as executor:
+        for chunk in preprocess.read_chunks(input_path, chunk_size, FEATURE_COLUMNS):
+            pending.append(executor.submit(_score_chunk, chunk))
+            # 앞선 chunk 부터 순서대로 기록
+            while len(pending) >= max_in_flight:
+                result = pending.popleft().result()
+                write(result)
+                n_scored += len(result)
+        while pending:
+            result = pending.popleft().result()
+            write(result)
+            n_scored += len(result)
+
+    scoring_logger.info(f"scored rows: {n_scored} -> {output_path}")
+    return n_scored
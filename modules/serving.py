@@ -0,0 +1,326 @@
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from modules.anomaly_rule import AnomalyRuleEngine
+from modules.model import Model
+
+serving_logger = logging.getLogger("Serving")
+
+HTTP_STATUS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class ServingMetrics:
+    """ServingMetrics class
+        micro-batch 크기, 대기열 길이, 요청 지연 시간 기록
+
+    Attributes:
+        _batch_sizes (deque): 최근 batch 의 행 수
+        _latencies (deque): 최근 요청의 처리 시간 (초)
+        queue_depth (int): 대기 중인 행 수
+    """
+
+    def __init__(self, window: int = 10000) -> None:
+        self._batch_sizes = deque(maxlen=window)
+        self._latencies = deque(maxlen=window)
+        self.queue_depth = 0
+        self.request_count = 0
+        self.row_count = 0
+        self.rejected_count = 0
+        self.batch_count = 0
+
+    def record_batch(self, size: int) -> None:
+        self.batch_count += 1
+        self._batch_sizes.append(size)
+
+    def record_request(self, latency: float, n_rows: int, n_rejected: int) -> None:
+        self.request_count += 1
+        self.row_count += n_rows
+        self.rejected_count += n_rejected
+        self._latencies.append(latency)
+
+    def snapshot(self) -> Dict:
+        latencies = np.asarray(self._latencies, dtype=np.float64) * 1000
+        batch_sizes = np.asarray(self._batch_sizes, dtype=np.float64)
+        return {
+            "requests": self.request_count,
+            "rows": self.row_count,
+            "rejected_rows": self.rejected_count,
+            "batches": self.batch_count,
+            "queue_depth": self.queue_depth,
+            "batch_size_mean": float(batch_sizes.mean()) if len(batch_sizes) else 0.0,
+            "batch_size_max": int(batch_sizes.max()) if len(batch_sizes) else 0,
+            "latency_ms_p50": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "latency_ms_p99": float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+        }
+
+
+class RecordPreprocessor:
+    """RecordPreprocessor class
+        학습 시 Preprocess 와 같은 컬럼 선택과 sentinel 처리를 요청 record 에 적용
+        drop 규칙에 해당하거나 결측치가 있는 record 는 예측하지 않고 거부
+
+    Attributes:
+        _feature_names (List[str]): 모델 입력 컬럼 (순서 포함)
+        _anomaly_rule (AnomalyRuleEngine): 모델 학습 시 사용한 이상치 규칙
+    """
+
+    def __init__(self, feature_names: List[str], anomaly_rule: Dict) -> None:
+        self._feature_names = feature_names
+        self._anomaly_rule = AnomalyRuleEngine.from_config({"anomaly_rule": anomaly_rule})
+
+    def transform(self, records: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """record 목록을 모델 입력 행렬로 변환
+
+        Args:
+            records (List[Dict]): 컬럼명 -> 값
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 예측할 행렬 (float32), record 별 수락 여부
+        """
+        data = pd.DataFrame.from_records(records)
+        missing = [column for column in self._feature_names if column not in data.columns]
+        if missing:
+            raise ValueError("missing columns: " + ", ".join(missing))
+        data = data[self._feature_names].apply(pd.to_numeric, errors="coerce")
+
+        accepted = ~(data.isna().to_numpy().any(axis=1) | self._anomaly_rule.drop_mask(data))
+        data = self._anomaly_rule.replace(data.take(np.flatnonzero(accepted)))
+        return data.to_numpy(dtype=np.float32), accepted
+
+
+class MicroBatcher:
+    """MicroBatcher class
+        동시에 들어온 요청을 모아 한 번에 예측
+        max_batch_size 행이 모이거나 첫 요청 후 max_wait_ms 가 지나면 batch 실행
+
+    Attributes:
+        _model (Model): 예측에 사용할 모델
+        _max_batch_size (int): batch 최대 행 수
+        _max_wait (float): batch 를 모으는 최대 대기 시간 (초)
+        _metrics (ServingMetrics): 서빙 지표
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        max_batch_size: int,
+        max_wait_ms: float,
+        metrics: ServingMetrics,
+    ) -> None:
+        self._model = model
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._metrics = metrics
+        self._queue = asyncio.Queue()
+        self._worker = None
+
+    def start(self) -> None:
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    async def predict(self, matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """행렬을 대기열에 넣고 예측 결과를 기다림
+
+        Args:
+            matrix (np.ndarray): 예측할 행렬
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 양성 확률, 예측 라벨
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._metrics.queue_depth += len(matrix)
+        await self._queue.put((matrix, future))
+        return await future
+
+    async def _collect(self) -> List:
+        items = [await self._queue.get()]
+        n_rows = len(items[0][0])
+        deadline = time.perf_counter() + self._max_wait
+        while n_rows < self._max_batch_size:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            items.append(item)
+            n_rows += len(item[0])
+        return items
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            items = await self._collect()
+            sizes = [len(matrix) for matrix, _ in items]
+            self._metrics.queue_depth -= sum(sizes)
+            self._metrics.record_batch(sum(sizes))
+            try:
+                batch = np.concatenate([matrix for matrix, _ in items])
+                # 예측은 event loop 를 막지 않도록 thread 에서 실행
+                proba, label = await loop.run_in_executor(
+                    None, self._model.predict_batch, batch
+                )
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            start = 0
+            for (_, future), size in zip(items, sizes):
+                if not future.done():
+                    future.set_result((proba[start : start + size], label[start : start + size]))
+                start += size
+
+
+class InferenceServer:
+    """InferenceServer class
+        asyncio 기반 HTTP 서버
+        POST /predict : {"records": [{컬럼명: 값, ...}, ...]} 예측
+        GET /metrics  : batch 크기, 대기열 길이, p50/p99 지연 시간
+        GET /health   : 상태 확인
+
+    Attributes:
+        _model (Model): 불러온 모델
+        _config (dict): serving config section
+    """
+
+    MAX_BODY_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, model: Model, metadata: Dict, serving_config: Dict) -> None:
+        self._model = model
+        self._config = serving_config
+        self._metrics = ServingMetrics()
+        self._preprocessor = RecordPreprocessor(
+            metadata["feature_names"], metadata.get("anomaly_rule", {})
+        )
+        self._batcher = MicroBatcher(
+            model,
+            int(serving_config.get("max_batch_size", 256)),
+            float(serving_config.get("max_wait_ms", 5)),
+            self._metrics,
+        )
+
+    async def serve_forever(self) -> None:
+        host = self._config.get("host", "127.0.0.1")
+        port = int(self._config.get("port", 8080))
+        self._batcher.start()
+        server = await asyncio.start_server(self._handle_connection, host, port)
+        serving_logger.info(f"serving on {host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self._batcher.stop()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > self.MAX_BODY_SIZE:
+                    await self._respond(writer, 413, {"error": "payload too large"})
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self._route(method, path, body)
+                await self._respond(writer, status, payload)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes) -> Tuple[int, Dict]:
+        if path == "/metrics":
+            return 200, self._metrics.snapshot()
+        if path == "/health":
+            return 200, {"status": "ok"}
+        if path != "/predict":
+            return 404, {"error": "not found"}
+        if method != "POST":
+            return 405, {"error": "method not allowed"}
+        return await self._predict(body)
+
+    async def _predict(self, body: bytes) -> Tuple[int, Dict]:
+        start = time.perf_counter()
+        try:
+            request = json.loads(body)
+            records = request["records"] if isinstance(request, dict) else request
+            if isinstance(records, dict):
+                records = [records]
+            matrix, accepted = self._preprocessor.transform(records)
+        except (KeyError, TypeError, ValueError) as e:
+            return 400, {"error": str(e)}
+
+        try:
+            if len(matrix):
+                proba, label = await self._batcher.predict(matrix)
+            else:
+                proba, label = np.empty(0), np.empty(0)
+        except Exception as e:
+            serving_logger.error("prediction failed: " + str(e))
+            return 500, {"error": "prediction failed"}
+
+        probabilities = [None] * len(accepted)
+        labels = [None] * len(accepted)
+        for position, p, l in zip(np.flatnonzero(accepted), proba, label):
+            probabilities[position] = float(p)
+            labels[position] = int(l)
+
+        n_rejected = int((~accepted).sum())
+        self._metrics.record_request(time.perf_counter() - start, len(accepted), n_rejected)
+        return 200, {
+            "probability": probabilities,
+            "label": labels,
+            "accepted": accepted.tolist(),
+        }
+
+    async def _respond(
+        self, writer: asyncio.StreamWriter, status: int, payload: Dict
+    ) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        header = (
+            f"HTTP/1.1 {status} {HTTP_STATUS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        )
+        writer.write(header.encode("latin-1") + body)
+        await writer.drain()
@@ -0,0 +1,133 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from modules.preprocess import COLUMN_DTYPES, USE_COLUMNS
+
+# 생성 규칙이 바뀌면 올려서 이전에 만든 파일을 재사용하지 않도록 함
+SYNTHETIC_VERSION = 1
+
+# block 단위로 seed 를 나눠 행 수와 무관하게 같은 행은 항상 같은 값
+BLOCK_SIZE = 1_000_000
+
+# (평균, 표준편차) 정규분포로 만드는 검사 수치
+_NORMAL_COLUMNS = {
+    '수축기 혈압': (122, 14),
+    '이완기 혈압': (76, 10),
+    '식전혈당(공복혈당)': (100, 22),
+    '총 콜레스테롤': (195, 35),
+    '트리글리세라이드': (130, 80),
+    'HDL 콜레스테롤': (56, 14),
+    'LDL 콜레스테롤': (113, 33),
+    '(혈청지오티)AST': (26, 10),
+    '(혈청지오티)ALT': (25, 15),
+    '감마 지티피': (35, 40),
+}
+
+# 결측치를 넣을 컬럼과 비율
+_NAN_RATES = {
+    '허리둘레': 0.002,
+    'HDL 콜레스테롤': 0.01,
+    'LDL 콜레스테롤': 0.01,
+    '혈색소': 0.001,
+    '요단백': 0.005,
+    '흡연상태': 0.001,
+}
+
+
+def _sentinel(rng: np.random.Generator, values: np.ndarray, rate: float, sentinel: float) -> None:
+    values[rng.random(len(values)) < rate] = sentinel
+
+
+def _generate_block(n_rows: int, seed: int, block: int) -> pd.DataFrame:
+    rng = np.random.default_rng([seed, block])
+    data = {}
+    sex = rng.integers(1, 3, n_rows)
+    data['성별코드'] = sex
+    data['신장(5Cm단위)'] = np.where(
+        sex == 1, rng.integers(33, 38, n_rows), rng.integers(30, 34, n_rows)
+    ) * 5
+    data['체중(5Kg 단위)'] = rng.integers(9, 19, n_rows) * 5
+
+    waist = rng.normal(82, 9, n_rows).round(1)
+    _sentinel(rng, waist, 0.0005, 999.0)
+    _sentinel(rng, waist, 0.0002, 680.0)
+    data['허리둘레'] = waist
+
+    vision = rng.choice([0.3, 0.5, 0.7, 0.8, 0.9, 1.0, 1.2, 1.5], n_rows)
+    _sentinel(rng, vision, 0.004, 9.9)
+    data['시력(우)'] = vision
+
+    for column in ('청력(좌)', '청력(우)'):
+        hearing = np.where(rng.random(n_rows) < 0.03, 2.0, 1.0)
+        _sentinel(rng, hearing, 0.0005, 3.0)
+        data[column] = hearing
+
+    for column, (mean, std) in _NORMAL_COLUMNS.items():
+        data[column] = np.abs(rng.normal(mean, std, n_rows)).round()
+    data['혈색소'] = rng.normal(14.2, 1.5, n_rows).round(1)
+    creatinine = np.abs(rng.normal(0.9, 0.25, n_rows)).round(1)
+    data['혈청크레아티닌'] = creatinine
+    data['흡연상태'] = rng.choice([1, 2, 3], n_rows, p=[0.6, 0.2, 0.2])
+    data['음주여부'] = rng.integers(0, 2, n_rows)
+
+    # 요단백: 크레아티닌, 혈당, 혈압이 높을수록 이상(2~6) 확률 증가, 약 6% 가 이상
+    logit = (
+        -3.2
+        + 2.0 * (creatinine - 0.9)
+        + 0.02 * (data['식전혈당(공복혈당)'] - 100)
+        + 0.02 * (data['수축기 혈압'] - 122)
+    )
+    abnormal = rng.random(n_rows) < 1 / (1 + np.exp(-logit))
+    data['요단백'] = np.where(
+        abnormal, rng.choice([2, 3, 4, 5, 6], n_rows, p=[0.55, 0.25, 0.12, 0.06, 0.02]), 1
+    )
+
+    frame = pd.DataFrame({column: data[column] for column in USE_COLUMNS})
+    frame = frame.astype(COLUMN_DTYPES)
+    for column, rate in _NAN_RATES.items():
+        frame.loc[rng.random(n_rows) < rate, column] = np.nan
+    return frame
+
+
+def generate_screening_data(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """건강검진 데이터 스키마(USE_COLUMNS)를 따르는 합성 데이터 생성
+        sentinel(시력 9.9, 허리둘레 999/680, 청력 3), 결측치, 클래스 불균형 포함
+
+    Args:
+        n_rows (int): 행 수
+        seed (int): 난수 seed
+
+    Returns:
+        pd.DataFrame: 합성 데이터 (COLUMN_DTYPES)
+    """
+    blocks = [
+        _generate_block(min(BLOCK_SIZE, n_rows - start), seed, start // BLOCK_SIZE)
+        for start in range(0, n_rows, BLOCK_SIZE)
+    ]
+    return pd.concat(blocks, ignore_index=True)
+
+
+def write_screening_csv(path: str, n_rows: int, seed: int = 42) -> str:
+    """합성 데이터를 block 단위로 CSV 에 기록 (메모리 사용량은 block 크기에 비례)
+        같은 행 수와 seed 로 이미 만든 파일이 있으면 다시 만들지 않음
+
+    Args:
+        path (str): CSV 경로
+        n_rows (int): 행 수
+        seed (int): 난수 seed
+
+    Returns:
+        str: CSV 경로
+    """
+    if os.path.exists(path):
+        return path
+    temp_path = path + ".tmp"
+    for start in range(0, n_rows, BLOCK_SIZE):
+        block = _generate_block(min(BLOCK_SIZE, n_rows - start), seed, start // BLOCK_SIZE)
+        block.to_csv(
+            temp_path, mode="w" if start == 0 else "a", header=start == 0, index=False
+        )
+    os.replace(temp_path, path)
+    return path
@@ -0,0 +1,144 @@
+import logging
+import os
+from typing import Dict
+
+from modules.config import Config
+from modules.das_mlflow import DasMlflow
+from modules.model import Model
+from modules.pipeline import Pipeline
+from modules.postprocess import Postprocess
+from modules.preprocess import Preprocess
+from modules.utils.functions import string_to_boolean
+from modules.utils.stage_metrics import get_registry
+
+training_logger = logging.getLogger("Training")
+
+
+def preprocess_stage(state: dict) -> dict:
+    preprocess = Preprocess()
+    return {"preprocessed_data": preprocess.run(state.get("source_path"))}
+
+
+def split_stage(state: dict) -> dict:
+    model = Model(state["preprocessed_data"])
+    model.split_data()
+    return {"model": model}
+
+
+def fit_stage(state: dict) -> dict:
+    model = state["model"]
+    model.fit()
+    return {"model": model}
+
+
+def evaluate_stage(state: dict) -> dict:
+    config = Config.instance().config
+    eval_metric = state["model"].evaluate_model()
+    if state["model"].best_iteration is not None:
+        eval_metric["Best iteration"] = state["model"].best_iteration
+    # 교차 검증 지표는 평균/표준편차를 함께 기록
+    if string_to_boolean(str(config["cross_validation"]["enabled"])):
+        # cache 에서 복원한 모델은 입력 데이터가 없으므로 전처리 단계 결과를 함께 전달
+        eval_metric.update(
+            state["model"].cross_validate(
+                preprocessed_data=state.get("preprocessed_data")
+            )["aggregate"]
+        )
+    # 평가에서 고른 threshold 가 저장되도록 모델도 함께 반환
+    return {"eval": eval_metric, "model": state["model"]}
+
+
+def fit_external_memory_stage(state: dict) -> dict:
+    model = Model(None)
+    eval_metric = model.fit_external_memory(state.get("source_path"))
+    return {"model": model, "eval": eval_metric}
+
+
+def save_stage(state: dict) -> dict:
+    return {"model_path": state["model"].save_model()}
+
+
+def log_stage(state: dict) -> dict:
+    config = Config.instance().config
+    mlflow = DasMlflow(config["mlflow"]["experiment_name"], state["model"])
+    return {"predicted_data": mlflow.run(state["eval"])}
+
+
+def postprocess_stage(state: dict) -> dict:
+    postprocess = Postprocess(state["predicted_data"])
+    return {"result": postprocess.run()}
+
+
+def build_pipeline(config: Dict) -> Pipeline:
+    """학습 파이프라인 구성 (단계별 결과를 저장해 두고, 변경된 단계부터 다시 실행)"""
+    pipeline = Pipeline(
+        config,
+        os.path.join(config["path"]["cache"], "pipeline"),
+        use_cache=string_to_boolean(str(config["pipeline"]["use_cache"])),
+    )
+    if string_to_boolean(str(config["external_memory"]["enabled"])):
+        # 데이터 전체를 메모리에 올리지 않고 chunk 단위로 학습/평가
+        pipeline.add_stage(
+            "fit_external_memory",
+            fit_external_memory_stage,
+            [
+                "preprocess",
+                "anomaly_rule",
+                "external_memory",
+                "random_state",
+                "hyper_parameter",
+                "model",
+            ],
+        )
+    else:
+        pipeline.add_stage("preprocess", preprocess_stage, ["preprocess", "anomaly_rule"])
+        pipeline.add_stage(
+            "split",
+            split_stage,
+            ["random_state", "early_stopping", "ensemble", "threshold"],
+        )
+        pipeline.add_stage(
+            "fit",
+            fit_stage,
+            ["hyper_parameter", "model", "early_stopping", "ensemble"],
+        )
+        pipeline.add_stage(
+            "evaluate", evaluate_stage, ["threshold", "cross_validation"]
+        )
+    pipeline.add_stage("save", save_stage, ["path", "model"])
+    pipeline.add_stage("log", log_stage, ["mlflow"])
+    pipeline.add_stage("postprocess", postprocess_stage)
+    return pipeline
+
+
+def run_training(config: Dict, source_path: str = None) -> Dict:
+    """학습 파이프라인 실행 후 단계별 실행 시간, 메모리 요약을 모델 옆에 저장
+
+    Args:
+        config (Dict): 설정
+        source_path (str): 학습 데이터 CSV 경로, None 이면 <data>/data.csv
+
+    Returns:
+        Dict: 파이프라인 state (result, model_path, stage_metrics_path 포함)
+    """
+    # 단계별 측정 설정 (tracemalloc, cProfile 은 느려지므로 선택 사항)
+    profiling = config["profiling"]
+    get_registry().configure(
+        tracemalloc=string_to_boolean(str(profiling["tracemalloc"])),
+        profile_dir=profiling["profile_dir"]
+        if string_to_boolean(str(profiling["cprofile"]))
+        else None,
+    )
+
+    if source_path is None:
+        source_path = os.path.join(config["path"]["data"], "data.csv")
+    pipeline = build_pipeline(config)
+    state = pipeline.run(
+        pipeline.source_fingerprint(source_path), {"source_path": source_path}
+    )
+
+    state["stage_metrics_path"] = get_registry().export_json(
+        os.path.join(os.path.dirname(state["model_path"]), "stage_metrics.json")
+    )
+    training_logger.info(f"stage metrics: {state['stage_metrics_path']}")
+    return state
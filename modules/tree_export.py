@@ -0,0 +1,121 @@
+import json
+import math
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+import xgboost as xgb
+
+from modules.ensemble import BoosterEnsemble
+from modules.tree_predictor import LOGISTIC_OBJECTIVES
+
+
+def _base_margin(learner: Dict) -> float:
+    """base_score(확률)를 margin 으로 변환"""
+    # xgboost 버전에 따라 "5E-1" 또는 "[5E-1]" 형식
+    base_score = float(str(learner["learner_model_param"]["base_score"]).strip("[]"))
+    if learner["objective"]["name"] in LOGISTIC_OBJECTIVES:
+        return math.log(base_score / (1 - base_score))
+    return base_score
+
+
+def _booster_trees(
+    booster: xgb.Booster, best_iteration: int = None
+) -> Tuple[List[Dict], float, str]:
+    """booster 의 tree 목록, base margin, objective (best iteration 까지만)"""
+    if best_iteration is not None:
+        booster = booster[: best_iteration + 1]
+    learner = json.loads(booster.save_raw("json"))["learner"]
+    gradient_booster = learner["gradient_booster"]
+    if gradient_booster["name"] != "gbtree":
+        raise Exception(f"{gradient_booster['name']} booster export is not supported")
+    return (
+        gradient_booster["model"]["trees"],
+        _base_margin(learner),
+        learner["objective"]["name"],
+    )
+
+
+def _tree_depth(left: np.ndarray, right: np.ndarray) -> int:
+    depth = np.zeros(len(left), dtype=np.int32)
+    # 부모 node 는 자식보다 앞 번호이므로 순서대로 한 번에 계산
+    for node in range(len(left)):
+        if left[node] != -1:
+            depth[left[node]] = depth[node] + 1
+            depth[right[node]] = depth[node] + 1
+    return int(depth.max())
+
+
+def export_trees(
+    model: Union[xgb.Booster, BoosterEnsemble],
+    path: str,
+    feature_names: List[str],
+    threshold: float = 0.5,
+    best_iteration: int = None,
+) -> str:
+    """학습된 모델의 tree 를 node 배열로 펼쳐 .npz 하나로 저장
+        NumpyTreePredictor 로 xgboost 없이 예측할 수 있음
+
+    Args:
+        model (Union[xgb.Booster, BoosterEnsemble]): 학습된 모델
+        path (str): 저장할 .npz 경로
+        feature_names (List[str]): 입력 컬럼 순서
+        threshold (float): 양성 판정 기준
+        best_iteration (int): 단일 모델의 best iteration (ensemble 은 bag 별 값을 사용)
+
+    Returns:
+        str: 저장한 경로
+    """
+    if isinstance(model, BoosterEnsemble):
+        boosters = list(zip(model.boosters, model.best_iterations))
+    else:
+        boosters = [(model, best_iteration)]
+
+    columns = {key: [] for key in ("feature", "split_value", "left", "right", "default_left", "value")}
+    roots, model_starts, base_margins = [], [], []
+    objective = None
+    n_nodes = 0
+    max_depth = 0
+    for booster, booster_best_iteration in boosters:
+        trees, base_margin, objective = _booster_trees(booster, booster_best_iteration)
+        model_starts.append(len(roots))
+        base_margins.append(base_margin)
+        for tree in trees:
+            if any(tree["split_type"]):
+                raise Exception("categorical split export is not supported")
+            left = np.asarray(tree["left_children"], dtype=np.int32)
+            right = np.asarray(tree["right_children"], dtype=np.int32)
+            split = np.asarray(tree["split_conditions"], dtype=np.float32)
+            is_leaf = left == -1
+            own = np.arange(len(left), dtype=np.int32) + n_nodes
+
+            # leaf 는 자기 자신을 가리키게 해서 depth 가 다른 tree 도 같은 횟수로 이동
+            columns["feature"].append(
+                np.where(is_leaf, -1, np.asarray(tree["split_indices"], dtype=np.int32))
+            )
+            columns["split_value"].append(np.where(is_leaf, np.float32(0), split))
+            columns["left"].append(np.where(is_leaf, own, left + n_nodes))
+            columns["right"].append(np.where(is_leaf, own, right + n_nodes))
+            columns["default_left"].append(np.asarray(tree["default_left"], dtype=bool))
+            columns["value"].append(np.where(is_leaf, split, np.float32(0)))
+
+            roots.append(n_nodes)
+            n_nodes += len(left)
+            max_depth = max(max_depth, _tree_depth(left, right))
+
+    np.savez(
+        path,
+        feature=np.concatenate(columns["feature"]).astype(np.int32),
+        split_value=np.concatenate(columns["split_value"]).astype(np.float32),
+        left=np.concatenate(columns["left"]).astype(np.int32),
+        right=np.concatenate(columns["right"]).astype(np.int32),
+        default_left=np.concatenate(columns["default_left"]),
+        value=np.concatenate(columns["value"]).astype(np.float32),
+        roots=np.asarray(roots, dtype=np.int32),
+        model_starts=np.asarray(model_starts, dtype=np.int64),
+        base_margin=np.asarray(base_margins, dtype=np.float64),
+        objective=np.asarray(objective),
+        feature_names=np.asarray(feature_names, dtype=str),
+        threshold=np.asarray(threshold, dtype=np.float64),
+        max_depth=np.asarray(max_depth, dtype=np.int32),
+    )
+    return path
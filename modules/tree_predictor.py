@@ -0,0 +1,120 @@
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+# numpy 만으로 예측할 수 있도록 내보낸 tree 파일
+NPZ_FILE = "trees.npz"
+
+# 확률로 변환할 때 sigmoid 를 적용하는 objective
+LOGISTIC_OBJECTIVES = ("binary:logistic", "reg:logistic")
+
+
+class NumpyTreePredictor:
+    """NumpyTreePredictor class
+        tree_export 로 내보낸 .npz 만으로 예측 (xgboost, sklearn, mlflow 를 import 하지 않음)
+        모든 tree 의 node 를 하나의 배열로 펼쳐 두고, batch 의 모든 행과 tree 를
+        depth 단계마다 한 번에 이동시키는 방식으로 leaf 를 찾음
+
+    Attributes:
+        feature (np.ndarray): node 별 분기 feature index (leaf 는 -1)
+        split_value (np.ndarray): node 별 분기 기준값 (x < split_value 이면 왼쪽)
+        left (np.ndarray): 왼쪽 자식 node (leaf 는 자기 자신)
+        right (np.ndarray): 오른쪽 자식 node (leaf 는 자기 자신)
+        default_left (np.ndarray): 결측치일 때 왼쪽으로 가는지 여부
+        value (np.ndarray): leaf 값 (leaf 가 아니면 0)
+        roots (np.ndarray): tree 별 root node
+        model_starts (np.ndarray): 모델(ensemble 의 bag) 별 첫 tree 위치
+        base_margin (np.ndarray): 모델 별 base margin
+        objective (str): 학습 objective
+        feature_names (list): 입력 컬럼 순서
+        threshold (float): 양성 판정 기준
+        max_depth (int): 가장 깊은 tree 의 depth
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]) -> None:
+        self.feature = arrays["feature"]
+        self.split_value = arrays["split_value"]
+        self.left = arrays["left"]
+        self.right = arrays["right"]
+        self.default_left = arrays["default_left"]
+        self.value = arrays["value"]
+        self.roots = arrays["roots"]
+        self.model_starts = arrays["model_starts"]
+        self.base_margin = arrays["base_margin"]
+        self.objective = str(arrays["objective"])
+        self.feature_names = [str(name) for name in arrays["feature_names"]]
+        self.threshold = float(arrays["threshold"])
+        self.max_depth = int(arrays["max_depth"])
+
+    @classmethod
+    def load(cls, path: str) -> "NumpyTreePredictor":
+        with np.load(path, allow_pickle=False) as npz:
+            return cls({key: npz[key] for key in npz.files})
+
+    def _to_matrix(self, input_data: Any) -> np.ndarray:
+        # DataFrame 은 pandas 를 import 하지 않고 컬럼 순서만 맞춤
+        if hasattr(input_data, "to_numpy"):
+            if self.feature_names and hasattr(input_data, "columns"):
+                input_data = input_data[self.feature_names]
+            return input_data.to_numpy(dtype=np.float32)
+        matrix = np.ascontiguousarray(input_data, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        return matrix
+
+    def _leaf_values(self, matrix: np.ndarray) -> np.ndarray:
+        """batch 의 모든 (행, tree) 쌍을 depth 단계마다 한 번에 자식 node 로 이동"""
+        n_rows = len(matrix)
+        node = np.broadcast_to(self.roots, (n_rows, len(self.roots))).copy()
+        rows = np.arange(n_rows)[:, None]
+        for _ in range(self.max_depth):
+            feature = self.feature[node]
+            if (feature < 0).all():
+                break
+            x = matrix[rows, np.maximum(feature, 0)]
+            # xgboost 와 같이 float32 로 비교, 결측치는 기본 방향
+            go_left = np.where(
+                np.isnan(x), self.default_left[node], x < self.split_value[node]
+            )
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.value[node]
+
+    def predict_margin(self, input_data: Any, batch_size: int = 4096) -> np.ndarray:
+        """모델 별 margin (xgboost 의 output_margin=True 와 같은 값)
+
+        Args:
+            input_data (Any): 2차원 ndarray 또는 DataFrame
+            batch_size (int): 한 번에 처리할 행 수 (행 수 x tree 수 만큼 메모리 사용)
+
+        Returns:
+            np.ndarray: (행 수, 모델 수) margin
+        """
+        matrix = self._to_matrix(input_data)
+        margin = np.empty((len(matrix), len(self.model_starts)), dtype=np.float64)
+        for start in range(0, len(matrix), batch_size):
+            leaf_values = self._leaf_values(matrix[start : start + batch_size])
+            margin[start : start + batch_size] = np.add.reduceat(
+                leaf_values, self.model_starts, axis=1, dtype=np.float64
+            )
+        return margin + self.base_margin
+
+    def predict_proba(self, input_data: Any, batch_size: int = 4096) -> np.ndarray:
+        """양성 확률 (ensemble 이면 모델 별 확률의 평균)"""
+        margin = self.predict_margin(input_data, batch_size)
+        if self.objective in LOGISTIC_OBJECTIVES:
+            margin = 1 / (1 + np.exp(-margin))
+        return margin.mean(axis=1).astype(np.float32)
+
+    def predict_batch(
+        self, input_data: Any, batch_size: int = 4096
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Model.predict_batch 와 같은 형식의 결과
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: 양성 확률 (float32), 예측 라벨 (uint8)
+        """
+        proba = self.predict_proba(input_data, batch_size)
+        return proba, (proba >= self.threshold).astype(np.uint8)
+
+    def predict(self, input_data: Any, batch_size: int = 4096) -> np.ndarray:
+        return self.predict_batch(input_data, batch_size)[1]
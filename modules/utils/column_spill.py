@@ -0,0 +1,135 @@
+import logging
+import os
+import shutil
+import tempfile
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from modules.utils.downcast import CompactDtype, log_memory_report
+from modules.utils.file_handler import chk_and_make_dir
+
+
+class ColumnSpill:
+    """ColumnSpill class
+        chunk 의 컬럼 값을 컬럼별 임시 파일에 이어 쓰고, 다 쓴 뒤 한 번에 읽어 DataFrame 으로 만듦
+        chunk 는 쓰는 즉시 해제할 수 있으므로 쓰는 동안 메모리는 chunk 하나 크기
+        읽을 때는 전체 컬럼 값 범위로 고른 dtype 의 결과 배열 + chunk 하나 크기의 읽기 buffer
+        (chunk 별로 dtype 을 줄여 합치면 전체 데이터를 한 번에 줄인 결과와 dtype 이 달라질 수 있음)
+
+    Attributes:
+        _directory (str): 컬럼 파일을 쓰는 임시 디렉토리
+        _columns (List[str]): 컬럼 순서 (첫 chunk 기준)
+        _dtypes (Dict[str, np.dtype]): 컬럼별 파일 dtype (첫 chunk 의 dtype)
+        _compact (Dict[str, CompactDtype]): 컬럼별 값 범위
+        _files (Dict): 컬럼 -> 쓰기용 파일
+        _n_rows (int): 쓴 행 수
+        _batch_rows (int): 가장 큰 chunk 의 행 수 (읽기 buffer 크기)
+    """
+
+    def __init__(self, parent_dir: str) -> None:
+        chk_and_make_dir(parent_dir)
+        self._directory = tempfile.mkdtemp(prefix="spill_", dir=parent_dir)
+        self._columns = None
+        self._dtypes = {}
+        self._compact = {}
+        self._files = {}
+        self._n_rows = 0
+        self._batch_rows = 0
+
+    @property
+    def n_rows(self) -> int:
+        return self._n_rows
+
+    @property
+    def columns(self) -> List[str]:
+        return self._columns
+
+    def __enter__(self) -> "ColumnSpill":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _path(self, position: int) -> str:
+        return os.path.join(self._directory, f"{position}.bin")
+
+    def append(self, chunk: pd.DataFrame) -> None:
+        """chunk 의 컬럼 값을 파일 끝에 이어 쓰기
+
+        Args:
+            chunk (pd.DataFrame): 첫 chunk 와 같은 컬럼을 갖는 chunk
+        """
+        if self._columns is None:
+            self._columns = list(chunk.columns)
+            for position, column in enumerate(self._columns):
+                dtype = chunk[column].dtype
+                if not isinstance(dtype, np.dtype) or dtype.kind not in "biuf":
+                    raise TypeError(f"only numeric columns can be spilled: {column}")
+                self._dtypes[column] = dtype
+                self._compact[column] = CompactDtype(dtype)
+                self._files[column] = open(self._path(position), "wb")
+
+        for column in self._columns:
+            values = chunk[column].to_numpy(dtype=self._dtypes[column])
+            values = np.ascontiguousarray(values)
+            self._compact[column].update(values)
+            values.tofile(self._files[column])
+        self._n_rows += len(chunk)
+        self._batch_rows = max(self._batch_rows, len(chunk))
+
+    def load(
+        self, downcast: bool = True, logger: logging.Logger = None
+    ) -> pd.DataFrame:
+        """쓴 값을 모두 읽어 DataFrame 으로 반환 (index 는 0 부터)
+            downcast 이면 컬럼마다 전체 값 범위에 맞는 작은 dtype 으로 변환 (compact_dtype 과 같은 결과)
+
+        Args:
+            downcast (bool): 작은 dtype 으로 변환할지 여부
+            logger (logging.Logger): 메모리 리포트를 기록할 logger
+
+        Returns:
+            pd.DataFrame: 쓴 순서대로 이어 붙인 데이터, 쓴 chunk 가 없으면 None
+        """
+        if self._columns is None:
+            return None
+        for file in self._files.values():
+            file.close()
+
+        arrays = {}
+        report = []
+        for position, column in enumerate(self._columns):
+            source_dtype = self._dtypes[column]
+            dtype = self._compact[column].result() if downcast else None
+            if dtype is None:
+                dtype = source_dtype
+            array = np.empty(self._n_rows, dtype=dtype)
+            # chunk 하나 크기씩 읽어 결과 배열에 변환해 넣음
+            with open(self._path(position), "rb") as f:
+                for start in range(0, self._n_rows, max(self._batch_rows, 1)):
+                    end = min(start + self._batch_rows, self._n_rows)
+                    array[start:end] = np.fromfile(
+                        f, dtype=source_dtype, count=end - start
+                    )
+            os.remove(self._path(position))
+            arrays[column] = array
+            report.append(
+                {
+                    "column": column,
+                    "from": str(source_dtype),
+                    "to": str(dtype),
+                    "before": self._n_rows * source_dtype.itemsize,
+                    "after": array.nbytes,
+                }
+            )
+
+        if downcast and logger is not None:
+            log_memory_report(report, logger)
+        return pd.DataFrame(arrays, columns=self._columns, copy=False)
+
+    def close(self) -> None:
+        """임시 파일 정리"""
+        for file in self._files.values():
+            file.close()
+        shutil.rmtree(self._directory, ignore_errors=True)
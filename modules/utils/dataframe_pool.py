@@ -0,0 +1,263 @@
+import atexit
+import logging
+import math
+import threading
+import time
+from multiprocessing import cpu_count, resource_tracker, shared_memory
+from typing import Callable, List, Tuple
+
+import numpy as np
+import pandas as pd
+from pathos.multiprocessing import ProcessingPool as Pool
+
+pool_logger = logging.getLogger("DataFramePool")
+
+# worker 프로세스에서 열어 둔 shared memory (이름 -> SharedMemory)
+_attached = {}
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """parent 가 만든 shared memory 를 worker 에서 열기 (프로세스당 한 번)"""
+    shm = _attached.get(name)
+    if shm is None:
+        try:
+            # python 3.13 이상: worker 는 정리 책임이 없으므로 추적하지 않음
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # fork 된 worker 는 parent 의 resource tracker 를 공유하므로 그대로 둠
+            # 그 외에는 worker 의 resource tracker 가 종료 시 지우지 않도록 등록 해제
+            shared_tracker = getattr(resource_tracker._resource_tracker, "_fd", None)
+            shm = shared_memory.SharedMemory(name=name)
+            if shared_tracker is None:
+                resource_tracker.unregister(shm._name, "shared_memory")
+        _attached[name] = shm
+    return shm
+
+
+def _release_stale(names: List[str]) -> None:
+    """parent 가 더 이상 사용하지 않는 shared memory 닫기"""
+    for name in [name for name in _attached if name not in names]:
+        _attached.pop(name).close()
+
+
+def _run_chunk(task: Tuple) -> pd.DataFrame:
+    """shared memory 의 행 구간을 복사 없이 DataFrame 으로 만들어 func 실행 (worker 에서 실행)
+
+    Args:
+        task (Tuple): (func, blocks, other, start, end, columns, index, args)
+            blocks 는 dtype 별 (shared memory 이름, dtype, shape, 컬럼)
+            other 는 숫자형이 아닌 컬럼의 같은 행 구간 (없으면 None)
+
+    Returns:
+        pd.DataFrame: func 결과
+    """
+    func, blocks, other, start, end, columns, index, args = task
+    _release_stale([name for name, _, _, _ in blocks])
+
+    parts = []
+    for name, dtype, shape, block_columns in blocks:
+        array = np.ndarray(shape, dtype=dtype, buffer=_attach(name).buf)[start:end]
+        parts.append(pd.DataFrame(array, columns=block_columns, index=index, copy=False))
+    if other is not None:
+        parts.append(other)
+    chunk = parts[0] if len(parts) == 1 else pd.concat(parts, axis=1, copy=False)
+    if list(chunk.columns) != columns:
+        chunk = chunk[columns]
+    return func(chunk, *args)
+
+
+def auto_chunk_size(
+    n_rows: int,
+    n_workers: int,
+    row_cost: float,
+    target_task_seconds: float = 0.5,
+    max_chunks_per_worker: int = 8,
+) -> int:
+    """행당 처리 시간으로 chunk 크기 결정
+        chunk 하나가 target_task_seconds 정도 걸리도록 하되
+        모든 worker 가 일을 받고, worker 당 chunk 수는 max_chunks_per_worker 이하
+
+    Args:
+        n_rows (int): 처리할 행 수
+        n_workers (int): worker 수
+        row_cost (float): 행당 처리 시간 (초)
+        target_task_seconds (float): chunk 하나의 목표 처리 시간 (초)
+        max_chunks_per_worker (int): worker 당 최대 chunk 수
+
+    Returns:
+        int: chunk 당 행 수
+    """
+    by_cost = int(target_task_seconds / row_cost) if row_cost > 0 else n_rows
+    min_size = math.ceil(n_rows / (n_workers * max_chunks_per_worker))
+    max_size = math.ceil(n_rows / n_workers)
+    return max(min(max(by_cost, min_size), max_size), 1)
+
+
+class DataFramePool:
+    """DataFramePool class
+        DataFrame 을 행 단위로 나눠 처리하는 재사용 process pool
+        숫자형 컬럼은 dtype 별 shared memory 에 한 번 복사하고 worker 는 복사 없이 view 로 사용
+        shared memory 는 크기가 부족할 때만 다시 만들어 반복 호출 시 재사용
+        chunk 크기는 첫 호출에서 측정한 행당 처리 시간으로 결정
+
+    Attributes:
+        _n_workers (int): worker 프로세스 수
+        _target_task_seconds (float): chunk 하나의 목표 처리 시간
+        _probe_rows (int): 행당 처리 시간 측정에 사용할 행 수
+        _min_parallel_seconds (float): 예상 처리 시간이 이보다 짧으면 현재 프로세스에서 처리
+        _segments (Dict[str, SharedMemory]): dtype -> shared memory
+        _row_costs (Dict[str, float]): 함수 이름 -> 행당 처리 시간
+    """
+
+    def __init__(
+        self,
+        n_workers: int = None,
+        target_task_seconds: float = 0.5,
+        probe_rows: int = 1000,
+        min_parallel_seconds: float = 1.0,
+    ) -> None:
+        if n_workers is None or n_workers <= 0:
+            n_workers = max(cpu_count() - 1, 1)
+        self._n_workers = n_workers
+        self._target_task_seconds = target_task_seconds
+        self._probe_rows = probe_rows
+        self._min_parallel_seconds = min_parallel_seconds
+        self._pool = None
+        self._segments = {}
+        self._row_costs = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> Pool:
+        if self._pool is None:
+            self._pool = Pool(self._n_workers)
+        return self._pool
+
+    def _segment(self, key: str, nbytes: int) -> shared_memory.SharedMemory:
+        shm = self._segments.get(key)
+        if shm is None or shm.size < nbytes:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            self._segments[key] = shm
+        return shm
+
+    def _share(self, df: pd.DataFrame) -> Tuple[List[Tuple], pd.DataFrame]:
+        """숫자형 컬럼을 dtype 별 (행, 컬럼) 블록으로 shared memory 에 복사
+
+        Returns:
+            Tuple[List[Tuple], pd.DataFrame]: 블록 정보, 숫자형이 아닌 컬럼 (없으면 None)
+        """
+        numeric = [
+            column
+            for column, dtype in df.dtypes.items()
+            if isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+        ]
+        by_dtype = {}
+        for column in numeric:
+            by_dtype.setdefault(df[column].dtype.str, []).append(column)
+
+        blocks = []
+        for dtype, block_columns in by_dtype.items():
+            shape = (len(df), len(block_columns))
+            shm = self._segment(dtype, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            block = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+            for i, column in enumerate(block_columns):
+                block[:, i] = df[column].to_numpy()
+            blocks.append((shm.name, dtype, shape, block_columns))
+
+        others = [column for column in df.columns if column not in set(numeric)]
+        return blocks, (df[others] if others else None)
+
+    def map(self, func: Callable, df: pd.DataFrame, *args) -> pd.DataFrame:
+        """func(chunk, *args) 를 행 chunk 별로 병렬 실행하고 결과를 순서대로 합침
+
+        Args:
+            func (Callable): DataFrame 을 받아 DataFrame 을 반환하는 함수
+            df (pd.DataFrame): 처리할 데이터프레임
+            args: func 에 들어갈 인자값
+
+        Returns:
+            pd.DataFrame: chunk 별 결과를 합친 데이터프레임
+        """
+        n_rows = len(df)
+        key = getattr(func, "__qualname__", repr(func))
+        results = []
+
+        # 처음 보는 함수는 앞부분 일부를 직접 처리하며 행당 처리 시간 측정
+        done = 0
+        row_cost = self._row_costs.get(key)
+        if row_cost is None:
+            done = min(self._probe_rows, n_rows)
+            start_time = time.perf_counter()
+            results.append(func(df.iloc[:done], *args))
+            row_cost = (time.perf_counter() - start_time) / max(done, 1)
+            self._row_costs[key] = row_cost
+
+        remaining = n_rows - done
+        if remaining == 0:
+            return pd.concat(results)
+        if self._n_workers == 1 or row_cost * remaining < self._min_parallel_seconds:
+            results.append(func(df.iloc[done:], *args))
+            return pd.concat(results)
+
+        chunk_size = auto_chunk_size(
+            remaining, self._n_workers, row_cost, self._target_task_seconds
+        )
+        columns = list(df.columns)
+        with self._lock:
+            blocks, other = self._share(df)
+            tasks = [
+                (
+                    func,
+                    blocks,
+                    None if other is None else other.iloc[start : start + chunk_size],
+                    start,
+                    min(start + chunk_size, n_rows),
+                    columns,
+                    df.index[start : start + chunk_size],
+                    args,
+                )
+                for start in range(done, n_rows, chunk_size)
+            ]
+            pool_logger.debug(
+                f"{key}: {remaining} rows, {len(tasks)} chunks x {chunk_size} rows"
+            )
+            results.extend(self._get_pool().map(_run_chunk, tasks))
+        return pd.concat(results)
+
+    def close(self) -> None:
+        """worker 프로세스와 shared memory 정리"""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.close()
+                self._pool.join()
+                self._pool.clear()
+                self._pool = None
+            for shm in self._segments.values():
+                shm.close()
+                shm.unlink()
+            self._segments.clear()
+
+
+_dataframe_pool = None
+_dataframe_pool_lock = threading.Lock()
+
+
+def get_dataframe_pool(n_workers: int = None) -> DataFramePool:
+    """프로세스 공용 DataFramePool 반환 (처음 호출 시 생성)"""
+    global _dataframe_pool
+    with _dataframe_pool_lock:
+        if _dataframe_pool is None:
+            _dataframe_pool = DataFramePool(n_workers)
+            atexit.register(shutdown_dataframe_pool)
+        return _dataframe_pool
+
+
+def shutdown_dataframe_pool() -> None:
+    """공용 DataFramePool 종료 (파이프라인 종료 시 호출)"""
+    global _dataframe_pool
+    with _dataframe_pool_lock:
+        if _dataframe_pool is not None:
+            _dataframe_pool.close()
+            _dataframe_pool = None
@@ -1,27 +1,51 @@
+import cProfile
+import itertools
 import logging
 import os
 import re
 import sys
+import threading
 import time
 import traceback
+import tracemalloc
 from functools import wraps
 
+from modules.utils.stage_metrics import get_registry, get_rss_sampler
+
 
 class RunningTimeDecorator:
     """RunningTimeDecorator class
         실행 시간을 로깅하는 데코레이터 클래스
+        호출마다 실행 시간(perf_counter), 프로세스 CPU 시간, 호출 중 RSS 증가량을 측정해
+        프로세스 공용 StageMetricsRegistry 에 기록
+        registry 설정에 따라 tracemalloc peak 측정, cProfile 결과 저장
 
     Attributes:
         __param (logging.Logger or None): logger의 parameter
-        __show_pid (bool): 프로세스ID 로깅 여부
         __show_section (bool): 실행 section 로깅 여부
+        __show_pid (bool): 프로세스ID 로깅 여부
+        __show_log (bool): 로깅 여부 (False 이면 registry 에만 기록)
+        __name (str or None): registry 에 기록할 단계 이름, None 이면 함수의 qualname
         logger (None): 로거 객체
     """
 
-    def __init__(self, logger=None, show_section: bool = True, show_pid: bool = True):
+    # thread 별로 측정 중인 단계 수, tracemalloc/cProfile 은 가장 바깥 단계에서만 사용
+    _local = threading.local()
+    _profile_count = itertools.count()
+
+    def __init__(
+        self,
+        logger=None,
+        show_section: bool = True,
+        show_pid: bool = True,
+        show_log: bool = True,
+        name: str = None,
+    ):
         self.__param = logger
         self.__show_section = show_section
         self.__show_pid = show_pid
+        self.__show_log = show_log
+        self.__name = name
 
 # 클래스 객체 호출 함수
     def __call__(self, func):
@@ -33,8 +57,11 @@ class RunningTimeDecorator:
         Returns:
             decorator: 입력 함수에 decorated 처리
         """
+        stage_name = self.__name or func.__qualname__
 
         def printLog(str_arg: str):
+            if not self.__show_log:
+                return
             if isinstance(self.__param, logging.Logger):
                 logger = logging.getLogger(self.__param.name)
                 logger.info(str_arg)
@@ -53,24 +80,71 @@ class RunningTimeDecorator:
                 decorator: 함수 앞 뒤에 처리
             """
             str_current_pid = ""
+            if self.__show_pid:
+                str_current_pid = "(PID:" + str(os.getpid()) + ")"
 
             if self.__show_section:
-                if self.__show_pid:
-                    str_current_pid = "(PID:" + str(os.getpid()) + ")"
-                str_start = "{0}{1} Started.".format(func.__name__, str_current_pid)
+                str_start = "{0}{1} Started.".format(stage_name, str_current_pid)
                 printLog(str_start)
 
-            start_time = time.time()
-            result = func(*args, **kwargs)
-            end_time = time.time()
+            registry = get_registry()
+            depth = getattr(self._local, "depth", 0)
+            self._local.depth = depth + 1
+            use_tracemalloc = registry.tracemalloc and depth == 0
+            profiler = None
+            if registry.profile_dir is not None and depth == 0:
+                profiler = cProfile.Profile()
+            # tracemalloc 은 시작한 호출에서 멈춤
+            started_tracemalloc = use_tracemalloc and not tracemalloc.is_tracing()
+            if started_tracemalloc:
+                tracemalloc.start()
+            if use_tracemalloc:
+                tracemalloc.reset_peak()
+
+            if profiler is not None:
+                try:
+                    profiler.enable()
+                except ValueError:
+                    # 다른 thread 에서 profiling 중이면 이번 호출은 profiling 하지 않음
+                    profiler = None
+
+            rss_token = get_rss_sampler().start()
+            start_time = time.perf_counter()
+            start_cpu = time.process_time()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+                self._local.depth = depth
+                stats = {
+                    "wall_s": time.perf_counter() - start_time,
+                    "cpu_s": time.process_time() - start_cpu,
+                    "rss_delta_mb": get_rss_sampler().stop(rss_token)[1],
+                }
+                if use_tracemalloc:
+                    stats["tracemalloc_peak_mb"] = (
+                        tracemalloc.get_traced_memory()[1] / 2**20
+                    )
+                if started_tracemalloc:
+                    tracemalloc.stop()
+                registry.record(stage_name, stats)
+                if profiler is not None:
+                    os.makedirs(registry.profile_dir, exist_ok=True)
+                    profiler.dump_stats(
+                        os.path.join(
+                            registry.profile_dir,
+                            "{0}_{1}_{2}.pstats".format(
+                                stage_name, os.getpid(), next(self._profile_count)
+                            ),
+                        )
+                    )
 
             if self.__show_section:
-                if self.__show_pid:
-                    str_current_pid = "(PID:" + str(os.getpid()) + ")"
-                str_finish = "{0}{1} Finished.".format(func.__name__, str_current_pid)
+                str_finish = "{0}{1} Finished.".format(stage_name, str_current_pid)
                 printLog(str_finish)
-            str_log = "{0}{1} Elapsed Time : {2:.2f} seconds".format(
-                func.__name__, str_current_pid, end_time - start_time
+            str_log = "{0}{1} Elapsed Time : {2:.2f} seconds (cpu {3:.2f} seconds)".format(
+                stage_name, str_current_pid, stats["wall_s"], stats["cpu_s"]
             )
             printLog(str_log)
             return result
@@ -1,25 +1,98 @@
 import logging
 import os
-from datetime import datetime
+import queue
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
+from typing import Dict, List
 
 from modules.utils.file_handler import chk_and_make_dir
 from modules.utils.logging_format import CustomFormatter
 
+FILE_LOG_FORMAT = "[%(levelname)s:%(name)s:%(asctime)s] %(message)s"
+FILE_LOG_DATEFMT = "%Y/%m/%d %H:%M:%S"
+
+
+class ProcessLocalQueueHandler(QueueHandler):
+    """ProcessLocalQueueHandler class
+        로그를 queue 에 넣고 QueueListener thread 가 출력하도록 함
+        fork 된 자식 프로세스에는 listener thread 가 없으므로 handler 에 바로 기록
+
+    Attributes:
+        _pid (int): listener 가 실행 중인 프로세스 ID
+        _handlers (List[logging.Handler]): listener 가 사용하는 handler
+    """
+
+    def __init__(self, log_queue: queue.Queue, handlers: List[logging.Handler]) -> None:
+        super().__init__(log_queue)
+        self._pid = os.getpid()
+        self._handlers = handlers
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if os.getpid() == self._pid:
+            super().emit(record)
+            return
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
 
 class DefaultLogger:
     """DefaultLogger class
+        stream/file handler 는 background thread(QueueListener)에서 실행해
+        로깅하는 쪽은 터미널, 디스크 I/O 를 기다리지 않음
+        log 파일은 크기(size) 또는 시간(time) 기준으로 rotation
 
     Attributes:
-
+        _rotation (str): size 또는 time
+        _max_bytes (int): size rotation 기준 파일 크기
+        _backup_count (int): 보관할 이전 log 파일 수
+        _when (str): time rotation 주기 (TimedRotatingFileHandler 의 when)
+        _listener (QueueListener): handler 를 실행하는 listener
     """
-    def __init__(self) -> None:
-        pass
+    def __init__(
+        self,
+        rotation: str = "size",
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 10,
+        when: str = "midnight",
+    ) -> None:
+        self._rotation = rotation
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._when = when
+        self._listener = None
+
+    @classmethod
+    def from_config(cls, log_config: Dict) -> "DefaultLogger":
+        """config 의 log section 으로 생성 (없는 값은 기본값)"""
+        keys = ("rotation", "max_bytes", "backup_count", "when")
+        return cls(**{key: log_config[key] for key in keys if key in log_config})
+
+    def _file_handler(self, log_file_name: str) -> logging.Handler:
+        if self._rotation == "time":
+            return TimedRotatingFileHandler(
+                log_file_name,
+                when= self._when,
+                backupCount= self._backup_count,
+                encoding= "utf-8",
+            )
+        return RotatingFileHandler(
+            log_file_name,
+            maxBytes= self._max_bytes,
+            backupCount= self._backup_count,
+            encoding= "utf-8",
+        )
 
     def setDefaultLogger(
         self, logger_name: str, output_directory_path: str
     ) -> logging.Logger:
         """ 로거 설정함수
             어떤 로그를 어디에, 어떻게 기록할 지 설정
+            log 파일은 <logger_name>.log 이고 rotation 된 파일은 뒤에 번호 또는 날짜가 붙음
 
         Args:
             logger_name (str): 기록할 log의 이름
@@ -28,50 +101,40 @@ class DefaultLogger:
             logging.getLogger(logger_name): 특정 이름의 로거 객체 반환
         """
         # 로거 설정
-        log_file_name = os.path.join(
-            output_directory_path,
-            "log_current.log",
-        )
+        log_file_name = os.path.join(output_directory_path, f"{logger_name}.log")
         self._output_directory_path = output_directory_path
         chk_and_make_dir(output_directory_path)
 
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(CustomFormatter())
-        file_handler = logging.FileHandler(log_file_name)
+        file_handler = self._file_handler(log_file_name)
+        file_handler.setFormatter(
+            logging.Formatter(FILE_LOG_FORMAT, datefmt= FILE_LOG_DATEFMT)
+        )
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format="[%(levelname)s:%(name)s:%(asctime)s] %(message)s",
-            datefmt="%Y/%m/%d %H:%M:%S",
-            handlers=[stream_handler, file_handler],
+        handlers = [stream_handler, file_handler]
+        log_queue = queue.Queue(-1)
+        self._listener = QueueListener(
+            log_queue, *handlers, respect_handler_level= True
         )
+        self._listener.start()
+
+        # 메시지만 미리 만들어 queue 에 넣고, 형식은 listener 의 handler 가 적용
+        queue_handler = ProcessLocalQueueHandler(log_queue, handlers)
+        queue_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
 
         return logging.getLogger(logger_name)
 
-    def rename_log_file(self):
-        """ 로그 이름 변경함수
+    def shutdown(self):
+        """ 남은 로그를 모두 기록하고 listener 종료 (프로그램 종료 시 호출)
 
         Args:
             None
         Returns:
             None
         """
-
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
         logging.shutdown()
-        c_time = os.path.getctime(
-            os.path.join(
-                self._output_directory_path,
-                "log_current.log",
-            )
-        )
-        c_time = datetime.fromtimestamp(c_time).strftime("%Y%m%d_%H%M%S")
-        os.rename(
-            os.path.join(
-                self._output_directory_path,
-                "log_current.log",
-            ),
-            os.path.join(
-                self._output_directory_path,
-                f"log_{c_time}.log",
-            ),
-        )
@@ -0,0 +1,169 @@
+import logging
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+INT_DTYPES = [np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32]
+
+
+def _smallest_int_dtype(min_value, max_value):
+    """값 범위를 overflow 없이 담을 수 있는 가장 작은 정수 dtype
+
+    Args:
+        min_value: 최소값
+        max_value: 최대값
+
+    Returns:
+        np.dtype or None: 정수 dtype, 담을 수 없으면 None
+    """
+    for dtype in INT_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= min_value and max_value <= info.max:
+            return np.dtype(dtype)
+    return None
+
+
+class CompactDtype:
+    """CompactDtype class
+        컬럼 값 범위를 chunk 단위로 누적해 작은 dtype 선택
+        전체 값을 한 번에 넣은 것과 같은 결과 (compact_dtype 도 이 class 로 계산)
+        결측치 없는 정수값(코드, 라벨) -> int8/uint8 등 가장 작은 정수형
+        그 외 실수값(측정치) -> float32
+
+    Attributes:
+        _dtype (np.dtype): 원래 dtype
+        _n_rows (int): 누적한 행 수
+        _min, _max: 최소/최대값 (실수형은 모든 값이 유한할 때만 사용)
+        _all_finite (bool): 모든 값이 유한한지 여부
+        _integral (bool): 유한한 값이 모두 정수값인지 여부
+        _abs_max (float): 유한한 값의 최대 절대값, 유한한 값이 없으면 None
+    """
+
+    def __init__(self, dtype: np.dtype) -> None:
+        self._dtype = np.dtype(dtype)
+        self._n_rows = 0
+        self._min = None
+        self._max = None
+        self._all_finite = True
+        self._integral = True
+        self._abs_max = None
+
+    def update(self, values: np.ndarray) -> None:
+        self._n_rows += len(values)
+        if len(values) == 0 or self._dtype.kind not in "iuf":
+            return
+        if self._dtype.kind == "f":
+            finite = np.isfinite(values)
+            if finite.any():
+                abs_max = np.abs(values[finite]).max()
+                if self._abs_max is None or abs_max > self._abs_max:
+                    self._abs_max = abs_max
+            if not finite.all():
+                self._all_finite = False
+                return
+            if self._integral and not np.array_equal(values, np.trunc(values)):
+                self._integral = False
+        low, high = values.min(), values.max()
+        self._min = low if self._min is None else min(self._min, low)
+        self._max = high if self._max is None else max(self._max, high)
+
+    def result(self) -> np.dtype:
+        """선택된 dtype, 줄일 수 없으면 None"""
+        if self._n_rows == 0 or self._dtype.kind not in "iuf":
+            return None
+        if self._dtype.kind in "iu":
+            return _smallest_int_dtype(self._min, self._max)
+
+        if self._all_finite and self._integral:
+            int_dtype = _smallest_int_dtype(self._min, self._max)
+            if int_dtype is not None:
+                return int_dtype
+
+        # float32 범위를 넘는 값이 있으면 변환하지 않음
+        if self._abs_max is not None and self._abs_max > np.finfo(np.float32).max:
+            return None
+        return np.dtype(np.float32)
+
+
+def compact_dtype(series: pd.Series) -> np.dtype:
+    """컬럼 값에 맞는 작은 dtype 선택 (CompactDtype 참고)
+
+    Args:
+        series (pd.Series): 대상 컬럼
+
+    Returns:
+        np.dtype: 선택된 dtype (줄일 수 없으면 기존 dtype)
+    """
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        return series.dtype
+    values = series.to_numpy()
+    compact = CompactDtype(values.dtype)
+    compact.update(values)
+    dtype = compact.result()
+    return series.dtype if dtype is None else dtype
+
+
+def downcast_dataframe(
+    df: pd.DataFrame, logger: logging.Logger = None
+) -> pd.DataFrame:
+    """데이터프레임의 각 컬럼을 작은 dtype 으로 변환하고 메모리 리포트 로깅
+
+    Args:
+        df (pd.DataFrame): 변환할 데이터프레임
+        logger (logging.Logger): 메모리 리포트를 기록할 logger
+
+    Returns:
+        pd.DataFrame: 변환된 데이터프레임
+    """
+    report = []
+    converted = {}
+    for column in df.columns:
+        before = df[column].memory_usage(index=False, deep=True)
+        dtype = compact_dtype(df[column])
+        if dtype != df[column].dtype:
+            converted[column] = df[column].to_numpy().astype(dtype)
+            after = converted[column].nbytes
+        else:
+            after = before
+        report.append(
+            {
+                "column": column,
+                "from": str(df[column].dtype),
+                "to": str(dtype),
+                "before": before,
+                "after": after,
+            }
+        )
+
+    if converted:
+        df = df.assign(**converted)
+    if logger is not None:
+        log_memory_report(report, logger)
+    return df
+
+
+def log_memory_report(report: List[Dict], logger: logging.Logger) -> None:
+    """컬럼별 메모리 사용량 변화 로깅
+
+    Args:
+        report (List[Dict]): downcast_dataframe 의 컬럼별 결과
+        logger (logging.Logger): 기록할 logger
+
+    Returns:
+        None
+    """
+    total_before = sum(item["before"] for item in report)
+    total_after = sum(item["after"] for item in report)
+    logger.info("Memory Report---------------------------------------")
+    for item in report:
+        logger.info(
+            "{0:<20} {1:>8} -> {2:<8} {3:>12,} -> {4:>12,} bytes".format(
+                item["column"], item["from"], item["to"], item["before"], item["after"]
+            )
+        )
+    ratio = total_after / total_before if total_before else 1.0
+    logger.info(
+        "total: {0:,} -> {1:,} bytes ({2:.1%})".format(total_before, total_after, ratio)
+    )
+    logger.info("-----------------------------------------------------")
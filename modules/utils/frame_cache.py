@@ -0,0 +1,192 @@
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from modules.utils.file_handler import chk_and_make_dir
+
+cache_logger = logging.getLogger("FrameCache")
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_content_hash(file_path: str) -> str:
+    """파일 내용의 sha256 해시를 블록 단위로 계산
+
+    Args:
+        file_path (str): 해시를 계산할 파일 경로
+
+    Returns:
+        str: sha256 hex digest
+    """
+    sha = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def file_fingerprint(file_path: str, known: Optional[Dict] = None) -> Dict:
+    """파일의 크기, 수정 시간, 내용 해시로 fingerprint 생성
+        크기와 수정 시간이 known 과 같으면 저장된 해시를 재사용해 파일을 다시 읽지 않음
+
+    Args:
+        file_path (str): fingerprint를 계산할 파일 경로
+        known (Dict): 이전에 계산한 fingerprint
+
+    Returns:
+        Dict: size, mtime_ns, sha256
+    """
+    stat = os.stat(file_path)
+    fingerprint = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if (
+        known is not None
+        and known.get("size") == fingerprint["size"]
+        and known.get("mtime_ns") == fingerprint["mtime_ns"]
+        and known.get("sha256")
+    ):
+        fingerprint["sha256"] = known["sha256"]
+    else:
+        fingerprint["sha256"] = file_content_hash(file_path)
+    return fingerprint
+
+
+def schema_key(columns: List[str], dtypes: Dict[str, str]) -> str:
+    """컬럼 목록과 dtype 스키마로 캐시 키 생성
+
+    Args:
+        columns (List[str]): 읽을 컬럼 목록 (순서 포함)
+        dtypes (Dict[str, str]): 컬럼별 dtype
+
+    Returns:
+        str: sha256 hex digest
+    """
+    payload = json.dumps(
+        {"columns": list(columns), "dtypes": {c: str(dtypes.get(c)) for c in columns}},
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class FrameCache:
+    """FrameCache class
+        CSV 원본을 컬럼 단위 포맷(parquet/feather)으로 캐시
+        원본 파일의 크기, 수정 시간, 내용 해시와 컬럼 스키마가 바뀌면 캐시를 무효화
+
+    Attributes:
+        _cache_dir (str): 캐시 파일을 저장할 디렉토리 경로
+        _format (str): 캐시 포맷 (parquet, feather)
+    """
+
+    _FORMATS = ("parquet", "feather")
+
+    def __init__(self, cache_dir: str, cache_format: str = "parquet") -> None:
+        if cache_format not in self._FORMATS:
+            raise ValueError(f"unsupported cache format: {cache_format}")
+        self._cache_dir = cache_dir
+        self._format = cache_format
+
+    def _paths(self, source_path: str):
+        name = os.path.splitext(os.path.basename(source_path))[0]
+        data_path = os.path.join(self._cache_dir, f"{name}.{self._format}")
+        meta_path = os.path.join(self._cache_dir, f"{name}.meta.json")
+        return data_path, meta_path
+
+    def _read_meta(self, meta_path: str) -> Optional[Dict]:
+        if not os.path.exists(meta_path):
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, meta_path: str, meta: Dict) -> None:
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, meta_path)
+
+    def load(
+        self, source_path: str, columns: List[str], dtypes: Dict[str, str]
+    ) -> Optional[pd.DataFrame]:
+        """유효한 캐시가 있으면 불러오고, 없으면 None 반환
+
+        Args:
+            source_path (str): 원본 CSV 경로
+            columns (List[str]): 읽을 컬럼 목록
+            dtypes (Dict[str, str]): 컬럼별 dtype
+
+        Returns:
+            Optional[pd.DataFrame]: 캐시된 데이터
+        """
+        data_path, meta_path = self._paths(source_path)
+        meta = self._read_meta(meta_path)
+        if meta is None or not os.path.exists(data_path):
+            return None
+        if meta.get("format") != self._format:
+            return None
+        if meta.get("schema_key") != schema_key(columns, dtypes):
+            cache_logger.info("cache schema changed, rebuilding: " + data_path)
+            return None
+
+        known = meta.get("source", {})
+        stat = os.stat(source_path)
+        if stat.st_size != known.get("size"):
+            cache_logger.info("source size changed, rebuilding: " + data_path)
+            return None
+
+        fingerprint = file_fingerprint(source_path, known)
+        if fingerprint["sha256"] != known.get("sha256"):
+            cache_logger.info("source content changed, rebuilding: " + data_path)
+            return None
+        if fingerprint["mtime_ns"] != known.get("mtime_ns"):
+            # 내용은 같고 수정 시간만 바뀐 경우(touch 등), 해시를 다시 계산하지 않도록 갱신
+            meta["source"] = fingerprint
+            self._write_meta(meta_path, meta)
+
+        if self._format == "parquet":
+            data = pd.read_parquet(data_path, columns=columns)
+        else:
+            data = pd.read_feather(data_path, columns=columns)
+        cache_logger.info("loaded cache: " + data_path)
+        return data
+
+    def save(
+        self,
+        data: pd.DataFrame,
+        source_path: str,
+        columns: List[str],
+        dtypes: Dict[str, str],
+    ) -> None:
+        """데이터를 캐시로 저장
+
+        Args:
+            data (pd.DataFrame): 저장할 데이터
+            source_path (str): 원본 CSV 경로
+            columns (List[str]): 읽은 컬럼 목록
+            dtypes (Dict[str, str]): 컬럼별 dtype
+
+        Returns:
+            None
+        """
+        chk_and_make_dir(self._cache_dir)
+        data_path, meta_path = self._paths(source_path)
+        tmp_path = data_path + ".tmp"
+        data = data.reset_index(drop=True)
+        if self._format == "parquet":
+            data.to_parquet(tmp_path, index=False)
+        else:
+            data.to_feather(tmp_path)
+        os.replace(tmp_path, data_path)
+
+        meta = {
+            "format": self._format,
+            "schema_key": schema_key(columns, dtypes),
+            "source": file_fingerprint(source_path),
+        }
+        self._write_meta(meta_path, meta)
+        cache_logger.info("saved cache: " + data_path)
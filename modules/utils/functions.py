@@ -1,13 +1,13 @@
 from multiprocessing import cpu_count
+from typing import Tuple
 
 import numpy as np
 import pandas as pd
-from pathos.multiprocessing import ProcessingPool as Pool
 
 
 def parallelize_dataframe(func, df: pd.DataFrame) -> pd.DataFrame:
     """데이터프레임을 분할해서 cpu 병렬처리
-    multi process
+    multi process (프로세스 공용 DataFramePool 재사용)
 
     Args:
         func ([type]): cpu 병렬처리에 사용할 함수
@@ -16,27 +16,15 @@ def parallelize_dataframe(func, df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: cpu 병렬처리된 데이터프레임
     """
+    # config 만 읽는 명령이 pathos 를 불러오지 않도록 사용할 때 import
+    from modules.utils.dataframe_pool import get_dataframe_pool
 
-    num_cores = cpu_count() - 1
-    pool = Pool(num_cores)
-
-    df_split = np.array_split(df, num_cores)
-
-    len_df = len(df_split)
-    if len_df < num_cores:
-        num_cores = len_df
-
-    df = pd.concat(pool.map(func, df_split))
-
-    pool.close()
-    pool.join()
-    pool.clear()
-    return df
+    return get_dataframe_pool().map(func, df)
 
 
 def parallelize_dataframe_with_args(func, df: pd.DataFrame, *args) -> pd.DataFrame:
     """데이터프레임을 분할해서 cpu 병렬처리(func에 인자값이 필요한 경우)
-    multi process
+    multi process (프로세스 공용 DataFramePool 재사용)
 
     Args:
         func ([type]): cpu 병렬처리에 사용할 함수
@@ -46,28 +34,28 @@ def parallelize_dataframe_with_args(func, df: pd.DataFrame, *args) -> pd.DataFra
     Returns:
         pd.DataFrame: cpu 병렬처리된 데이터프레임
     """
+    from modules.utils.dataframe_pool import get_dataframe_pool
 
-    num_cores = cpu_count() - 1
-    pool = Pool(num_cores)
+    # 기존과 같이 인자값은 list 하나로 func 에 전달
+    return get_dataframe_pool().map(func, df, list(args))
 
-    df_split = np.array_split(df, num_cores)
 
-    len_df = len(df_split)
-    if len_df < num_cores:
-        num_cores = len_df
+def cpu_budget(n_tasks: int, max_workers: int = None) -> Tuple[int, int]:
+    """cpu 코어를 프로세스 수와 프로세스당 thread 수로 분배
+        프로세스 수 x thread 수가 코어 수를 넘지 않도록 함
 
-    list_tuple_args = []
-    list_args = list(args)
+    Args:
+        n_tasks (int): 병렬로 실행할 작업 수
+        max_workers (int): 최대 프로세스 수, None 또는 0 이하이면 cpu 수 - 1
 
-    for item in df_split:
-        each_list_class = [item]
-        each_list_class.append(list_args)
-        list_tuple_args.append(tuple(each_list_class))
-    df = pd.concat(pool.map(lambda x: func(*x), list_tuple_args))
-    pool.close()
-    pool.join()
-    pool.clear()
-    return df
+    Returns:
+        Tuple[int, int]: 프로세스 수, 프로세스당 thread 수
+    """
+    total = cpu_count()
+    if max_workers is None or max_workers <= 0:
+        max_workers = max(total - 1, 1)
+    n_workers = max(min(n_tasks, max_workers, total), 1)
+    return n_workers, max(total // n_workers, 1)
 
 
 def string_to_boolean(arg_str: str) -> bool or np.NaN:
@@ -148,7 +136,7 @@ def is_number(value: str):
     try:
         judge = str(float(value))
         return False if (judge == "nan" or judge == "inf" or judge == "-inf") else True
-    except ValueError:
+    except (TypeError, ValueError):
         return False
 
 
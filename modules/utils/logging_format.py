@@ -31,6 +31,14 @@ class CustomFormatter(logging.Formatter):
         logging.CRITICAL: __log_format.format(__bold_red, __reset),
     }
 
+    def __init__(self) -> None:
+        super().__init__(datefmt="%Y/%m/%d %H:%M:%S")
+        # level 별 formatter 는 한 번만 생성
+        self.__formatters = {
+            level: logging.Formatter(log_fmt, datefmt="%Y/%m/%d %H:%M:%S")
+            for level, log_fmt in self.__FORMATS.items()
+        }
+
     def format(self, record) -> str:
         """log format에 따라 log 기록
 
@@ -40,10 +48,7 @@ class CustomFormatter(logging.Formatter):
         Returns:
             str : 설정한 format에 맞춘 record
         """
-        log_fmt = self.__FORMATS.get(record.levelno)
-
-        formatter = logging.Formatter(
-            log_fmt,
-            datefmt="%Y/%m/%d %H:%M:%S",
-        )
+        formatter = self.__formatters.get(record.levelno)
+        if formatter is None:
+            return super().format(record)
         return formatter.format(record)
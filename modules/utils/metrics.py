@@ -0,0 +1,226 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+# bootstrap 한 batch 에서 만드는 (표본 수 x 행 수) 행렬의 최대 원소 수
+MAX_BOOTSTRAP_ELEMENTS = 5_000_000
+
+
+def _divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """0 으로 나누면 0"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    return np.divide(numerator, denominator, out=out, where=denominator > 0)
+
+
+def confusion_matrix(actual: np.ndarray, predict: np.ndarray) -> Tuple[int, int, int, int]:
+    """라벨 하나에 대한 (tp, fp, fn, tn), bincount 한 번으로 계산"""
+    counts = np.bincount(
+        np.asarray(actual, dtype=np.int64).ravel() * 2
+        + np.asarray(predict, dtype=np.int64).ravel(),
+        minlength=4,
+    )
+    tn, fp, fn, tp = (int(count) for count in counts)
+    return tp, fp, fn, tn
+
+
+def binary_metrics(actual: np.ndarray, predict: np.ndarray) -> Dict[str, float]:
+    """라벨 하나에 대한 정확도, F1 score, 민감도, 특이도"""
+    return metrics_from_confusion(*confusion_matrix(actual, predict))
+
+
+def metrics_from_confusion(tp: int, fp: int, fn: int, tn: int) -> Dict[str, float]:
+    """(tp, fp, fn, tn) 으로 정확도, F1 score, 민감도, 특이도 (chunk 별로 누적한 값에도 사용)"""
+    return {
+        "accuracy": float(_divide(tp + tn, tp + fp + fn + tn)),
+        "f1": float(_divide(2 * tp, 2 * tp + fp + fn)),
+        "sensitivity": float(_divide(tp, tp + fn)),
+        "specificity": float(_divide(tn, tn + fp)),
+    }
+
+
+def threshold_confusion(
+    actual: np.ndarray, proba: np.ndarray, thresholds: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """threshold 격자 전체의 confusion matrix 를 bincount 한 번으로 계산
+        각 행을 (proba 이하인 threshold 수, 라벨) 칸에 세고
+        뒤에서부터 누적하면 threshold 별 양성 예측 수가 됨 (proba >= threshold 이면 양성)
+
+    Args:
+        actual (np.ndarray): 실제 라벨 (0, 1)
+        proba (np.ndarray): 양성 확률
+        thresholds (np.ndarray): 오름차순 threshold 격자
+
+    Returns:
+        Dict[str, np.ndarray]: threshold 별 tp, fp, fn, tn
+    """
+    actual = np.asarray(actual, dtype=np.int64).ravel()
+    n_above = np.searchsorted(thresholds, np.asarray(proba).ravel(), side="right")
+    counts = np.bincount(
+        n_above * 2 + actual, minlength=(len(thresholds) + 1) * 2
+    ).reshape(-1, 2)
+    # threshold j 에서 양성 예측 = j 보다 많은 threshold 를 넘은 행
+    above = np.cumsum(counts[::-1], axis=0)[::-1][1:]
+    tp, fp = above[:, 1], above[:, 0]
+    positives, negatives = counts[:, 1].sum(), counts[:, 0].sum()
+    return {"tp": tp, "fp": fp, "fn": positives - tp, "tn": negatives - fp}
+
+
+def threshold_curves(
+    actual: np.ndarray, proba: np.ndarray, n_thresholds: int = 201
+) -> Dict[str, np.ndarray]:
+    """threshold 격자 별 F1, 민감도, 특이도, 정밀도, 정확도"""
+    thresholds = np.linspace(0, 1, n_thresholds)
+    confusion = threshold_confusion(actual, proba, thresholds)
+    return curves_from_confusion(thresholds, confusion)
+
+
+def curves_from_confusion(
+    thresholds: np.ndarray, confusion: Dict[str, np.ndarray]
+) -> Dict[str, np.ndarray]:
+    """threshold_confusion 결과 (chunk 별로 더한 값도 가능) 로 threshold 별 지표 계산"""
+    tp, fp, fn, tn = confusion["tp"], confusion["fp"], confusion["fn"], confusion["tn"]
+    return {
+        "threshold": thresholds,
+        "f1": _divide(2 * tp, 2 * tp + fp + fn),
+        "sensitivity": _divide(tp, tp + fn),
+        "specificity": _divide(tn, tn + fp),
+        "precision": _divide(tp, tp + fp),
+        "accuracy": _divide(tp + tn, tp + fp + fn + tn),
+    }
+
+
+def select_threshold(
+    curves: Dict[str, np.ndarray], method: str = "f1", target_sensitivity: float = 0.9
+) -> float:
+    """운영 threshold 선택
+
+    Args:
+        curves (Dict[str, np.ndarray]): threshold_curves 결과
+        method (str): f1 (F1 score 최대) 또는 sensitivity (목표 민감도를 만족하는 가장 높은 threshold)
+        target_sensitivity (float): method 가 sensitivity 일 때 목표 민감도
+
+    Returns:
+        float: 선택한 threshold
+    """
+    if method == "f1":
+        return float(curves["threshold"][np.argmax(curves["f1"])])
+    if method == "sensitivity":
+        # threshold 가 높을수록 특이도가 높으므로 조건을 만족하는 가장 높은 값
+        meets = np.flatnonzero(curves["sensitivity"] >= target_sensitivity)
+        return float(curves["threshold"][meets[-1]]) if len(meets) else 0.0
+    raise ValueError(f"unknown threshold method: {method}")
+
+
+class RankedScores:
+    """RankedScores class
+        확률을 한 번 정렬해 두고 ROC-AUC, PR-AUC 와 threshold 지표를 계산
+        bootstrap 은 행별 추출 횟수를 가중치로 같은 정렬 결과를 재사용
+
+    Attributes:
+        _labels (np.ndarray): 확률 내림차순으로 정렬한 라벨
+        _proba (np.ndarray): 내림차순으로 정렬한 확률
+        _distinct (np.ndarray): 같은 확률 묶음의 마지막 위치
+    """
+
+    def __init__(self, actual: np.ndarray, proba: np.ndarray) -> None:
+        proba = np.asarray(proba, dtype=np.float64).ravel()
+        order = np.argsort(-proba, kind="stable")
+        self._proba = proba[order]
+        self._labels = np.asarray(actual, dtype=np.float64).ravel()[order]
+        self._distinct = np.r_[np.flatnonzero(np.diff(self._proba)), len(proba) - 1]
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def _n_above(self, threshold: float) -> int:
+        """proba >= threshold 인 행 수 (정렬된 앞부분)"""
+        return int(np.searchsorted(-self._proba, -threshold, side="right"))
+
+    def _metrics(
+        self, weights: np.ndarray, thresholds: Dict[str, float]
+    ) -> Dict[str, np.ndarray]:
+        """가중치 행렬 (표본 수 x 행 수) 별 지표
+
+        Args:
+            weights (np.ndarray): 행별 가중치, 원래 표본은 모두 1
+            thresholds (Dict[str, float]): 이름 -> threshold 지표를 계산할 값
+
+        Returns:
+            Dict[str, np.ndarray]: 지표 -> 표본별 값
+        """
+        tps = np.cumsum(weights * self._labels, axis=1)
+        fps = np.cumsum(weights, axis=1) - tps
+        positives, negatives = tps[:, -1:], fps[:, -1:]
+
+        # 같은 확률은 한 번에 넘으므로 묶음의 마지막 위치에서만 곡선을 만듦
+        tps_distinct, fps_distinct = tps[:, self._distinct], fps[:, self._distinct]
+        tpr = _divide(tps_distinct, positives)
+        fpr = _divide(fps_distinct, negatives)
+        precision = _divide(tps_distinct, tps_distinct + fps_distinct)
+        zeros = np.zeros((len(weights), 1))
+        tpr, fpr = np.hstack([zeros, tpr]), np.hstack([zeros, fpr])
+
+        metrics = {
+            "roc_auc": np.sum(np.diff(fpr, axis=1) * (tpr[:, 1:] + tpr[:, :-1]) / 2, axis=1),
+            # average precision: recall 증가분 x 그 지점의 precision
+            "pr_auc": np.sum(np.diff(tpr, axis=1) * precision, axis=1),
+        }
+        for name, threshold in thresholds.items():
+            n_above = self._n_above(threshold)
+            tp = tps[:, n_above - 1] if n_above > 0 else np.zeros(len(weights))
+            fp = fps[:, n_above - 1] if n_above > 0 else np.zeros(len(weights))
+            fn, tn = positives[:, 0] - tp, negatives[:, 0] - fp
+            metrics[f"{name}_f1"] = _divide(2 * tp, 2 * tp + fp + fn)
+            metrics[f"{name}_sensitivity"] = _divide(tp, tp + fn)
+            metrics[f"{name}_specificity"] = _divide(tn, tn + fp)
+        return metrics
+
+    def auc(self) -> Dict[str, float]:
+        """ROC-AUC, PR-AUC (average precision)"""
+        metrics = self._metrics(np.ones((1, len(self))), {})
+        return {key: float(value[0]) for key, value in metrics.items()}
+
+    def bootstrap(
+        self,
+        threshold: float,
+        n_bootstrap: int = 200,
+        confidence: float = 0.95,
+        random_state: int = None,
+    ) -> Dict[str, Tuple[float, float]]:
+        """bootstrap 신뢰구간
+            표본마다 행별 추출 횟수를 bincount 로 만들고 정렬된 점수에 가중치로 적용
+            메모리를 제한하기 위해 표본을 batch 로 나눠 계산
+
+        Args:
+            threshold (float): F1, 민감도, 특이도를 계산할 threshold
+            n_bootstrap (int): bootstrap 표본 수
+            confidence (float): 신뢰수준
+            random_state (int): 난수 seed
+
+        Returns:
+            Dict[str, Tuple[float, float]]: 지표 -> (하한, 상한)
+        """
+        rng = np.random.default_rng(random_state)
+        n_rows = len(self)
+        batch_size = max(MAX_BOOTSTRAP_ELEMENTS // max(n_rows, 1), 1)
+        samples = {}
+        for start in range(0, n_bootstrap, batch_size):
+            n_samples = min(batch_size, n_bootstrap - start)
+            picks = rng.integers(0, n_rows, size=(n_samples, n_rows))
+            offsets = np.arange(n_samples)[:, None] * n_rows
+            weights = np.bincount(
+                (picks + offsets).ravel(), minlength=n_samples * n_rows
+            ).reshape(n_samples, n_rows)
+            for key, values in self._metrics(weights, {"threshold": threshold}).items():
+                samples.setdefault(key, []).append(values)
+
+        alpha = (1 - confidence) / 2 * 100
+        return {
+            key: tuple(
+                float(value)
+                for value in np.percentile(np.concatenate(values), [alpha, 100 - alpha])
+            )
+            for key, values in samples.items()
+        }
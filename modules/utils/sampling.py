@@ -0,0 +1,134 @@
+from typing import List, Tuple
+
+import numpy as np
+
+
+def stratified_split_indices(
+    target: np.ndarray, test_size: float, random_state: int = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """라벨 비율을 유지하는 train/test index 분할
+        데이터를 복사하지 않고 index 배열만 생성
+
+    Args:
+        target (np.ndarray): 라벨 배열
+        test_size (float): test 비율
+        random_state (int): 난수 seed
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: train index, test index (각각 섞인 순서)
+    """
+    rng = np.random.default_rng(random_state)
+    train_parts = []
+    test_parts = []
+    for label in np.unique(target):
+        label_idx = rng.permutation(np.flatnonzero(target == label))
+        n_test = int(round(len(label_idx) * test_size))
+        test_parts.append(label_idx[:n_test])
+        train_parts.append(label_idx[n_test:])
+    train_idx = rng.permutation(np.concatenate(train_parts))
+    test_idx = rng.permutation(np.concatenate(test_parts))
+    return train_idx, test_idx
+
+
+def stratified_kfold_indices(
+    target: np.ndarray, n_splits: int, random_state: int = None
+) -> List[Tuple[np.ndarray, np.ndarray]]:
+    """라벨 비율을 유지하는 K-fold index 분할
+
+    Args:
+        target (np.ndarray): 라벨 배열
+        n_splits (int): fold 수
+        random_state (int): 난수 seed
+
+    Returns:
+        List[Tuple[np.ndarray, np.ndarray]]: fold 별 (train index, test index)
+    """
+    rng = np.random.default_rng(random_state)
+    fold_parts = [[] for _ in range(n_splits)]
+    for label in np.unique(target):
+        label_idx = rng.permutation(np.flatnonzero(target == label))
+        for fold, part in enumerate(np.array_split(label_idx, n_splits)):
+            fold_parts[fold].append(part)
+    folds = [np.concatenate(parts) for parts in fold_parts]
+
+    splits = []
+    for fold in range(n_splits):
+        train_idx = np.concatenate([folds[i] for i in range(n_splits) if i != fold])
+        splits.append((rng.permutation(train_idx), folds[fold]))
+    return splits
+
+
+def undersample_indices(
+    target: np.ndarray,
+    indices: np.ndarray,
+    random_state: int = None,
+    minority_label: int = 1,
+) -> np.ndarray:
+    """다수 클래스를 소수 클래스 개수만큼 무작위 추출한 index 반환
+
+    Args:
+        target (np.ndarray): 전체 라벨 배열
+        indices (np.ndarray): 추출 대상 index
+        random_state (int): 난수 seed
+        minority_label (int): 소수 클래스 라벨
+
+    Returns:
+        np.ndarray: 소수 클래스 전체 + 추출된 다수 클래스 index (섞인 순서)
+    """
+    rng = np.random.default_rng(random_state)
+    is_minority = target[indices] == minority_label
+    minority = indices[is_minority]
+    majority = indices[~is_minority]
+    n_majority = min(len(minority), len(majority))
+    majority = rng.choice(majority, size=n_majority, replace=False)
+    return rng.permutation(np.concatenate([minority, majority]))
+
+
+def balanced_bag_indices(
+    target: np.ndarray,
+    indices: np.ndarray,
+    n_bags: int,
+    random_state: int = None,
+    minority_label: int = 1,
+) -> List[np.ndarray]:
+    """EasyEnsemble 용 balanced bag index 생성
+        bag 마다 소수 클래스 전체와 서로 다른 다수 클래스 구간을 짝지음
+        다수 클래스가 부족하면 섞인 순서를 순환하며 사용
+
+    Args:
+        target (np.ndarray): 전체 라벨 배열
+        indices (np.ndarray): 추출 대상 index
+        n_bags (int): bag 수
+        random_state (int): 난수 seed
+        minority_label (int): 소수 클래스 라벨
+
+    Returns:
+        List[np.ndarray]: bag 별 index (섞인 순서)
+    """
+    rng = np.random.default_rng(random_state)
+    is_minority = target[indices] == minority_label
+    minority = indices[is_minority]
+    majority = rng.permutation(indices[~is_minority])
+    n_majority = min(len(minority), len(majority))
+
+    bags = []
+    for bag in range(n_bags):
+        positions = (bag * n_majority + np.arange(n_majority)) % max(len(majority), 1)
+        bags.append(rng.permutation(np.concatenate([minority, majority[positions]])))
+    return bags
+
+
+def gather_rows(matrix: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """index 에 해당하는 행을 한 번에 모아 C-contiguous 배열로 반환
+        index 가 연속 구간이면 복사 없이 view 반환
+
+    Args:
+        matrix (np.ndarray): 2차원 또는 1차원 배열
+        indices (np.ndarray): 행 index
+
+    Returns:
+        np.ndarray: 선택된 행
+    """
+    if len(indices) > 0 and np.all(np.diff(indices) == 1):
+        return matrix[indices[0] : indices[-1] + 1]
+    return np.take(matrix, indices, axis=0)
@@ -0,0 +1,231 @@
+import itertools
+import json
+import os
+import threading
+from collections import deque
+from typing import Dict, Tuple
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # windows 에서는 peak RSS 를 기록하지 않음
+    resource = None
+
+PERCENTILES = (50, 90, 99)
+
+# 호출마다의 peak 이므로 합계를 내지 않는 메모리 측정값
+MEMORY_KEYS = ("rss_start_mb", "rss_delta_mb", "tracemalloc_peak_mb")
+
+
+def peak_rss_mb() -> float:
+    """프로세스 시작 후 최대 RSS (MB), 측정할 수 없으면 None"""
+    if resource is None:
+        return None
+    # linux 는 KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def current_rss_mb() -> float:
+    """현재 RSS (MB), /proc 이 없어 측정할 수 없으면 None"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+class RssSampler:
+    """RssSampler class
+        측정 중인 구간이 있는 동안 현재 RSS 를 주기적으로 읽어 구간별 최대 RSS 를 갱신
+        ru_maxrss 는 프로세스 전체의 최대값이라 앞 구간의 peak 가 뒤 구간에 그대로 남으므로
+        구간이 프로세스 최대값을 새로 갱신한 경우에만 함께 사용
+        sampling thread 하나를 여러 구간 (중첩, 여러 thread) 이 공유
+
+    Attributes:
+        _interval (float): sampling 간격 (초)
+        _active (Dict[int, list]): 측정 중인 구간 -> [시작 RSS, 최대 RSS, 시작 시 ru_maxrss]
+    """
+
+    def __init__(self, interval: float = 0.01) -> None:
+        self._interval = interval
+        self._reset()
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        self._condition = threading.Condition()
+        self._active = {}
+        self._tokens = itertools.count()
+        self._thread = None
+
+    def _sample(self) -> None:
+        while True:
+            with self._condition:
+                while not self._active:
+                    self._condition.wait()
+                # 간격만큼 기다리되 구간이 모두 끝나면 다시 대기
+                self._condition.wait(self._interval)
+                if not self._active:
+                    continue
+            rss = current_rss_mb()
+            with self._condition:
+                for interval in self._active.values():
+                    interval[1] = max(interval[1], rss)
+
+    def start(self) -> int:
+        """구간 측정 시작
+
+        Returns:
+            int: stop 에 전달할 token, 현재 RSS 를 측정할 수 없으면 None
+        """
+        rss = current_rss_mb()
+        if rss is None:
+            return None
+        if self._pid != os.getpid():
+            # fork 된 프로세스에는 sampling thread 가 없음
+            self._reset()
+        with self._condition:
+            token = next(self._tokens)
+            self._active[token] = [rss, rss, peak_rss_mb()]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample, daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return token
+
+    def stop(self, token: int) -> Tuple[float, float]:
+        """구간 측정 종료
+
+        Args:
+            token (int): start 가 반환한 token
+
+        Returns:
+            Tuple[float, float]: (구간 시작 RSS, 시작 대비 최대 RSS 증가량) (MB), 측정할 수 없으면 None
+        """
+        if token is None:
+            return None, None
+        rss = current_rss_mb()
+        maxrss = peak_rss_mb()
+        with self._condition:
+            start, peak, maxrss_start = self._active.pop(token)
+        peak = max(peak, rss)
+        # 샘플 사이의 짧은 peak 도 프로세스 최대값을 갱신했다면 정확히 반영
+        if maxrss is not None and maxrss > maxrss_start:
+            peak = max(peak, maxrss)
+        return start, peak - start
+
+
+class StageMetricsRegistry:
+    """StageMetricsRegistry class
+        RunningTimeDecorator 가 측정한 단계별 호출 기록을 프로세스 단위로 모음
+        호출 수, 누적 시간, 백분위수를 계산해 json 또는 mlflow 지표로 내보냄
+
+    Attributes:
+        tracemalloc (bool): python 메모리 할당 peak 측정 여부 (느려짐)
+        profile_dir (str): cProfile 결과 저장 디렉토리, None 이면 profiling 하지 않음
+        _window (int): 단계별로 보관할 최근 호출 수
+        _stages (Dict[str, Dict]): 단계 이름 -> 호출 수, 누적값, 최근 측정값
+    """
+
+    def __init__(self, window: int = 10000) -> None:
+        self.tracemalloc = False
+        self.profile_dir = None
+        self._window = window
+        self._stages = {}
+        self._lock = threading.Lock()
+
+    def configure(self, tracemalloc: bool = False, profile_dir: str = None) -> None:
+        self.tracemalloc = tracemalloc
+        self.profile_dir = profile_dir
+
+    def record(self, name: str, stats: Dict[str, float]) -> None:
+        with self._lock:
+            stage = self._stages.get(name)
+            if stage is None:
+                stage = {"count": 0, "totals": {}, "values": {}}
+                self._stages[name] = stage
+            stage["count"] += 1
+            for key, value in stats.items():
+                if value is None:
+                    continue
+                if key not in MEMORY_KEYS:
+                    stage["totals"][key] = stage["totals"].get(key, 0.0) + value
+                stage["values"].setdefault(key, deque(maxlen=self._window)).append(value)
+
+    def summary(self) -> Dict[str, Dict]:
+        """단계별 호출 수와 측정값의 합계, 평균, 백분위수, 최대값
+
+        Returns:
+            Dict[str, Dict]: 단계 이름 -> 요약
+        """
+        with self._lock:
+            stages = {
+                name: (stage["count"], dict(stage["totals"]), {
+                    key: np.asarray(values, dtype=np.float64)
+                    for key, values in stage["values"].items()
+                })
+                for name, stage in self._stages.items()
+            }
+
+        summary = {}
+        for name, (count, totals, values) in stages.items():
+            stage_summary = {"count": count}
+            for key, array in values.items():
+                # 메모리 값은 합계가 의미 없으므로 total 을 두지 않음
+                stage_summary[key] = {
+                    **({"total": totals[key]} if key in totals else {}),
+                    "mean": float(array.mean()),
+                    "max": float(array.max()),
+                    **{
+                        f"p{q}": float(value)
+                        for q, value in zip(PERCENTILES, np.percentile(array, PERCENTILES))
+                    },
+                }
+            summary[name] = stage_summary
+        return summary
+
+    def mlflow_metrics(self) -> Dict[str, float]:
+        """mlflow 에 기록할 수 있는 평평한 지표 (stage/<단계>/<측정값>_<통계>)"""
+        metrics = {}
+        for name, stage_summary in self.summary().items():
+            metrics[f"stage/{name}/count"] = stage_summary["count"]
+            for key, stats in stage_summary.items():
+                if key == "count":
+                    continue
+                for stat in ("total", "p50", "p99", "max"):
+                    if stat in stats:
+                        metrics[f"stage/{name}/{key}_{stat}"] = stats[stat]
+        return metrics
+
+    def export_json(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"pid": os.getpid(), "stages": self.summary()},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        return path
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+
+
+_registry = StageMetricsRegistry()
+_rss_sampler = RssSampler()
+
+
+def get_registry() -> StageMetricsRegistry:
+    """프로세스 공용 StageMetricsRegistry 반환"""
+    return _registry
+
+
+def get_rss_sampler() -> RssSampler:
+    """프로세스 공용 RssSampler 반환"""
+    return _rss_sampler
@@ -0,0 +1,7 @@
+import sys
+
+from modules.cli import main
+
+if __name__ == "__main__":
+    # python cli.py search ... 와 같음
+    sys.exit(main(["search"] + sys.argv[1:]))
@@ -0,0 +1,7 @@
+import sys
+
+from modules.cli import main
+
+if __name__ == "__main__":
+    # python cli.py serve ... 와 같음
+    sys.exit(main(["serve"] + sys.argv[1:]))
@@ -0,0 +1,43 @@
+import copy
+import os
+
+import pytest
+
+from modules.config import Config
+from modules.synthetic import write_screening_csv
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def config(tmp_path):
+    """저장소의 config.ini 설정, 경로는 임시 디렉토리로 바꾸고 테스트 후 원래 값으로 복원"""
+    try:
+        Config.instance(os.path.join(ROOT, "config", "config.ini"))
+    except TypeError:
+        # 이미 초기화된 singleton
+        pass
+    config = Config.instance().config
+    original = copy.deepcopy(config)
+    for name in config["path"]:
+        config["path"][name] = str(tmp_path / name) + os.sep
+    yield config
+    config.clear()
+    config.update(original)
+
+
+@pytest.fixture
+def fast_config(config):
+    """작은 모델과 적은 bootstrap 으로 빠르게 학습하는 설정"""
+    config["cache"]["use_cache"] = "false"
+    config["hyper_parameter"]["n_estimators"] = 10
+    config["threshold"]["n_bootstrap"] = 10
+    return config
+
+
+@pytest.fixture
+def screening_csv(tmp_path):
+    """합성 검진 데이터 CSV 경로"""
+    source_path = str(tmp_path / "data.csv")
+    write_screening_csv(source_path, 3000, 0)
+    return source_path
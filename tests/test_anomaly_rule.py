@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.anomaly_rule import AnomalyRule, AnomalyRuleEngine
+
+
+def _engine():
+    return AnomalyRuleEngine(
+        [
+            AnomalyRule("hearing", values=[3], name="hearing sentinel"),
+            AnomalyRule("waist", values=[999.0, 680.0], name="waist sentinel"),
+            AnomalyRule("waist", max=200, name="waist range"),
+        ],
+        [AnomalyRule("sight", values=[9.9], to=0, name="sight sentinel")],
+    )
+
+
+def _data():
+    return pd.DataFrame(
+        {
+            "hearing": [1, 3, 1, 3, 1, 1],
+            "waist": [80.0, 999.0, 680.0, 90.0, 300.0, 70.0],
+            "sight": np.array([1.0, 9.9, 0.5, 9.9, 9.9, 9.9], dtype=np.float32),
+        },
+        index=[10, 11, 12, 13, 14, 15],
+    )
+
+
+def test_drop_counts_each_row_under_first_matching_rule():
+    engine = _engine()
+    result = engine.apply(_data())
+
+    assert list(result.index) == [10, 15]
+    # 11 은 hearing, waist 둘 다 해당하지만 먼저 정의된 hearing 에만 집계
+    assert engine.report() == [
+        ("hearing sentinel", 2),
+        ("waist sentinel", 1),
+        ("waist range", 1),
+    ]
+
+
+def test_counts_accumulate_over_chunks_until_reset():
+    engine = _engine()
+    data = _data()
+    engine.apply(data.iloc[:3])
+    engine.apply(data.iloc[3:])
+    assert engine.removed_counts == {
+        "hearing sentinel": 2,
+        "waist sentinel": 1,
+        "waist range": 1,
+    }
+
+    engine.reset_counts()
+    assert set(engine.removed_counts.values()) == {0}
+
+
+def test_replace_matches_float32_sentinel_and_keeps_dtype():
+    result = _engine().apply(_data())
+
+    assert result["sight"].dtype == np.float32
+    assert result["sight"].tolist() == [1.0, 0.0]
+
+
+def test_rules_for_missing_columns_are_skipped():
+    engine = _engine()
+    data = _data().drop(columns=["hearing"])
+
+    assert list(engine.apply(data).index) == [10, 13, 15]
+    assert engine.removed_counts["hearing sentinel"] == 0
+
+
+def test_invalid_rules_raise():
+    with pytest.raises(ValueError):
+        AnomalyRule("waist")
+    with pytest.raises(ValueError):
+        AnomalyRuleEngine([], [AnomalyRule("sight", values=[9.9])])
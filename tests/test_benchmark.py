@@ -0,0 +1,27 @@
+import numpy as np
+
+from modules.benchmark import compare_with_baseline, measure
+
+
+def _result(wall_s, rss_delta_mb):
+    return {
+        "results": {
+            "1000": {"stages": {"_fit": {"wall_s": wall_s, "rss_delta_mb": rss_delta_mb}}}
+        }
+    }
+
+
+def test_measure_reports_stage_rss_delta():
+    _, stats = measure(lambda: np.ones(64 * 2**20 // 8).sum())
+    if stats["rss_start_mb"] is None:
+        return
+    assert stats["rss_delta_mb"] >= 32
+    # 앞 단계의 peak 가 다음 단계 측정에 남지 않음
+    _, stats = measure(lambda: None)
+    assert stats["rss_delta_mb"] < 32
+
+
+def test_compare_ignores_small_rss_changes():
+    baseline = _result(1.0, 2.0)
+    assert compare_with_baseline(_result(1.0, 4.0), baseline, 0.2) == []
+    assert len(compare_with_baseline(_result(1.0, 40.0), baseline, 0.2)) == 1
@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from modules.cli import COMMAND_IMPORTS, COMMANDS, build_parser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPTS = {
+    "main.py": "train",
+    "score.py": "score",
+    "bench.py": "bench",
+    "serve.py": "serve",
+    "search.py": "search",
+    "update.py": "update",
+}
+
+
+def test_every_command_has_imports():
+    assert set(COMMANDS) == set(COMMAND_IMPORTS)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["train"],
+        ["evaluate", "data.csv"],
+        ["score", "in.csv", "out.csv", "--engine", "numpy"],
+        ["bench", "--imports"],
+        ["serve", "--port", "8081"],
+        ["search"],
+        ["update", "new.csv", "--model-dt", "20230221_105921"],
+    ],
+)
+def test_parser_accepts_each_command(argv):
+    args = build_parser().parse_args(argv)
+    assert args.command == argv[0]
+
+
+@pytest.mark.parametrize("script, command", SCRIPTS.items())
+def test_scripts_delegate_to_cli(script, command):
+    with open(os.path.join(ROOT, script), encoding="utf-8") as f:
+        source = f.read()
+    assert f'main(["{command}"] + sys.argv[1:])' in source
@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from modules.das_mlflow import AsyncTracker
+
+mlflow = pytest.importorskip("mlflow")
+
+
+def _uri(tmp_path):
+    return "file:" + os.path.abspath(tmp_path / "mlruns")
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    monkeypatch.setenv("MLFLOW_ALLOW_FILE_STORE", "true")
+    tracker = AsyncTracker(_uri(tmp_path))
+    yield tracker
+    tracker.close(timeout=10)
+
+
+def test_batched_requests_are_written_after_flush(tracker, tmp_path):
+    tracker.start_run("run", "async_tracker_test", "run_name")
+    tracker.log_params("run", {"max_depth": 3, "eta": 0.1})
+    tracker.log_metrics("run", {"Accuracy": 0.9, "F1 score": 0.8})
+    tracker.log_metric_history("run", "valid logloss", [0.6, 0.5, 0.4])
+    tracker.end_run("run")
+    assert tracker.flush(timeout=60)
+
+    client = mlflow.tracking.MlflowClient(_uri(tmp_path))
+    experiment = client.get_experiment_by_name("async_tracker_test")
+    (run,) = client.search_runs([experiment.experiment_id])
+    assert run.info.run_name == "run_name"
+    assert run.info.status == "FINISHED"
+    assert run.data.params == {"max_depth": "3", "eta": "0.1"}
+    assert run.data.metrics["Accuracy"] == 0.9
+    assert run.data.metrics["F1 score"] == 0.8
+
+    history = client.get_metric_history(run.info.run_id, "valid logloss")
+    assert [(m.step, m.value) for m in sorted(history, key=lambda m: m.step)] == [
+        (0, 0.6),
+        (1, 0.5),
+        (2, 0.4),
+    ]
+
+
+def test_child_run_records_parent(tracker, tmp_path):
+    tracker.start_run("parent", "async_tracker_test", "parent")
+    tracker.start_run("child", "async_tracker_test", "child", parent_key="parent")
+    tracker.end_run("child")
+    tracker.end_run("parent")
+    assert tracker.flush(timeout=60)
+
+    client = mlflow.tracking.MlflowClient(_uri(tmp_path))
+    experiment = client.get_experiment_by_name("async_tracker_test")
+    runs = client.search_runs([experiment.experiment_id])
+    runs = {run.info.run_name: run for run in runs}
+    parent_run_id = runs["parent"].info.run_id
+    assert runs["child"].data.tags["mlflow.parentRunId"] == parent_run_id
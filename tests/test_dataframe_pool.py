@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.utils.dataframe_pool import DataFramePool, auto_chunk_size
+
+
+def _transform(chunk, offset=0):
+    # 행 단위 처리 (worker 에서 받은 chunk 의 index 와 컬럼 순서를 그대로 사용)
+    result = chunk.copy()
+    result["total"] = chunk["a"] + chunk["b"] + offset
+    result["name"] = chunk["name"].str.upper()
+    return result
+
+
+def _data(n_rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "name": [f"row{i}" for i in range(n_rows)],
+            "a": rng.integers(0, 100, n_rows).astype(np.int16),
+            "b": rng.normal(size=n_rows),
+            "c": rng.normal(size=n_rows).astype(np.float32),
+        },
+        index=np.arange(n_rows) * 3 + 7,
+    )
+
+
+@pytest.fixture
+def pool():
+    pool = DataFramePool(n_workers=2, probe_rows=10, min_parallel_seconds=0)
+    yield pool
+    pool.close()
+
+
+def test_map_matches_single_process_result(pool):
+    data = _data(500)
+
+    result = pool.map(_transform, data, 1)
+
+    pd.testing.assert_frame_equal(result, _transform(data, 1))
+    assert pool._pool is not None
+
+
+def test_shared_memory_is_reused_until_it_is_too_small(pool):
+    pool.map(_transform, _data(500))
+    names = {key: shm.name for key, shm in pool._segments.items()}
+
+    smaller = _data(300)
+    pd.testing.assert_frame_equal(pool.map(_transform, smaller), _transform(smaller))
+    assert {key: shm.name for key, shm in pool._segments.items()} == names
+
+    larger = _data(900)
+    pd.testing.assert_frame_equal(pool.map(_transform, larger), _transform(larger))
+    assert all(pool._segments[key].name != name for key, name in names.items())
+
+
+def test_close_releases_workers_and_segments(pool):
+    pool.map(_transform, _data(200))
+    pool.close()
+
+    assert pool._pool is None
+    assert pool._segments == {}
+
+
+def test_cheap_work_stays_in_process():
+    pool = DataFramePool(n_workers=2, probe_rows=10, min_parallel_seconds=60)
+    data = _data(200)
+
+    pd.testing.assert_frame_equal(pool.map(_transform, data), _transform(data))
+    assert pool._pool is None
+    assert pool._segments == {}
+
+
+def test_auto_chunk_size_bounds():
+    # 행당 처리 시간으로 정한 크기
+    assert auto_chunk_size(10000, 4, 0.001, target_task_seconds=0.5) == 500
+    # 모든 worker 가 일을 받도록 최대 n_rows / n_workers
+    assert auto_chunk_size(10000, 4, 1e-9) == 2500
+    # worker 당 chunk 수는 최대 8 개
+    assert auto_chunk_size(10000, 4, 1.0) == 313
@@ -0,0 +1,86 @@
+import logging
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from modules.utils.decorator import RunningTimeDecorator, TryDecorator
+from modules.utils.stage_metrics import current_rss_mb, get_registry
+
+test_logger = logging.getLogger("test_decorator")
+
+
+@TryDecorator(logger=test_logger, exit=False)
+def _fail_without_exit():
+    raise ValueError("forced failure")
+
+
+@TryDecorator(logger=test_logger)
+def _fail_with_exit():
+    raise ValueError("forced failure")
+
+
+@RunningTimeDecorator(show_log=False, name="test_large")
+def _large_allocation():
+    # 실제로 값을 써야 RSS 가 늘어남
+    return float(np.ones(64 * 2**20 // 8).sum())
+
+
+@RunningTimeDecorator(show_log=False, name="test_small")
+def _small_stage():
+    return 1
+
+
+@RunningTimeDecorator(show_log=False, name="test_outer")
+def _outer_stage():
+    return _small_stage()
+
+
+@pytest.fixture
+def registry():
+    registry = get_registry()
+    registry.reset()
+    yield registry
+    registry.configure()
+    registry.reset()
+
+
+def test_try_decorator_logs_wrapped_failure(caplog):
+    with caplog.at_level(logging.ERROR, logger="test_decorator"):
+        assert _fail_without_exit() is None
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("ValueError: forced failure" in message for message in messages)
+    assert all(record.levelno == logging.ERROR for record in caplog.records)
+
+
+def test_try_decorator_exits_after_logging(caplog):
+    with caplog.at_level(logging.ERROR, logger="test_decorator"):
+        with pytest.raises(SystemExit) as exc_info:
+            _fail_with_exit()
+    assert exc_info.value.code == 1
+    assert any("forced failure" in record.getMessage() for record in caplog.records)
+
+
+def test_running_time_records_rss_growth_per_call(registry):
+    if current_rss_mb() is None:
+        pytest.skip("current RSS is not available")
+    _large_allocation()
+    _small_stage()
+    summary = registry.summary()
+    assert summary["test_large"]["rss_delta_mb"]["max"] >= 32
+    # 앞 단계의 peak 가 다음 단계 측정에 남지 않음
+    assert summary["test_small"]["rss_delta_mb"]["max"] < 32
+    assert "total" not in summary["test_large"]["rss_delta_mb"]
+    assert "total" in summary["test_large"]["wall_s"]
+    assert "stage/test_large/rss_delta_mb_total" not in registry.mlflow_metrics()
+
+
+def test_running_time_stops_tracemalloc_it_started(registry):
+    registry.configure(tracemalloc=True)
+    assert not tracemalloc.is_tracing()
+    _outer_stage()
+    assert not tracemalloc.is_tracing()
+    summary = registry.summary()
+    assert "tracemalloc_peak_mb" in summary["test_outer"]
+    # 안쪽 단계는 tracemalloc 을 측정하지 않음
+    assert "tracemalloc_peak_mb" not in summary["test_small"]
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from modules.model import Model
+from modules.preprocess import TARGET_COLUMN, Preprocess
+from modules.utils.column_spill import ColumnSpill
+from modules.utils.downcast import CompactDtype, compact_dtype, downcast_dataframe
+
+
+def _chunks():
+    # 정수값만 있는 chunk 다음에 소수값 chunk, 빈 chunk
+    return [
+        pd.DataFrame({"code": [1.0, 2.0], "value": [70000.0, 70001.0]}),
+        pd.DataFrame({"code": [-3.0, 300.0], "value": [2.5, np.nan]}),
+        pd.DataFrame({"code": np.array([], dtype=np.float64), "value": []}),
+    ]
+
+
+def test_compact_dtype_accumulates_like_whole_column():
+    whole = pd.concat(_chunks(), ignore_index=True)
+    for column in whole.columns:
+        compact = CompactDtype(whole[column].dtype)
+        for chunk in _chunks():
+            compact.update(chunk[column].to_numpy())
+        assert compact.result() == compact_dtype(whole[column])
+    assert compact_dtype(whole["code"]) == np.int16
+    # 정수 chunk (uint32 범위) + 소수 chunk 도 전체와 같이 float32
+    assert compact_dtype(whole["value"]) == np.float32
+
+
+def test_column_spill_matches_whole_frame_downcast(tmp_path):
+    expected = downcast_dataframe(pd.concat(_chunks(), ignore_index=True))
+    with ColumnSpill(str(tmp_path)) as spill:
+        for chunk in _chunks():
+            spill.append(chunk)
+        result = spill.load()
+    pd.testing.assert_frame_equal(result, expected)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_column_spill_without_downcast_keeps_dtypes(tmp_path):
+    with ColumnSpill(str(tmp_path)) as spill:
+        for chunk in _chunks():
+            spill.append(chunk)
+        result = spill.load(downcast=False)
+    pd.testing.assert_frame_equal(result, pd.concat(_chunks(), ignore_index=True))
+
+
+def test_column_spill_empty(tmp_path):
+    with ColumnSpill(str(tmp_path)) as spill:
+        assert spill.load() is None
+
+
+def test_downcast_dataframe_picks_small_dtypes_and_keeps_values():
+    data = pd.DataFrame(
+        {
+            "label": [0, 1, 1, 0],
+            "code": [-1.0, 2.0, 3.0, 4.0],
+            "measure": [0.5, 1.25, 2.0, 80.5],
+            "huge": [1e300, 0.5, 1.0, 2.0],
+            "name": ["a", "b", "c", "d"],
+        }
+    )
+    result = downcast_dataframe(data)
+
+    assert result.dtypes.to_dict() == {
+        "label": np.uint8,
+        "code": np.int8,
+        "measure": np.float32,
+        "huge": np.float64,
+        "name": data["name"].dtype,
+    }
+    pd.testing.assert_frame_equal(result, data, check_dtype=False)
+
+
+def test_preprocessed_data_is_downcast_for_float32_training(fast_config, screening_csv):
+    fast_config["preprocess"]["downcast"] = "true"
+    data = Preprocess().run(screening_csv)
+    assert data[TARGET_COLUMN].dtype == np.uint8
+    assert all(dtype.itemsize <= 4 for dtype in data.dtypes)
+
+    model = Model(data)
+    model.split_data()
+    assert model._train_input.dtype == np.float32
+    assert model._test_input.dtype == np.float32
@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.external_memory import SplitChunks, train_external_memory
+from modules.preprocess import FEATURE_COLUMNS, TARGET_COLUMN, Preprocess
+from modules.utils.metrics import binary_metrics, select_threshold, threshold_curves
+
+PARAMS = {"objective": "binary:logistic", "max_depth": 3, "nthread": 1}
+
+
+def _subset(source_path, config, subset, validation_size):
+    chunks = SplitChunks(
+        Preprocess(),
+        source_path,
+        10**6,
+        config["external_memory"]["test_size"],
+        config["random_state"]["random_state"],
+        validation_size=validation_size,
+    )
+    return pd.concat(list(chunks.iter_subset(subset)))
+
+
+def _run(config, source_path, method):
+    config["external_memory"]["chunk_size"] = 700
+    config["threshold"]["method"] = method
+    config["threshold"]["value"] = 0.3
+    return train_external_memory(PARAMS, 10, config, source_path)
+
+
+@pytest.mark.parametrize("method", ["fixed", "f1"])
+def test_streamed_metrics_match_binary_metrics(fast_config, screening_csv, method):
+    result = _run(fast_config, screening_csv, method)
+    booster, threshold = result["booster"], result["threshold"]
+    validation_size = fast_config["threshold"]["validation_size"]
+    if method == "fixed":
+        validation_size = 0.0
+
+    test = _subset(screening_csv, fast_config, "test", validation_size)
+    proba = booster.inplace_predict(test[FEATURE_COLUMNS].to_numpy(dtype=np.float32))
+    expected = binary_metrics(test[TARGET_COLUMN].to_numpy(), proba >= threshold)
+
+    assert result["eval"]["Threshold"] == threshold
+    assert result["eval"]["Accuracy"] == pytest.approx(expected["accuracy"])
+    assert result["eval"]["F1 score"] == pytest.approx(expected["f1"])
+    assert result["eval"]["Sensitivity"] == pytest.approx(expected["sensitivity"])
+    assert result["eval"]["Specificity"] == pytest.approx(expected["specificity"])
+
+
+def test_fixed_method_uses_configured_threshold(fast_config, screening_csv):
+    assert _run(fast_config, screening_csv, "fixed")["threshold"] == 0.3
+
+
+def test_threshold_selected_on_streamed_validation_rows(fast_config, screening_csv):
+    result = _run(fast_config, screening_csv, "f1")
+    threshold_config = fast_config["threshold"]
+
+    validation_size = threshold_config["validation_size"]
+    valid = _subset(screening_csv, fast_config, "valid", validation_size)
+    proba = result["booster"].inplace_predict(
+        valid[FEATURE_COLUMNS].to_numpy(dtype=np.float32)
+    )
+    curves = threshold_curves(
+        valid[TARGET_COLUMN].to_numpy(), proba, threshold_config["n_thresholds"]
+    )
+    expected = select_threshold(curves, "f1", threshold_config["target_sensitivity"])
+
+    assert result["threshold"] == pytest.approx(expected)
@@ -0,0 +1,73 @@
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from modules.utils import frame_cache
+from modules.utils.frame_cache import FrameCache
+
+pytest.importorskip("pyarrow")
+
+COLUMNS = ["a", "b"]
+DTYPES = {"a": "int64", "b": "float64"}
+
+
+@pytest.fixture
+def source(tmp_path):
+    source_path = str(tmp_path / "data.csv")
+    with open(source_path, "w") as f:
+        f.write("a,b\n1,0.5\n2,1.5\n")
+    return source_path
+
+
+@pytest.fixture
+def cache(tmp_path, source):
+    cache = FrameCache(str(tmp_path / "cache"), "parquet")
+    cache.save(pd.read_csv(source), source, COLUMNS, DTYPES)
+    return cache
+
+
+def _set_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_source_loads_without_rehashing(cache, source, monkeypatch):
+    def fail(file_path):
+        raise AssertionError("content hash recomputed")
+
+    monkeypatch.setattr(frame_cache, "file_content_hash", fail)
+    pd.testing.assert_frame_equal(
+        cache.load(source, COLUMNS, DTYPES), pd.read_csv(source)
+    )
+
+
+def test_mtime_only_change_keeps_cache_and_refreshes_meta(cache, source, tmp_path):
+    mtime_ns = os.stat(source).st_mtime_ns + 10**9
+    _set_mtime(source, mtime_ns)
+
+    assert cache.load(source, COLUMNS, DTYPES) is not None
+    with open(tmp_path / "cache" / "data.meta.json") as f:
+        assert json.load(f)["source"]["mtime_ns"] == mtime_ns
+
+
+def test_content_change_with_same_size_invalidates(cache, source):
+    mtime_ns = os.stat(source).st_mtime_ns
+    with open(source, "w") as f:
+        f.write("a,b\n3,0.5\n2,1.5\n")
+    # 크기가 같으면 수정 시간이 바뀐 것을 보고 내용 해시로 판단
+    _set_mtime(source, mtime_ns + 10**9)
+
+    assert cache.load(source, COLUMNS, DTYPES) is None
+
+
+def test_size_change_invalidates(cache, source):
+    with open(source, "a") as f:
+        f.write("3,2.5\n")
+
+    assert cache.load(source, COLUMNS, DTYPES) is None
+
+
+def test_schema_change_invalidates(cache, source):
+    assert cache.load(source, COLUMNS, {"a": "int32", "b": "float64"}) is None
+    assert cache.load(source, ["b", "a"], DTYPES) is None
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from modules import hyperparameter_search
+from modules.hyperparameter_search import HyperParameterSearch
+from modules.model import Model
+from modules.preprocess import Preprocess
+
+
+class InProcessPool:
+    """pathos Pool 대신 현재 프로세스에서 실행하고 평가한 trial 수를 기록"""
+
+    evaluated = []
+
+    def __init__(self, n_workers) -> None:
+        pass
+
+    def map(self, function, args):
+        args = list(args)
+        InProcessPool.evaluated.append(len(args))
+        return [function(arg) for arg in args]
+
+    def close(self) -> None:
+        pass
+
+    def join(self) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+@pytest.fixture
+def search(fast_config, screening_csv, monkeypatch):
+    fast_config["hyper_parameter_search"].update(
+        n_trials=4, min_resource=2, max_resource=8, reduction_factor=2
+    )
+    monkeypatch.setattr(hyperparameter_search, "Pool", InProcessPool)
+    InProcessPool.evaluated = []
+    model = Model(Preprocess().run(screening_csv))
+    model.split_data()
+    return lambda: HyperParameterSearch(model, fast_config)
+
+
+def _trial_path(config):
+    return os.path.join(config["path"]["cache"], "search", "trials.jsonl")
+
+
+def test_successive_halving_rungs(search, fast_config):
+    result = search().run()
+
+    # 4 trial x 2 tree -> 2 trial x 4 tree -> 1 trial x 8 tree
+    assert InProcessPool.evaluated == [4, 2, 1]
+    assert [trial["rung"] for trial in result["trials"]] == [0] * 4 + [1] * 2 + [2]
+    assert result["best_params"]["n_estimators"] == 8
+    with open(_trial_path(fast_config)) as f:
+        assert len(f.readlines()) == 7
+
+
+def test_resume_skips_completed_trials(search, fast_config):
+    first = search().run()
+    trial_path = _trial_path(fast_config)
+    with open(trial_path) as f:
+        lines = f.readlines()
+
+    # 모든 trial 이 기록되어 있으면 다시 평가하지 않음
+    InProcessPool.evaluated = []
+    assert search().run() == first
+    assert InProcessPool.evaluated == []
+
+    # 첫 단계까지만 기록된 상태(중단)에서 이어서 진행
+    with open(trial_path, "w") as f:
+        f.writelines(lines[:4])
+    resumed = search().run()
+
+    assert InProcessPool.evaluated == [2, 1]
+    assert resumed == first
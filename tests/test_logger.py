@@ -0,0 +1,91 @@
+import contextlib
+import logging
+import multiprocessing
+import os
+from unittest import mock
+
+from modules.utils.default_logger_config import DefaultLogger
+from modules.utils.logging_format import CustomFormatter
+
+
+@contextlib.contextmanager
+def _default_logger(**kwargs):
+    """root logger 를 비운 상태로 DefaultLogger 를 설정
+        끝나면 남은 로그를 모두 기록하고 pytest 의 handler 를 복원
+    """
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    for handler in saved_handlers:
+        root.removeHandler(handler)
+    setting = DefaultLogger(**kwargs)
+    try:
+        yield setting
+    finally:
+        listener = setting._listener
+        # logging.shutdown 은 pytest 의 handler 까지 닫으므로 listener 만 종료
+        with mock.patch.object(logging, "shutdown"):
+            setting.shutdown()
+        for handler in listener.handlers if listener is not None else ():
+            handler.close()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _log_from_child(name):
+    logging.getLogger(name).info("from child process")
+
+
+def test_records_are_written_by_listener(tmp_path):
+    with _default_logger() as setting:
+        logger = setting.setDefaultLogger("LoggerTest", str(tmp_path))
+        logger.info("hello %s", "world")
+        logger.debug("not written")
+
+    content = _read(tmp_path / "LoggerTest.log")
+    assert "[INFO:LoggerTest:" in content
+    assert content.rstrip().endswith("hello world")
+    assert "not written" not in content
+
+
+def test_size_rotation_keeps_backup_count(tmp_path):
+    with _default_logger(max_bytes=200, backup_count=2) as setting:
+        logger = setting.setDefaultLogger("RotationTest", str(tmp_path))
+        for i in range(50):
+            logger.info(f"message {i:03d}")
+
+    names = sorted(os.listdir(tmp_path))
+    assert names == ["RotationTest.log", "RotationTest.log.1", "RotationTest.log.2"]
+    assert "message 049" in _read(tmp_path / "RotationTest.log")
+
+
+def test_forked_child_writes_without_listener(tmp_path):
+    with _default_logger() as setting:
+        setting.setDefaultLogger("ForkTest", str(tmp_path))
+        process = multiprocessing.get_context("fork").Process(
+            target=_log_from_child, args=("ForkTest",)
+        )
+        process.start()
+        process.join()
+    assert process.exitcode == 0
+
+    assert "from child process" in _read(tmp_path / "ForkTest.log")
+
+
+def test_custom_formatter_caches_level_formatters():
+    formatter = CustomFormatter()
+    record = logging.LogRecord("name", logging.WARNING, __file__, 1, "msg", None, None)
+
+    first = formatter.format(record)
+    assert first.startswith("[\x1b[33;21mWARNING:")
+    assert first.endswith(f"msg ({os.path.basename(__file__)}:1)")
+    cached = formatter._CustomFormatter__formatters[logging.WARNING]
+    formatter.format(record)
+    assert formatter._CustomFormatter__formatters[logging.WARNING] is cached
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    accuracy_score,
+    average_precision_score,
+    f1_score,
+    recall_score,
+    roc_auc_score,
+)
+
+from modules.utils.metrics import (
+    RankedScores,
+    binary_metrics,
+    select_threshold,
+    threshold_curves,
+)
+
+
+def _scores(seed, n_rows=2000, decimals=None):
+    rng = np.random.default_rng(seed)
+    actual = (rng.random(n_rows) < 0.15).astype(np.uint8)
+    proba = 1 / (1 + np.exp(-(rng.normal(size=n_rows) + 1.5 * actual - 1)))
+    if decimals is not None:
+        # 같은 확률이 많은 경우 (ROC 곡선의 대각선 구간)
+        proba = np.round(proba, decimals)
+    return actual, proba.astype(np.float32)
+
+
+@pytest.mark.parametrize("decimals", [None, 1, 2])
+def test_auc_matches_sklearn(decimals):
+    actual, proba = _scores(0, decimals=decimals)
+    auc = RankedScores(actual, proba).auc()
+
+    assert auc["roc_auc"] == pytest.approx(roc_auc_score(actual, proba), abs=1e-12)
+    assert auc["pr_auc"] == pytest.approx(
+        average_precision_score(actual, proba), abs=1e-12
+    )
+
+
+def test_weighted_bootstrap_sample_matches_sklearn_sample_weight():
+    actual, proba = _scores(1, decimals=2)
+    scores = RankedScores(actual, proba)
+    order = np.argsort(-proba.astype(np.float64), kind="stable")
+    weights = np.random.default_rng(2).integers(0, 3, len(actual)).astype(np.float64)
+
+    metrics = scores._metrics(weights[order][None, :], {"threshold": 0.3})
+
+    assert metrics["roc_auc"][0] == pytest.approx(
+        roc_auc_score(actual, proba, sample_weight=weights), abs=1e-12
+    )
+    assert metrics["pr_auc"][0] == pytest.approx(
+        average_precision_score(actual, proba, sample_weight=weights), abs=1e-12
+    )
+    predict = proba >= 0.3
+    assert metrics["threshold_f1"][0] == pytest.approx(
+        f1_score(actual, predict, sample_weight=weights)
+    )
+    assert metrics["threshold_sensitivity"][0] == pytest.approx(
+        recall_score(actual, predict, sample_weight=weights)
+    )
+
+
+def test_bootstrap_interval_contains_point_estimate():
+    actual, proba = _scores(3)
+    scores = RankedScores(actual, proba)
+    intervals = scores.bootstrap(0.5, n_bootstrap=200, random_state=0)
+    auc = scores.auc()
+
+    low, high = intervals["roc_auc"]
+    assert low < auc["roc_auc"] < high
+    assert intervals == scores.bootstrap(0.5, n_bootstrap=200, random_state=0)
+
+
+def test_binary_metrics_and_curves_match_sklearn():
+    actual, proba = _scores(4)
+    curves = threshold_curves(actual, proba, 11)
+
+    for i, threshold in enumerate(curves["threshold"]):
+        predict = (proba >= threshold).astype(np.uint8)
+        metrics = binary_metrics(actual, predict)
+        assert metrics["accuracy"] == pytest.approx(accuracy_score(actual, predict))
+        expected_f1 = f1_score(actual, predict, zero_division=0)
+        assert metrics["f1"] == pytest.approx(expected_f1)
+        assert metrics["sensitivity"] == pytest.approx(recall_score(actual, predict))
+        assert curves["f1"][i] == pytest.approx(metrics["f1"])
+        assert curves["sensitivity"][i] == pytest.approx(metrics["sensitivity"])
+        assert curves["specificity"][i] == pytest.approx(metrics["specificity"])
+
+
+def test_select_threshold():
+    curves = {
+        "threshold": np.array([0.0, 0.25, 0.5, 0.75, 1.0]),
+        "f1": np.array([0.2, 0.5, 0.7, 0.4, 0.0]),
+        "sensitivity": np.array([1.0, 0.95, 0.8, 0.5, 0.0]),
+    }
+
+    assert select_threshold(curves, "f1") == 0.5
+    assert select_threshold(curves, "sensitivity", 0.9) == 0.25
+    assert select_threshold(curves, "sensitivity", 1.1) == 0.0
+    with pytest.raises(ValueError):
+        select_threshold(curves, "unknown")
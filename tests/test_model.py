@@ -0,0 +1,206 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+
+from modules import model as model_module
+from modules.ensemble import BoosterEnsemble
+from modules.model import Model, booster_params
+from modules.preprocess import Preprocess
+from modules.synthetic import write_screening_csv
+from modules.utils import functions
+from modules.utils.metrics import binary_metrics
+
+
+def _nthread(booster):
+    return json.loads(booster.save_config())["learner"]["generic_param"]["nthread"]
+
+
+def test_predict_batch_does_not_change_shared_booster(fast_config, screening_csv):
+    data = Preprocess().run(screening_csv)
+    model = Model(data)
+    model.split_data()
+    model.fit()
+    model.save_model()
+
+    first, second = Model(None), Model(None)
+    first.load_model()
+    second.load_model()
+    # 같은 모델은 ModelPool 에서 같은 booster 를 공유
+    assert first._model is second._model
+    shared_nthread = _nthread(first._model)
+
+    proba, _ = first.predict_batch(data, n_jobs=1)
+    assert _nthread(first._model) == shared_nthread
+    np.testing.assert_allclose(proba, second.predict_batch(data)[0], rtol=1e-6)
+
+
+def test_cross_validation_pool_matches_serial(fast_config, screening_csv, monkeypatch):
+    model = Model(Preprocess().run(screening_csv))
+    serial = model.cross_validate(n_splits=3)
+
+    # 코어가 여러 개인 것처럼 fold 를 process pool 에서 학습
+    monkeypatch.setattr(functions, "cpu_count", lambda: 4)
+    assert functions.cpu_budget(3) == (3, 1)
+    parallel = model.cross_validate(n_splits=3)
+
+    assert len(serial["folds"]) == 3
+    assert parallel == serial
+    accuracy = [fold["Accuracy"] for fold in serial["folds"]]
+    assert serial["aggregate"]["CV Accuracy mean"] == pytest.approx(np.mean(accuracy))
+    assert serial["aggregate"]["CV Accuracy std"] == pytest.approx(np.std(accuracy))
+
+
+def test_booster_params_maps_sklearn_names():
+    params, num_boost_round = booster_params(
+        {
+            "n_estimators": 30,
+            "reg_alpha": 0,
+            "reg_lambda": 1,
+            "n_jobs": 4,
+            "random_state": 7,
+            "booster": "'gbtree'",
+        },
+        n_jobs=2,
+    )
+
+    assert num_boost_round == 30
+    assert params == {
+        "alpha": 0,
+        "lambda": 1,
+        "nthread": 2,
+        "seed": 7,
+        "booster": "gbtree",
+        "objective": "binary:logistic",
+        "tree_method": "hist",
+    }
+
+
+def test_quantile_dmatrix_is_built_once_and_dropped_from_pickle(
+    fast_config, screening_csv, monkeypatch
+):
+    fast_config["threshold"]["method"] = "fixed"
+    built = []
+    quantile_dmatrix = model_module.quantile_dmatrix
+
+    def counting(params, data, label=None, ref=None):
+        built.append((len(data), ref))
+        return quantile_dmatrix(params, data, label, ref)
+
+    monkeypatch.setattr(model_module, "quantile_dmatrix", counting)
+    model = Model(Preprocess().run(screening_csv))
+    model.split_data()
+    model.fit()
+    model.evaluate_model()
+    model.evaluate_model()
+
+    # train 한 번, test 는 train 의 분위수 경계로 한 번
+    assert [n_rows for n_rows, _ in built] == [
+        len(model._train_input),
+        len(model._test_input),
+    ]
+    assert built[1][1] is model._dmatrix["train"]
+    np.testing.assert_allclose(
+        model._predict_proba("test"),
+        model._model.inplace_predict(model._test_input),
+        rtol=1e-6,
+    )
+
+    restored = pickle.loads(pickle.dumps(model))
+    assert "_dmatrix" not in restored.__dict__
+    assert restored.evaluate_model() == model.evaluate_model()
+
+
+def test_early_stopping_uses_validation_split_and_best_iteration(
+    fast_config, screening_csv
+):
+    fast_config["early_stopping"].update(enabled="true", early_stopping_rounds=5)
+    fast_config["hyper_parameter"].update(n_estimators=300, learning_rate=0.3)
+    fast_config["threshold"]["method"] = "fixed"
+    data = Preprocess().run(screening_csv)
+    model = Model(data)
+    model.split_data()
+
+    # 검증 데이터는 Under Sampling 전 train 에서 분리 (실제 라벨 비율, test 와 겹치지 않음)
+    assert not np.intersect1d(model._valid_idx, model._test_idx).size
+    assert not np.intersect1d(model._valid_idx, model._train_idx).size
+    assert abs(model._valid_target.mean() - data["요단백"].mean()) < 0.02
+
+    model.fit()
+    booster = model._model
+    assert model.best_iteration + 1 < booster.num_boosted_rounds()
+    assert set(model.evals_result) == {"train", "valid"}
+    assert len(model.evals_result["valid"]["aucpr"]) == booster.num_boosted_rounds()
+
+    # 예측과 저장한 모델 모두 best iteration 까지의 tree 만 사용
+    expected = booster[: model.best_iteration + 1].inplace_predict(model._test_input)
+    np.testing.assert_allclose(model.predict_batch(model._test_input)[0], expected)
+    model.save_model()
+    loaded = Model(None)
+    loaded.load_model()
+    assert loaded.best_iteration == model.best_iteration
+    np.testing.assert_allclose(loaded.predict_batch(model._test_input)[0], expected)
+
+
+def test_ensemble_trains_one_balanced_booster_per_bag(fast_config, screening_csv):
+    fast_config["ensemble"].update(enabled="true", n_bags=3)
+    fast_config["threshold"]["method"] = "fixed"
+    model = Model(Preprocess().run(screening_csv))
+    model.split_data()
+    model.fit()
+
+    ensemble = model._model
+    assert isinstance(ensemble, BoosterEnsemble)
+    assert len(ensemble) == 3
+    for bag_pos in model._bag_pos:
+        counts = np.bincount(model._train_target[bag_pos], minlength=2)
+        assert counts[0] == counts[1]
+
+    # ensemble 확률은 bag 별 확률의 평균
+    expected = np.mean(
+        [booster.inplace_predict(model._test_input) for booster in ensemble.boosters],
+        axis=0,
+    )
+    np.testing.assert_allclose(
+        model.predict_batch(model._test_input)[0], expected, rtol=1e-6
+    )
+
+
+def test_update_continues_base_model_on_rolling_holdout(
+    fast_config, screening_csv, tmp_path
+):
+    fast_config["threshold"]["method"] = "fixed"
+    fast_config["update"].update(num_boost_round=5, holdout_size=0.2)
+    base = Model(Preprocess().run(screening_csv))
+    base.split_data()
+    base.fit()
+    base.save_model()
+    base_booster = base._model
+
+    new_path = str(tmp_path / "new.csv")
+    write_screening_csv(new_path, 1000, 1)
+    model = Model(Preprocess().run(new_path))
+    eval_metric = model.update()
+
+    # 가장 최근 record(마지막 20%)가 holdout, 나머지에서만 학습
+    n_rows = len(model._target)
+    n_train = n_rows - int(round(n_rows * 0.2))
+    assert np.array_equal(model._test_idx, np.arange(n_train, n_rows))
+    assert model._train_idx.max() < n_train
+    assert model._metadata()["parent_model_dt"] == base._model_dt
+
+    # 기존 tree 를 유지하고 새 tree 만 추가
+    n_base = base_booster.num_boosted_rounds()
+    assert model._model.num_boosted_rounds() == n_base + 5
+    holdout = model._test_input
+    np.testing.assert_allclose(
+        model._model.inplace_predict(holdout, iteration_range=(0, n_base)),
+        base_booster.inplace_predict(holdout),
+        rtol=1e-6,
+    )
+    base_metrics = binary_metrics(
+        model._test_target, base_booster.inplace_predict(holdout) >= base.threshold
+    )
+    assert eval_metric["Base Accuracy"] == base_metrics["accuracy"]
+    assert eval_metric["Base F1 score"] == base_metrics["f1"]
@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import xgboost as xgb
+
+from modules.ensemble import BoosterEnsemble
+from modules.model_store import (
+    BAG_FILE,
+    MODEL_FILE,
+    ModelPool,
+    load_booster,
+    model_exists,
+    save_booster,
+)
+
+
+def _booster(seed):
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(200, 4)).astype(np.float32)
+    target = (features[:, 0] > 0).astype(np.int32)
+    params = {"objective": "binary:logistic", "max_depth": 2, "nthread": 1}
+    return xgb.train(params, xgb.DMatrix(features, label=target), num_boost_round=5)
+
+
+def _inputs():
+    return np.random.default_rng(9).normal(size=(50, 4)).astype(np.float32)
+
+
+def test_pool_evicts_least_recently_used():
+    pool = ModelPool(max_size=2)
+    loads = []
+
+    def loader(key):
+        return lambda: loads.append(key) or key
+
+    pool.get("a", loader("a"))
+    pool.get("b", loader("b"))
+    # a 를 다시 사용했으므로 c 를 넣으면 b 가 제거됨
+    assert pool.get("a", loader("a")) == "a"
+    pool.get("c", loader("c"))
+    pool.get("a", loader("a"))
+    pool.get("b", loader("b"))
+
+    assert loads == ["a", "b", "c", "b"]
+    assert len(pool) == 2
+
+
+def test_pool_invalidate_forces_reload():
+    pool = ModelPool(max_size=2)
+    loads = []
+    pool.get("a", lambda: loads.append("a"))
+    pool.invalidate("a")
+    pool.get("a", lambda: loads.append("a"))
+    assert loads == ["a", "a"]
+
+
+def test_single_booster_round_trip(tmp_path):
+    booster = _booster(0)
+    metadata = {"feature_names": ["a", "b", "c", "d"], "threshold": 0.4}
+    save_booster(booster, str(tmp_path), metadata)
+
+    assert model_exists(str(tmp_path))
+    assert os.path.exists(tmp_path / MODEL_FILE)
+    loaded, loaded_metadata = load_booster(str(tmp_path))
+    assert loaded_metadata == metadata
+    np.testing.assert_array_equal(
+        loaded.inplace_predict(_inputs()), booster.inplace_predict(_inputs())
+    )
+
+
+def test_ensemble_round_trip(tmp_path):
+    ensemble = BoosterEnsemble([_booster(0), _booster(1)], [None, 2])
+    save_booster(ensemble, str(tmp_path), {"threshold": 0.5})
+
+    assert os.path.exists(tmp_path / BAG_FILE.format(1))
+    loaded, metadata = load_booster(str(tmp_path))
+    assert isinstance(loaded, BoosterEnsemble)
+    assert loaded.best_iterations == [None, 2]
+    assert metadata["ensemble"]["files"] == [BAG_FILE.format(0), BAG_FILE.format(1)]
+    np.testing.assert_array_equal(
+        loaded.inplace_predict(_inputs()), ensemble.inplace_predict(_inputs())
+    )
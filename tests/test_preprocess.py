@@ -0,0 +1,30 @@
+import numpy as np
+import pandas as pd
+
+from modules.preprocess import Preprocess
+from modules.synthetic import write_screening_csv
+
+
+def _screening_csv(tmp_path, n_rows=400):
+    source_path = str(tmp_path / "data.csv")
+    write_screening_csv(source_path, n_rows, 0)
+    data = pd.read_csv(source_path)
+    # 앞쪽 chunk 는 정수값만 (uint32 범위), 뒤쪽 chunk 는 소수값
+    half = n_rows // 2
+    data.loc[: half - 1, "감마 지티피"] = 70000 + np.arange(half)
+    data.loc[half:, "감마 지티피"] = np.arange(n_rows - half) + 0.5
+    data.to_csv(source_path, index=False)
+    return source_path
+
+
+def test_streaming_matches_in_memory_preprocess(config, tmp_path):
+    source_path = _screening_csv(tmp_path)
+    config["cache"]["use_cache"] = "false"
+
+    config["preprocess"]["chunk_size"] = 0
+    in_memory = Preprocess().run(source_path)
+    config["preprocess"]["chunk_size"] = 100
+    streaming = Preprocess().run(source_path)
+
+    pd.testing.assert_frame_equal(streaming, in_memory)
+    assert streaming["감마 지티피"].dtype == np.float32
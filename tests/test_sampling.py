@@ -0,0 +1,104 @@
+import numpy as np
+
+from modules.model import Model
+from modules.preprocess import Preprocess
+from modules.utils.sampling import (
+    balanced_bag_indices,
+    gather_rows,
+    stratified_kfold_indices,
+    stratified_split_indices,
+    undersample_indices,
+)
+
+
+def _target():
+    # 정상 900, 이상 100
+    return np.repeat(np.array([0, 1], dtype=np.uint8), [900, 100])
+
+
+def test_stratified_split_keeps_label_ratio_and_partitions_rows():
+    target = _target()
+    train_idx, test_idx = stratified_split_indices(target, 0.2, random_state=0)
+
+    all_idx = np.sort(np.concatenate([train_idx, test_idx]))
+    assert np.array_equal(all_idx, np.arange(1000))
+    assert np.bincount(target[test_idx]).tolist() == [180, 20]
+    assert np.bincount(target[train_idx]).tolist() == [720, 80]
+    again = stratified_split_indices(target, 0.2, random_state=0)
+    assert np.array_equal(again[0], train_idx) and np.array_equal(again[1], test_idx)
+
+
+def test_kfold_test_folds_partition_rows_with_label_ratio():
+    target = _target()
+    splits = stratified_kfold_indices(target, 5, random_state=0)
+
+    test_folds = [test_idx for _, test_idx in splits]
+    assert np.array_equal(np.sort(np.concatenate(test_folds)), np.arange(1000))
+    for train_idx, test_idx in splits:
+        assert np.bincount(target[test_idx]).tolist() == [180, 20]
+        assert np.array_equal(
+            np.sort(train_idx), np.setdiff1d(np.arange(1000), test_idx)
+        )
+
+
+def test_undersample_keeps_every_minority_row():
+    target = _target()
+    indices = np.arange(0, 1000, 2)
+    sampled = undersample_indices(target, indices, random_state=0)
+
+    assert np.isin(sampled, indices).all()
+    assert len(np.unique(sampled)) == len(sampled)
+    assert np.bincount(target[sampled]).tolist() == [50, 50]
+    assert set(indices[target[indices] == 1]) <= set(sampled)
+
+
+def test_balanced_bags_pair_all_minority_with_distinct_majority():
+    target = _target()
+    indices = np.arange(1000)
+    bags = balanced_bag_indices(target, indices, 5, random_state=0)
+
+    minority = set(np.flatnonzero(target == 1))
+    majority_parts = []
+    for bag in bags:
+        assert np.bincount(target[bag]).tolist() == [100, 100]
+        assert minority <= set(bag)
+        majority_parts.append(bag[target[bag] == 0])
+    # 다수 클래스가 충분하면 bag 끼리 정상 데이터가 겹치지 않음
+    majority = np.concatenate(majority_parts)
+    assert len(np.unique(majority)) == 500
+
+
+def test_balanced_bags_cycle_when_majority_runs_out():
+    target = _target()
+    bags = balanced_bag_indices(target, np.arange(1000), 12, random_state=0)
+
+    majority = np.concatenate([bag[target[bag] == 0] for bag in bags])
+    assert len(majority) == 1200
+    assert len(np.unique(majority)) == 900
+
+
+def test_gather_rows_views_contiguous_ranges_only():
+    matrix = np.arange(20, dtype=np.float32).reshape(10, 2)
+
+    contiguous = gather_rows(matrix, np.arange(3, 7))
+    assert np.shares_memory(contiguous, matrix)
+    assert np.array_equal(contiguous, matrix[3:7])
+
+    gathered = gather_rows(matrix, np.array([7, 1, 4]))
+    assert not np.shares_memory(gathered, matrix)
+    assert gathered.flags.c_contiguous
+    assert np.array_equal(gathered, matrix[[7, 1, 4]])
+
+
+def test_split_data_balances_train_and_keeps_test_ratio(fast_config, screening_csv):
+    fast_config["threshold"]["method"] = "fixed"
+    data = Preprocess().run(screening_csv)
+    model = Model(data)
+    model.split_data()
+
+    train_counts = np.bincount(model._train_target, minlength=2)
+    assert train_counts[0] == train_counts[1]
+    test_ratio = model._test_target.mean()
+    assert abs(test_ratio - data["요단백"].mean()) < 0.01
+    # train 과 test 는 겹치지 않음
+    assert not np.intersect1d(model._train_idx, model._test_idx).size
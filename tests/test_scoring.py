@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from modules.model import Model
+from modules.preprocess import FEATURE_COLUMNS, Preprocess
+from modules.scoring import score_csv
+
+
+@pytest.fixture
+def trained_model(fast_config, screening_csv):
+    model = Model(Preprocess().run(screening_csv))
+    model.split_data()
+    model.fit()
+    model.save_model()
+    model.export_numpy()
+    return model
+
+
+@pytest.mark.parametrize("engine", ["xgboost", "numpy"])
+def test_pool_output_keeps_input_order(trained_model, screening_csv, tmp_path, engine):
+    output_path = str(tmp_path / "scores.csv")
+    n_scored = score_csv(
+        screening_csv, output_path, chunk_size=250, workers=2, engine=engine
+    )
+
+    result = pd.read_csv(output_path)
+    (data,) = Preprocess().read_chunks(screening_csv, 10**6, FEATURE_COLUMNS)
+    data = Preprocess().transform(data, FEATURE_COLUMNS)
+    proba, label = trained_model.predict_batch(data)
+
+    assert n_scored == len(result) == len(data)
+    # chunk 가 여러 worker 에서 처리되어도 입력 순서대로 기록
+    assert np.array_equal(result["row_id"].to_numpy(), data.index.to_numpy())
+    np.testing.assert_allclose(result["probability"], proba, atol=1e-6)
+    assert np.array_equal(result["label"].to_numpy(), label)
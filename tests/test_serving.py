@@ -0,0 +1,143 @@
+import asyncio
+import json
+
+import numpy as np
+
+from modules.serving import InferenceServer
+
+FEATURE_NAMES = ["a", "b"]
+ANOMALY_RULE = {
+    "drop": [{"column": "a", "values": [3]}],
+    "replace": [{"column": "b", "values": [9.9], "to": 0}],
+}
+
+
+class RecordingModel:
+    """batch 크기를 기록하고 a + b 를 확률로 반환하는 모델"""
+
+    def __init__(self) -> None:
+        self.batches = []
+
+    def predict_batch(self, matrix):
+        self.batches.append(matrix.copy())
+        proba = matrix.sum(axis=1).astype(np.float32)
+        return proba, (proba >= 0.5).astype(np.uint8)
+
+
+def _server(model, max_batch_size=256, max_wait_ms=200):
+    return InferenceServer(
+        model,
+        {"feature_names": FEATURE_NAMES, "anomaly_rule": ANOMALY_RULE},
+        {"max_batch_size": max_batch_size, "max_wait_ms": max_wait_ms},
+    )
+
+
+def _body(records):
+    return json.dumps({"records": records}).encode("utf-8")
+
+
+def test_concurrent_requests_share_one_batch():
+    model = RecordingModel()
+    server = _server(model)
+
+    requests = [
+        [{"a": 0.1, "b": 0.2}],
+        [{"a": 3, "b": 0.1}, {"a": 0.4, "b": 9.9}, {"a": 0.3, "b": 0.3}],
+        [{"a": None, "b": 0.1}],
+    ]
+
+    async def run():
+        server._batcher.start()
+        try:
+            return await asyncio.gather(
+                *(server._route("POST", "/predict", _body(r)) for r in requests)
+            )
+        finally:
+            await server._batcher.stop()
+
+    (status1, first), (status2, second), (status3, third) = asyncio.run(run())
+
+    assert [status1, status2, status3] == [200, 200, 200]
+    # 거부된 record 를 제외한 3 행이 한 번의 예측으로 처리됨
+    assert [len(batch) for batch in model.batches] == [3]
+    np.testing.assert_allclose(first["probability"], [0.3], rtol=1e-6)
+    assert second["accepted"] == [False, True, True]
+    assert second["probability"][0] is None
+    # sentinel 9.9 는 0 으로 대체
+    np.testing.assert_allclose(second["probability"][1:], [0.4, 0.6], rtol=1e-6)
+    assert second["label"] == [None, 0, 1]
+    assert third == {"probability": [None], "label": [None], "accepted": [False]}
+
+    metrics = server._metrics.snapshot()
+    assert metrics["batches"] == 1
+    assert metrics["rows"] == 5
+    assert metrics["rejected_rows"] == 2
+    assert metrics["queue_depth"] == 0
+
+
+def test_batch_is_cut_at_max_batch_size():
+    model = RecordingModel()
+    server = _server(model, max_batch_size=2)
+
+    async def run():
+        server._batcher.start()
+        try:
+            body = _body([{"a": 0.1, "b": 0.1}])
+            await asyncio.gather(
+                *(server._route("POST", "/predict", body) for _ in range(5))
+            )
+        finally:
+            await server._batcher.stop()
+
+    asyncio.run(run())
+    assert [len(batch) for batch in model.batches] == [2, 2, 1]
+
+
+def test_http_predict_round_trip():
+    model = RecordingModel()
+    server = _server(model, max_wait_ms=1)
+
+    async def run():
+        server._batcher.start()
+        listener = await asyncio.start_server(server._handle_connection, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            body = _body([{"a": 0.5, "b": 0.25}])
+            writer.write(
+                b"POST /predict HTTP/1.1\r\nContent-Length: "
+                + str(len(body)).encode()
+                + b"\r\nConnection: close\r\n\r\n"
+                + body
+            )
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+        finally:
+            listener.close()
+            await listener.wait_closed()
+            await server._batcher.stop()
+
+    response = asyncio.run(run())
+    header, _, payload = response.partition(b"\r\n\r\n")
+    assert header.startswith(b"HTTP/1.1 200 OK")
+    assert json.loads(payload) == {
+        "probability": [0.75],
+        "label": [1],
+        "accepted": [True],
+    }
+
+
+def test_bad_requests():
+    server = _server(RecordingModel())
+
+    async def run():
+        return [
+            await server._route("GET", "/predict", b""),
+            await server._route("POST", "/unknown", b""),
+            await server._route("POST", "/predict", b"not json"),
+            await server._route("POST", "/predict", _body([{"a": 1}])),
+        ]
+
+    assert [status for status, _ in asyncio.run(run())] == [405, 404, 400, 400]
@@ -0,0 +1,31 @@
+import json
+import os
+
+from modules import training
+from modules.synthetic import write_screening_csv
+
+
+def _run(config, source_path):
+    pipeline = training.build_pipeline(config)
+    return pipeline.run(
+        pipeline.source_fingerprint(source_path), {"source_path": source_path}
+    )
+
+
+def test_cached_split_fits_with_current_hyper_parameter(config, tmp_path, monkeypatch):
+    # mlflow 기록과 후처리는 이 테스트와 무관
+    monkeypatch.setattr(training, "log_stage", lambda state: {})
+    monkeypatch.setattr(training, "postprocess_stage", lambda state: {})
+    config["pipeline"]["use_cache"] = "true"
+    config["hyper_parameter"]["n_estimators"] = 5
+    config["threshold"]["n_bootstrap"] = 5
+    source_path = str(tmp_path / "data.csv")
+    write_screening_csv(source_path, 3000, 0)
+
+    _run(config, source_path)
+    config["hyper_parameter"]["max_depth"] = 3
+    state = _run(config, source_path)
+
+    assert state["model"].h_param["max_depth"] == 3
+    with open(os.path.join(state["model_path"], "metadata.json"), encoding="utf-8") as f:
+        assert json.load(f)["h_param"]["max_depth"] == 3
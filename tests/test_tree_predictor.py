@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+import xgboost as xgb
+
+from modules.ensemble import BoosterEnsemble
+from modules.tree_export import export_trees
+from modules.tree_predictor import NumpyTreePredictor
+
+FEATURE_NAMES = [f"f{index}" for index in range(6)]
+PARAMS = {"objective": "binary:logistic", "max_depth": 4, "nthread": 1}
+
+
+def _data(seed, n_rows=600):
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(n_rows, len(FEATURE_NAMES))).astype(np.float32)
+    # 약한 신호와 잡음 (early stopping 이 일찍 멈추도록)
+    logit = features[:, 0] - 0.5 * features[:, 1] + rng.normal(scale=2.0, size=n_rows)
+    target = (logit > 0).astype(np.int32)
+    # 결측치가 있어야 default 방향까지 검증됨
+    features[rng.random(features.shape) < 0.1] = np.nan
+    return features, target
+
+
+def _train(seed, **kwargs):
+    features, target = _data(seed)
+    return xgb.train(PARAMS, xgb.DMatrix(features, label=target), **kwargs)
+
+
+def _xgb_margin(booster, features, best_iteration=None):
+    iteration_range = (0, 0) if best_iteration is None else (0, best_iteration + 1)
+    return booster.predict(
+        xgb.DMatrix(features), output_margin=True, iteration_range=iteration_range
+    )
+
+
+def _export(tmp_path, model, best_iteration=None):
+    path = str(tmp_path / "trees.npz")
+    export_trees(model, path, FEATURE_NAMES, 0.5, best_iteration)
+    return NumpyTreePredictor.load(path)
+
+
+@pytest.fixture
+def inputs():
+    features, _ = _data(99, 300)
+    # 모든 값이 결측인 행
+    features[0] = np.nan
+    return features
+
+
+def test_single_model_margin_matches_xgboost(tmp_path, inputs):
+    booster = _train(0, num_boost_round=20)
+    predictor = _export(tmp_path, booster)
+
+    np.testing.assert_allclose(
+        predictor.predict_margin(inputs)[:, 0], _xgb_margin(booster, inputs), atol=1e-5
+    )
+
+
+def test_early_stopped_model_margin_matches_xgboost(tmp_path, inputs):
+    train_features, train_target = _data(0)
+    valid_features, valid_target = _data(1)
+    dvalid = xgb.DMatrix(valid_features, label=valid_target)
+    booster = xgb.train(
+        PARAMS,
+        xgb.DMatrix(train_features, label=train_target),
+        num_boost_round=200,
+        evals=[(dvalid, "valid")],
+        early_stopping_rounds=3,
+        verbose_eval=False,
+    )
+    assert booster.best_iteration + 1 < booster.num_boosted_rounds()
+    predictor = _export(tmp_path, booster, booster.best_iteration)
+
+    np.testing.assert_allclose(
+        predictor.predict_margin(inputs)[:, 0],
+        _xgb_margin(booster, inputs, booster.best_iteration),
+        atol=1e-5,
+    )
+
+
+def test_ensemble_margin_and_proba_match_xgboost(tmp_path, inputs):
+    boosters = [_train(seed, num_boost_round=15) for seed in range(3)]
+    ensemble = BoosterEnsemble(boosters, [None, 7, 11])
+    predictor = _export(tmp_path, ensemble)
+
+    margin = predictor.predict_margin(inputs)
+    assert margin.shape == (len(inputs), 3)
+    for bag, booster in enumerate(boosters):
+        np.testing.assert_allclose(
+            margin[:, bag],
+            _xgb_margin(booster, inputs, ensemble.best_iterations[bag]),
+            atol=1e-5,
+        )
+    np.testing.assert_allclose(
+        predictor.predict_proba(inputs), ensemble.inplace_predict(inputs), atol=1e-6
+    )